@@ -1,11 +1,29 @@
 # accounts/admin.py
 from django.contrib import admin
-from .models import LoginLog
+from .models import LoginDailySummary, LoginLog
 
 @admin.register(LoginLog)
 class LoginLogAdmin(admin.ModelAdmin):
+    # Nur Rohdaten der Retention-Periode – Auswertung über die Tagesübersicht
+    # (date_hierarchy/list_filter würden hier die ganze Tabelle scannen)
     list_display = ['user', 'login_time', 'ip_address']
-    list_filter = ['login_time']
     search_fields = ['user__email']
     readonly_fields = ['user', 'login_time', 'ip_address', 'user_agent']
-    date_hierarchy = 'login_time'
\ No newline at end of file
+    list_select_related = ['user']
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Nur die Spalten der Liste – user_agent wird erst in der Detailansicht geladen
+        return super().get_queryset(request).only(
+            'login_time', 'ip_address', 'user__username', 'user__email'
+        )
+
+
+@admin.register(LoginDailySummary)
+class LoginDailySummaryAdmin(admin.ModelAdmin):
+    list_display = ['day', 'user', 'ip_address', 'login_count', 'first_login', 'last_login']
+    search_fields = ['user__email', 'ip_address']
+    date_hierarchy = 'day'
+    list_select_related = ['user']
+    show_full_result_count = False
+    readonly_fields = ['day', 'user', 'ip_address', 'login_count', 'first_login', 'last_login']
@@ -0,0 +1,10 @@
+import time
+
+
+def guest_timer(request):
+    # Ablauf prüft GuestTimerMiddleware – hier nur der Countdown.
+    # Callable: Django ruft es erst auf, wenn ein Template {{ guest_remaining }} nutzt
+    expires_at = getattr(request, "guest_expires_at", None)
+    if expires_at is None:
+        return {}
+    return {"guest_remaining": lambda: max(0, int(expires_at - time.time()))}
@@ -0,0 +1,147 @@
+"""
+Gepufferter Login-Log
+Der Login-Request hängt nur einen Eintrag an eine Liste im Prozess –
+geschrieben wird per bulk_create im Hintergrund: sobald max_size
+Einträge warten, spätestens nach max_age Sekunden und beim Beenden
+des Workers (atexit).
+"""
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import DatabaseError, IntegrityError, connection
+
+from .models import LoginLog
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoginLogBuffer:
+    """
+    Thread-sicherer Puffer für LoginLog-Einträge (einer pro Prozess)
+
+    Usage:
+        buffer.add(LoginLog(user=user, ip_address=..., user_agent=...))
+    """
+
+    def __init__(self, max_size=100, max_age=5.0, background=True):
+        """
+        Args:
+            max_size: Ab so vielen Einträgen wird sofort geschrieben
+            max_age: Spätestens nach so vielen Sekunden wird geschrieben
+            background: False → Flush direkt im aufrufenden Thread
+                        (Tests, Management-Commands)
+        """
+        self.max_size = max_size
+        self.max_age = max_age
+        self.background = background
+
+        self._entries = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+            full = len(self._entries) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_age, self._flush_in_thread)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            if self.background:
+                threading.Thread(target=self._flush_in_thread, daemon=True).start()
+            else:
+                self.flush()
+
+    def flush(self):
+        """
+        Alle wartenden Einträge mit einem bulk_create schreiben
+
+        Returns:
+            int: Anzahl geschriebener Einträge
+        """
+        with self._lock:
+            entries, self._entries = self._entries, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not entries:
+            return 0
+        try:
+            return self._write(entries)
+        except IntegrityError:
+            # Meist ein User, der zwischen Login und Flush gelöscht wurde (FK) –
+            # nur dessen Einträge verwerfen, nicht den ganzen Batch
+            kept = self._without_deleted_users(entries)
+            logger.warning("LoginLog: %d Einträge gelöschter User verworfen", len(entries) - len(kept))
+        except DatabaseError:
+            logger.exception("LoginLog: %d Einträge verworfen", len(entries))
+            return 0
+
+        try:
+            return self._write(kept)
+        except DatabaseError:
+            logger.exception("LoginLog: %d Einträge verworfen", len(kept))
+            return 0
+
+    def _write(self, entries):
+        LoginLog.objects.bulk_create(entries, batch_size=self.max_size)
+        return len(entries)
+
+    @staticmethod
+    def _without_deleted_users(entries):
+        existing = set(
+            User.objects.filter(pk__in={entry.user_id for entry in entries})
+            .values_list("pk", flat=True)
+        )
+        kept = [entry for entry in entries if entry.user_id in existing]
+        for entry in kept:
+            entry.pk = None  # vom fehlgeschlagenen Insert evtl. schon gesetzt
+        return kept
+
+    def _flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()  # Thread-eigene DB-Verbindung
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    """
+    Login-Puffer des Prozesses (lazy, Flush beim Beenden registriert)
+
+    Größe + Alter über settings:
+        LOGIN_LOG_BUFFER_SIZE, LOGIN_LOG_FLUSH_SECONDS
+    """
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = LoginLogBuffer(
+                    max_size=getattr(settings, "LOGIN_LOG_BUFFER_SIZE", 100),
+                    max_age=getattr(settings, "LOGIN_LOG_FLUSH_SECONDS", 5.0),
+                )
+                atexit.register(_buffer.flush)
+    return _buffer
+
+
+def record_login(user, ip_address, user_agent):
+    entry = LoginLog(user=user, ip_address=ip_address, user_agent=user_agent[:300])
+    if getattr(settings, "LOGIN_LOG_BUFFER_ENABLED", True):
+        get_buffer().add(entry)
+    else:
+        entry.save()
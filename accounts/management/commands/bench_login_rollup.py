@@ -0,0 +1,104 @@
+"""
+Benchmark: Admin-Changelist auf der LoginLog-Rohtabelle vs. Tagesübersicht
+
+Legt synthetische Logins über ein Jahr in einer Transaktion an, misst
+den Changelist-Aufruf vorher (Rohdaten mit date_hierarchy/list_filter)
+und nach rollup + prune – danach wird alles zurückgerollt.
+
+Usage:
+    python manage.py bench_login_rollup --rows 1000000
+"""
+
+import random
+import time
+from datetime import timedelta
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from accounts.models import LoginDailySummary, LoginLog
+from accounts.rollup import prune_logins, rollup_logins
+
+
+class Command(BaseCommand):
+    help = "Misst Admin-Latenz für LoginLog mit und ohne Rollups"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--retention-days", type=int, default=30)
+        parser.add_argument("--requests", type=int, default=10)
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        now = timezone.now()
+
+        with transaction.atomic(), override_settings(LOGIN_LOG_BUFFER_ENABLED=False):
+            users = User.objects.bulk_create(
+                User(username=f"bench{i}", email=f"bench{i}@example.com")
+                for i in range(options["users"])
+            )
+            # Jeder User loggt sich von zwei Adressen ein (z.B. Zuhause + Handy)
+            ips = {user.pk: (f"10.0.{i // 128}.{i % 128 * 2}", f"10.0.{i // 128}.{i % 128 * 2 + 1}")
+                   for i, user in enumerate(users)}
+
+            start = time.perf_counter()
+            LoginLog.objects.bulk_create(
+                (
+                    LoginLog(
+                        user=user,
+                        ip_address=rng.choice(ips[user.pk]),
+                        login_time=now - timedelta(seconds=rng.randrange(options["days"] * 86400)),
+                    )
+                    for user in (rng.choice(users) for _ in range(options["rows"]))
+                ),
+                batch_size=10_000,
+            )
+            self.stdout.write(f"{options['rows']} Logins angelegt ({time.perf_counter() - start:.1f}s)")
+
+            admin_user = User.objects.create_superuser("bench-admin", "admin@example.com", "pw")
+            client = Client(HTTP_HOST="localhost")
+            client.force_login(admin_user)
+
+            # Vorher: Rohdaten mit date_hierarchy + list_filter (alte Admin-Config)
+            raw_admin = admin.site._registry[LoginLog]
+            raw_admin.date_hierarchy, raw_admin.list_filter = "login_time", ["login_time"]
+            try:
+                legacy = self._measure(client, "/admin/accounts/loginlog/", options["requests"])
+            finally:
+                del raw_admin.date_hierarchy, raw_admin.list_filter
+
+            start = time.perf_counter()
+            summaries = rollup_logins()
+            deleted = prune_logins(options["retention_days"])
+            self.stdout.write(
+                f"Rollup: {summaries} Tagesübersichten, {deleted} Rohzeilen gelöscht "
+                f"({time.perf_counter() - start:.1f}s)"
+            )
+
+            raw = self._measure(client, "/admin/accounts/loginlog/", options["requests"])
+            rolled = self._measure(client, "/admin/accounts/logindailysummary/", options["requests"])
+
+            self.stdout.write(f"  Rohdaten (vorher, {options['rows']} Zeilen): {legacy:8.1f}ms pro Changelist")
+            self.stdout.write(f"  Rohdaten (nach Prune, {LoginLog.objects.count()} Zeilen): {raw:8.1f}ms")
+            self.stdout.write(
+                f"  Tagesübersicht ({LoginDailySummary.objects.count()} Zeilen): {rolled:8.1f}ms"
+            )
+            self.stdout.write(self.style.SUCCESS(f"Faktor: {legacy / rolled:.1f}x"))
+
+            transaction.set_rollback(True)
+
+    def _measure(self, client, url, count):
+        response = client.get(url)  # Warmup
+        if response.status_code != 200:
+            raise SystemExit(f"{url} → {response.status_code}")
+
+        start = time.perf_counter()
+        for _ in range(count):
+            client.get(url)
+        return (time.perf_counter() - start) * 1000 / count
@@ -0,0 +1,38 @@
+"""
+Abgelaufene und verwaiste anonyme Sessions löschen
+
+Ersetzt clearsessions: löscht in Batches und räumt bei cached_db
+auch den Session-Cache auf.
+
+Usage:
+    python manage.py cleanup_sessions                        # z.B. stündlicher Cronjob
+    python manage.py cleanup_sessions --anonymous-idle-hours 6
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from accounts.session_cleanup import prune_expired, prune_idle_anonymous
+
+
+class Command(BaseCommand):
+    help = "Löscht abgelaufene Sessions und lange ungenutzte anonyme Sessions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--anonymous-idle-hours",
+            type=float,
+            default=getattr(settings, "SESSION_ANONYMOUS_IDLE_HOURS", 2),
+            help="Anonyme Sessions löschen, die so lange nicht gespeichert wurden (0 = aus)",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        expired = prune_expired(options["batch_size"])
+        self.stdout.write(f"Sessions: {expired} abgelaufen gelöscht")
+
+        if options["anonymous_idle_hours"] > 0:
+            idle = prune_idle_anonymous(options["anonymous_idle_hours"], options["batch_size"])
+            self.stdout.write(f"Sessions: {idle} ungenutzte anonyme gelöscht")
+
+        self.stdout.write(self.style.SUCCESS("✅ Sessions aufgeräumt"))
@@ -0,0 +1,39 @@
+"""
+Login-Log verdichten (Tag × User × IP) und alte Rohzeilen löschen
+
+Usage:
+    python manage.py rollup_login_logs                    # z.B. täglicher Cronjob
+    python manage.py rollup_login_logs --retention-days 30
+    python manage.py rollup_login_logs --no-prune
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.rollup import prune_logins, rollup_logins
+
+
+class Command(BaseCommand):
+    help = "Verdichtet LoginLog zu Tagesübersichten und löscht alte Rohdaten"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=getattr(settings, "LOGIN_LOG_RETENTION_DAYS", 90),
+            help="Rohzeilen älter als so viele Tage löschen",
+        )
+        parser.add_argument("--no-prune", action="store_true", help="Nur verdichten, nichts löschen")
+
+    def handle(self, *args, **options):
+        if options["retention_days"] < 1:
+            raise CommandError("--retention-days muss mindestens 1 sein")
+
+        written = rollup_logins()
+        self.stdout.write(f"Login-Log: {written} Tagesübersichten geschrieben")
+
+        if not options["no_prune"]:
+            deleted = prune_logins(options["retention_days"])
+            self.stdout.write(f"Login-Log: {deleted} Rohzeilen gelöscht")
+
+        self.stdout.write(self.style.SUCCESS("✅ Rollup fertig"))
@@ -0,0 +1,45 @@
+"""
+Gast-Sitzungen ablaufen lassen
+Prüft einmal pro Request (vor der View), ob die Gast-Sitzung abgelaufen
+ist. Anonyme Requests ohne Session-Cookie steigen sofort aus – die
+Session wird dafür gar nicht erst geladen.
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth import logout
+
+
+class GuestTimerMiddleware:
+    """
+    Setzt request.guest_expires_at (Unix-Zeit) für aktive Gäste, sonst None.
+    Der Countdown im Template kommt aus accounts.context_processors.guest_timer.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.guest_expires_at = None
+
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            self.check_guest(request)
+
+        return self.get_response(request)
+
+    def check_guest(self, request):
+        if not (request.user.is_authenticated and request.session.get("is_guest")):
+            return
+
+        login_time = request.session.get("guest_login_time", 0)
+        expires_at = login_time + getattr(settings, "GUEST_SESSION_SECONDS", 120)
+
+        if time.time() >= expires_at:
+            # Sitzung abgelaufen!
+            logout(request)
+            messages.warning(request, "Sitzung abgelaufen: Sicherheits-Reset durchgeführt.")
+            return
+
+        request.guest_expires_at = expires_at
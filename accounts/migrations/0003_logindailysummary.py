@@ -0,0 +1,34 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_loginlog_login_time_default'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LoginDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('login_count', models.PositiveIntegerField()),
+                ('first_login', models.DateTimeField()),
+                ('last_login', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='login_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Login-Tagesübersicht',
+                'verbose_name_plural': 'Login-Tagesübersichten',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['day', 'user'], name='accounts_lo_day_151731_idx')],
+            },
+        ),
+    ]
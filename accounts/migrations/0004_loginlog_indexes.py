@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_logindailysummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loginlog',
+            index=models.Index(fields=['login_time', 'id'], name='loginlog_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loginlog',
+            index=models.Index(fields=['user', 'login_time'], name='loginlog_user_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loginlog',
+            index=models.Index(fields=['ip_address'], name='loginlog_ip_idx'),
+        ),
+    ]
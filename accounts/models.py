@@ -1,17 +1,43 @@
 # accounts/models.py
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 class LoginLog(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='login_logs')
-    login_time = models.DateTimeField(auto_now_add=True)
+    login_time = models.DateTimeField(default=timezone.now)  # Login-Zeit, nicht Flush-Zeit
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.CharField(max_length=300, blank=True)
 
     class Meta:
         ordering = ['-login_time']
+        indexes = [
+            # id: Admin sortiert nach (-login_time, -pk) – rückwärts lesbar, kein Sort
+            models.Index(fields=['login_time', 'id'], name='loginlog_time_idx'),
+            models.Index(fields=['user', 'login_time'], name='loginlog_user_time_idx'),  # Logins pro User
+            models.Index(fields=['ip_address'], name='loginlog_ip_idx'),
+        ]
         verbose_name = "Login-Log"
         verbose_name_plural = "Login-Logs"
 
     def __str__(self):
-        return f"{self.user.email} – {self.login_time.strftime('%d.%m.%Y %H:%M')}"
\ No newline at end of file
+        return f"{self.user.email} – {self.login_time.strftime('%d.%m.%Y %H:%M')}"
+
+
+class LoginDailySummary(models.Model):
+    """Logins pro Tag, User und IP – aus LoginLog verdichtet (rollup_login_logs)"""
+    day = models.DateField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='login_summaries')
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    login_count = models.PositiveIntegerField()
+    first_login = models.DateTimeField()
+    last_login = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-day']
+        indexes = [models.Index(fields=['day', 'user'])]
+        verbose_name = "Login-Tagesübersicht"
+        verbose_name_plural = "Login-Tagesübersichten"
+
+    def __str__(self):
+        return f"{self.user.email} – {self.day.strftime('%d.%m.%Y')} ({self.login_count}×)"
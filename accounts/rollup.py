@@ -0,0 +1,88 @@
+"""
+Login-Log Rollups + Retention
+Rohdaten (LoginLog) werden pro Tag, User und IP zu LoginDailySummary
+verdichtet; Rohzeilen älter als LOGIN_LOG_RETENTION_DAYS werden gelöscht.
+Der Admin liest die Tagesübersicht – die Rohtabelle bleibt klein.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Min
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import LoginDailySummary, LoginLog
+
+
+def start_of_day(day):
+    """Mitternacht (lokale Zeitzone) als aware datetime"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def rollup_logins(until=None):
+    """
+    Verdichte alle abgeschlossenen Tage seit der letzten Übersicht
+
+    Der letzte bereits verdichtete Tag wird neu berechnet (Logins, die
+    erst nach dem letzten Lauf geschrieben wurden) – mehrfaches Laufen
+    ist also unkritisch.
+
+    Args:
+        until: date, exklusiv (Default: heute → nur abgeschlossene Tage)
+
+    Returns:
+        int: Anzahl geschriebener Übersichts-Zeilen
+    """
+    until = until or timezone.localdate()
+    last_day = LoginDailySummary.objects.aggregate(day=Max('day'))['day']
+
+    raw = LoginLog.objects.filter(login_time__lt=start_of_day(until))
+    if last_day is not None:
+        raw = raw.filter(login_time__gte=start_of_day(last_day))
+
+    rows = (
+        raw.annotate(day=TruncDate('login_time'))
+        .order_by()
+        .values('day', 'user_id', 'ip_address')
+        .annotate(
+            login_count=Count('id'),
+            first_login=Min('login_time'),
+            last_login=Max('login_time'),
+        )
+    )
+
+    with transaction.atomic():
+        if last_day is not None:
+            LoginDailySummary.objects.filter(day__gte=last_day, day__lt=until).delete()
+        summaries = LoginDailySummary.objects.bulk_create(
+            (LoginDailySummary(**row) for row in rows.iterator()),
+            batch_size=1000,
+        )
+    return len(summaries)
+
+
+def prune_logins(retention_days=None, until=None):
+    """
+    Lösche Rohzeilen älter als retention_days – aber nur aus Tagen,
+    die schon verdichtet sind
+
+    Returns:
+        int: Anzahl gelöschter LoginLog-Zeilen
+    """
+    if retention_days is None:
+        retention_days = getattr(settings, 'LOGIN_LOG_RETENTION_DAYS', 90)
+    if retention_days < 1:
+        raise ValueError("retention_days muss mindestens 1 sein")
+
+    until = until or timezone.localdate()
+    cutoff = until - timedelta(days=retention_days)
+
+    last_day = LoginDailySummary.objects.aggregate(day=Max('day'))['day']
+    if last_day is None:
+        return 0
+    cutoff = min(cutoff, last_day)
+
+    deleted, _ = LoginLog.objects.filter(login_time__lt=start_of_day(cutoff)).delete()
+    return deleted
@@ -0,0 +1,75 @@
+"""
+Alte Sessions aufräumen
+Abgelaufene Sessions und anonyme Sessions (RPS-Spiel, Icon-Challenge),
+die seit Stunden nicht mehr geschrieben wurden – in Batches, damit kein
+einzelnes DELETE die Session-Tabelle lange sperrt. Bei cached_db werden
+die Einträge auch aus dem Session-Cache entfernt.
+"""
+
+from datetime import timedelta
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.utils import timezone
+
+
+def _session_store():
+    return import_module(settings.SESSION_ENGINE).SessionStore
+
+
+def delete_sessions(session_keys):
+    """Sessions aus DB (und ggf. Session-Cache) löschen"""
+    Session.objects.filter(session_key__in=session_keys).delete()
+
+    prefix = getattr(_session_store(), "cache_key_prefix", None)
+    if prefix is not None:
+        caches[settings.SESSION_CACHE_ALIAS].delete_many([prefix + key for key in session_keys])
+
+
+def prune_expired(batch_size=1000):
+    """
+    Returns:
+        int: Anzahl gelöschter Sessions
+    """
+    deleted = 0
+    while True:
+        keys = list(
+            Session.objects.filter(expire_date__lt=timezone.now())
+            .values_list("session_key", flat=True)[:batch_size]
+        )
+        if not keys:
+            return deleted
+        delete_sessions(keys)
+        deleted += len(keys)
+
+
+def prune_idle_anonymous(idle_hours, batch_size=1000):
+    """
+    Lösche Sessions ohne eingeloggten User, die seit idle_hours nicht
+    mehr gespeichert wurden (expire_date = letzter Save + SESSION_COOKIE_AGE)
+
+    Returns:
+        int: Anzahl gelöschter Sessions
+    """
+    last_write_before = timezone.now() - timedelta(hours=idle_hours)
+    cutoff = last_write_before + timedelta(seconds=settings.SESSION_COOKIE_AGE)
+    store = _session_store()()
+
+    candidates = (
+        Session.objects.filter(expire_date__lt=cutoff)
+        .values_list("session_key", "session_data")
+        .iterator(chunk_size=batch_size)
+    )
+
+    # Erst sammeln, dann löschen – nicht während des offenen SELECT
+    stale = [
+        session_key
+        for session_key, session_data in candidates
+        if SESSION_KEY not in store.decode(session_data)
+    ]
+    for start in range(0, len(stale), batch_size):
+        delete_sessions(stale[start:start + batch_size])
+    return len(stale)
@@ -1,12 +1,13 @@
 # accounts/signals.py
 from django.contrib.auth.signals import user_logged_in
 from django.dispatch import receiver
-from .models import LoginLog
+from .login_log import record_login
 
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
-    LoginLog.objects.create(
+    # Kein INSERT im Login-Request – gepuffert, siehe login_log.py
+    record_login(
         user=user,
         ip_address=request.META.get('REMOTE_ADDR'),
-        user_agent=request.META.get('HTTP_USER_AGENT', '')[:300]
-    )
\ No newline at end of file
+        user_agent=request.META.get('HTTP_USER_AGENT', ''),
+    )
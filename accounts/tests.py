@@ -1,3 +1,230 @@
-from django.test import TestCase
+import time
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.contrib.auth.signals import user_logged_in
+from django.db import connection, transaction
+from django.contrib import admin
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .login_log import LoginLogBuffer
+from .models import LoginDailySummary, LoginLog
+from .rollup import prune_logins, rollup_logins, start_of_day
+from .session_cleanup import prune_expired, prune_idle_anonymous
+
+
+class LoginLogBufferTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('anna', password='pw')
+        self.request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.1', HTTP_USER_AGENT='pytest')
+
+    def login(self):
+        user_logged_in.send(sender=User, request=self.request, user=self.user)
+
+    def test_login_request_does_not_insert(self):
+        buffer = LoginLogBuffer(max_size=100, max_age=60)
+        with mock.patch('accounts.login_log._buffer', buffer):
+            with CaptureQueriesContext(connection) as ctx:
+                self.login()
+            self.assertFalse(any('accounts_loginlog' in q['sql'] for q in ctx.captured_queries))
+            self.assertEqual(len(buffer), 1)
+
+            flushed_at = timezone.now()
+            self.assertEqual(buffer.flush(), 1)
+
+        log = LoginLog.objects.get()
+        self.assertEqual(log.ip_address, '10.0.0.1')
+        self.assertEqual(log.user_agent, 'pytest')
+        self.assertLessEqual(log.login_time, flushed_at)  # Login-Zeit, nicht Flush-Zeit
+
+    def test_thousand_logins_bounded_inserts(self):
+        buffer = LoginLogBuffer(max_size=100, max_age=60, background=False)
+        with mock.patch('accounts.login_log._buffer', buffer):
+            with CaptureQueriesContext(connection) as ctx:
+                for _ in range(1000):
+                    self.login()
+                buffer.flush()
+
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT INTO "accounts_loginlog"')]
+        self.assertLessEqual(len(inserts), 10)
+        self.assertEqual(LoginLog.objects.count(), 1000)
+
+
+class LoginLogBufferDeletedUserTests(TransactionTestCase):
+    # Ohne umschließende Test-Transaktion – der FK-Fehler kommt erst beim Commit
+
+    def test_deleted_user_drops_only_its_entries(self):
+        anna = User.objects.create_user('anna', password='pw')
+        ben = User.objects.create_user('ben', password='pw')
+        buffer = LoginLogBuffer(max_size=100, max_age=60, background=False)
+        buffer.add(LoginLog(user=anna, ip_address='10.0.0.1'))
+        buffer.add(LoginLog(user=ben, ip_address='10.0.0.2'))
+        buffer.add(LoginLog(user=anna, ip_address='10.0.0.3'))
+
+        User.objects.filter(pk=ben.pk).delete()  # zwischen Login und Flush
+        self.assertEqual(buffer.flush(), 2)
+
+        self.assertEqual(
+            sorted(LoginLog.objects.values_list('ip_address', flat=True)),
+            ['10.0.0.1', '10.0.0.3'],
+        )
+
+
+class LoginRollupTests(TestCase):
+    def setUp(self):
+        self.anna = User.objects.create_user('anna', password='pw')
+        self.ben = User.objects.create_user('ben', password='pw')
+        self.today = date(2026, 3, 10)
+
+    def log(self, user, days_ago, ip='10.0.0.1', hour=12):
+        login_time = start_of_day(self.today - timedelta(days=days_ago)) + timedelta(hours=hour)
+        LoginLog.objects.create(user=user, ip_address=ip, login_time=login_time)
+
+    def test_rollup_per_day_user_and_ip(self):
+        self.log(self.anna, 1, hour=8)
+        self.log(self.anna, 1, hour=20)
+        self.log(self.anna, 1, ip='10.0.0.2')
+        self.log(self.ben, 2)
+        self.log(self.ben, 0)  # heute – noch nicht abgeschlossen
+
+        self.assertEqual(rollup_logins(until=self.today), 3)
+
+        summary = LoginDailySummary.objects.get(user=self.anna, ip_address='10.0.0.1')
+        self.assertEqual(summary.day, self.today - timedelta(days=1))
+        self.assertEqual(summary.login_count, 2)
+        self.assertLess(summary.first_login, summary.last_login)
+
+    def test_rerun_recomputes_last_day_without_duplicates(self):
+        self.log(self.anna, 2)
+        self.log(self.anna, 1)
+        rollup_logins(until=self.today)
+        self.log(self.anna, 1, hour=23)  # kam nach dem ersten Lauf
+        rollup_logins(until=self.today)
+
+        counts = dict(LoginDailySummary.objects.values_list('day', 'login_count'))
+        self.assertEqual(counts, {
+            self.today - timedelta(days=2): 1,
+            self.today - timedelta(days=1): 2,
+        })
+
+    def test_prune_only_old_rolled_up_rows(self):
+        self.log(self.anna, 40)
+        self.log(self.anna, 5)
+        self.assertEqual(prune_logins(30, until=self.today), 0)  # noch nicht verdichtet
+
+        rollup_logins(until=self.today)
+        self.assertEqual(prune_logins(30, until=self.today), 1)
+        self.assertEqual(LoginLog.objects.count(), 1)
+        self.assertEqual(LoginDailySummary.objects.count(), 2)
+
+
+class LoginLogQueryPlanTests(TestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        LoginLog.objects.bulk_create(LoginLog(user=self.admin_user) for _ in range(50))
+
+    def changelist_queryset(self):
+        request = RequestFactory().get('/admin/accounts/loginlog/')
+        request.user = self.admin_user
+        model_admin = admin.site._registry[LoginLog]
+        return model_admin.get_changelist_instance(request).get_queryset(request)
+
+    def changelist_plan(self):
+        queryset = self.changelist_queryset()
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Bei 50 Zeilen wäre ein Seq Scan billiger – erzwinge Index-Wahl
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset[:100].explain()
+
+    def test_changelist_sorted_by_index(self):
+        plan = self.changelist_plan()
+
+        if connection.vendor == 'sqlite':
+            self.assertIn('loginlog_time_idx', plan)
+            self.assertNotIn('TEMP B-TREE', plan)
+        elif connection.vendor == 'postgresql':
+            self.assertIn('Index Scan', plan)
+            self.assertIn('loginlog_time_idx', plan)
+            self.assertNotIn('Sort', plan)
+        else:
+            self.skipTest('Query-Plan nur für SQLite/Postgres geprüft')
+
+    def test_changelist_does_not_load_user_agent(self):
+        queryset = self.changelist_queryset()
+
+        self.assertNotIn('user_agent', str(queryset.query))
+        self.assertIn('auth_user', str(queryset.query))
+
+
+@override_settings(LOGIN_LOG_BUFFER_ENABLED=False)
+class GuestTimerTests(TestCase):
+    def setUp(self):
+        self.guest = User.objects.create_user('guest', password='pw')
+
+    def login_guest(self, seconds_ago):
+        self.client.force_login(self.guest)
+        session = self.client.session
+        session['is_guest'] = True
+        session['guest_login_time'] = time.time() - seconds_ago
+        session.save()
+
+    def test_anonymous_partial_does_not_touch_session(self):
+        response = self.client.get('/current-project/updates/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.wsgi_request.session.accessed)
+        self.assertNotIn('guest_remaining', response.context)
+
+    def test_active_guest_sees_countdown(self):
+        self.login_guest(seconds_ago=30)
+        response = self.client.get('/contact/')
+
+        self.assertContains(response, 'Auto-Purge')
+        self.assertIn(response.context['guest_remaining'](), (89, 90))
+
+    def test_expired_guest_is_logged_out_before_view(self):
+        self.login_guest(seconds_ago=500)
+        response = self.client.get('/projects/secret-lab/')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/accounts/login/', response['Location'])
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+
+class SessionCleanupTests(TestCase):
+    def make_session(self, last_write_hours_ago, **data):
+        session = SessionStore()
+        session.update(data)
+        session.create()
+        Session.objects.filter(session_key=session.session_key).update(
+            expire_date=timezone.now() + timedelta(days=1) - timedelta(hours=last_write_hours_ago)
+        )
+        return session.session_key
+
+    def test_prune_expired(self):
+        expired = self.make_session(48)
+        active = self.make_session(1)
+
+        self.assertEqual(prune_expired(batch_size=1), 1)
+        self.assertFalse(Session.objects.filter(session_key=expired).exists())
+        self.assertTrue(Session.objects.filter(session_key=active).exists())
+
+    def test_prune_idle_anonymous_keeps_logged_in_users(self):
+        idle_game = self.make_session(5, user_score=3)
+        idle_user = self.make_session(5, **{SESSION_KEY: '1'})
+        fresh_game = self.make_session(0, user_score=1)
+
+        self.assertEqual(prune_idle_anonymous(idle_hours=2), 1)
+        self.assertEqual(
+            set(Session.objects.values_list('session_key', flat=True)),
+            {idle_user, fresh_game},
+        )
+        self.assertFalse(Session.objects.filter(session_key=idle_game).exists())
@@ -0,0 +1,118 @@
+"""
+Circuit Breaker für Gemini
+Zustand + Latenz-Histogramm liegen im Cache, damit alle Worker
+denselben Breaker sehen.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Obergrenzen der Histogramm-Buckets in Sekunden
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, float("inf"))
+
+
+class CircuitBreaker:
+    """
+    closed → (N Fehler/zu langsame Calls in Folge) → open
+    open → (recovery_timeout vorbei) → half_open: genau ein Probe-Call
+    half_open → Erfolg: closed / Fehler: wieder open
+    """
+
+    def __init__(self, name, failure_threshold=5, recovery_timeout=30,
+                 slow_call_seconds=5, cache_alias="default"):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.cache_alias = cache_alias
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _key(self, suffix):
+        return f"breaker:{self.name}:{suffix}"
+
+    def state(self):
+        opened_at = self.cache.get(self._key("opened_at"))
+        if opened_at is None:
+            return CLOSED
+        if time.time() - opened_at < self.recovery_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    def allow_request(self):
+        """
+        Darf Gemini gerufen werden?
+
+        Im half_open-Zustand bekommt nur ein Worker den Probe-Call
+        (cache.add ist atomar), alle anderen nutzen den Fallback.
+        Hängt der Probe-Call, wird der Slot nach
+        max(recovery_timeout, slow_call_seconds) wieder frei.
+        """
+        state = self.state()
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        return self.cache.add(self._key("probe"), 1, max(self.recovery_timeout, self.slow_call_seconds))
+
+    def record_success(self, latency):
+        self._observe(latency)
+        if latency >= self.slow_call_seconds:
+            # Zu langsam zählt wie ein Fehler
+            self._register_failure()
+            return
+
+        self.cache.delete_many([self._key("failures"), self._key("opened_at"), self._key("probe")])
+
+    def record_failure(self, latency):
+        self._observe(latency)
+        self._register_failure()
+
+    def _register_failure(self):
+        failures_key = self._key("failures")
+        self.cache.add(failures_key, 0, None)
+        failures = self.cache.incr(failures_key)
+
+        if failures >= self.failure_threshold or self.state() == HALF_OPEN:
+            self.cache.set(self._key("opened_at"), time.time(), None)
+            self.cache.delete(self._key("probe"))
+
+    def _observe(self, latency):
+        bucket = next(limit for limit in LATENCY_BUCKETS if latency <= limit)
+        key = self._key(f"latency:{bucket}")
+        self.cache.add(key, 0, None)
+        self.cache.incr(key)
+
+    def reset(self):
+        keys = ["failures", "opened_at", "probe"] + [f"latency:{b}" for b in LATENCY_BUCKETS]
+        self.cache.delete_many([self._key(k) for k in keys])
+
+    def stats(self):
+        latency_keys = {self._key(f"latency:{b}"): b for b in LATENCY_BUCKETS}
+        counts = self.cache.get_many(list(latency_keys))
+        return {
+            "state": self.state(),
+            "failures": self.cache.get(self._key("failures"), 0),
+            "latency_histogram": {
+                ("+Inf" if b == float("inf") else f"<={b}s"): counts.get(key, 0)
+                for key, b in latency_keys.items()
+            },
+        }
+
+
+gemini_breaker = CircuitBreaker(
+    "gemini",
+    failure_threshold=getattr(settings, "GEMINI_BREAKER_FAILURES", 5),
+    recovery_timeout=getattr(settings, "GEMINI_BREAKER_RECOVERY", 30),
+    slow_call_seconds=getattr(settings, "GEMINI_SLOW_CALL_SECONDS", 5),
+    cache_alias=getattr(settings, "GEMINI_BREAKER_CACHE", "default"),
+)
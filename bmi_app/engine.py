@@ -0,0 +1,143 @@
+"""
+BMI-Engine für Batches (NumPy)
+Berechnet BMI, Kategorie und Farbe für viele Zeilen auf einmal –
+z.B. für Kohorten-CSVs mit tausenden Einträgen.
+"""
+
+import codecs
+import csv
+from itertools import islice
+
+import numpy as np
+
+
+# Untergrenzen der Kategorien 2-4 (gleich wie classify_bmi in views.py)
+THRESHOLDS = np.array([18.5, 25.0, 30.0])
+
+INVALID = "ungültig"
+
+# Letzter Eintrag = ungültige Zeile (BMI NaN)
+CATEGORIES = np.array(["Untergewicht", "Normalgewicht", "Übergewicht", "Adipositas", INVALID])
+COLORS = np.array(["#f39c12", "#27ae60", "#e67e22", "#e74c3c", ""])
+
+OUTPUT_FIELDS = ["bmi", "category", "color"]
+
+# Ersatzzeichen für nicht dekodierbare Bytes (errors="replace")
+REPLACEMENT = "\ufffd"
+
+
+def compute_bmi(weights, heights):
+    """
+    BMI für ganze Arrays (kg + cm, 1 Nachkommastelle)
+
+    Ungültige Werte (leer, <= 0) ergeben NaN.
+    """
+    weights = np.asarray(weights, dtype=float)
+    heights = np.asarray(heights, dtype=float) / 100
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bmi = np.round(weights / heights**2, 1)
+
+    bmi[(weights <= 0) | (heights <= 0)] = np.nan
+    return bmi
+
+
+def classify_batch(bmi):
+    """
+    Returns:
+        tuple: (Kategorien, Farben) als Arrays, NaN → INVALID / ""
+    """
+    bmi = np.asarray(bmi, dtype=float)
+    # side="right": 18.5 ist schon Normalgewicht, 25.0 schon Übergewicht
+    index = np.searchsorted(THRESHOLDS, bmi, side="right")
+    index[np.isnan(bmi)] = len(CATEGORIES) - 1
+    return CATEGORIES[index], COLORS[index]
+
+
+def _to_float(value):
+    """Zahl aus CSV-Feld ("95,5" erlaubt) – leer, Text, inf/nan → NaN"""
+    try:
+        number = float(value.replace(",", "."))
+    except (AttributeError, ValueError):
+        return np.nan
+    return number if np.isfinite(number) else np.nan
+
+
+def score_rows(rows):
+    """
+    Ergänzt eine Liste von CSV-Dicts um bmi, category und color
+    (Spalten "weight" in kg und "height" in cm)
+    """
+    weights = [np.nan if _has_bad_bytes(row) else _to_float(row.get("weight")) for row in rows]
+    heights = [_to_float(row.get("height")) for row in rows]
+
+    bmi = compute_bmi(weights, heights)
+    categories, colors = classify_batch(bmi)
+
+    for row, value, category, color in zip(rows, bmi, categories, colors):
+        row["bmi"] = "" if np.isnan(value) else f"{value:.1f}"
+        row["category"] = category
+        row["color"] = color
+    return rows
+
+
+def _has_bad_bytes(row):
+    """Zeile enthielt Bytes, die nicht zur Kodierung passen → ungültig"""
+    return any(isinstance(value, str) and REPLACEMENT in value for value in row.values())
+
+
+class _Echo:
+    """csv.writer-Ziel, das die Zeile direkt zurückgibt (für Streaming)"""
+
+    def write(self, value):
+        return value
+
+
+def stream_scored_csv(uploaded_file, chunk_rows=5000, encoding="utf-8-sig"):
+    """
+    Liest eine hochgeladene CSV zeilenweise und liefert die Ausgabe-CSV
+    in Stücken von chunk_rows Zeilen – die Datei liegt nie komplett im Speicher.
+    Falsch kodierte Bytes werden ersetzt, die Zeile als ungültig markiert
+    (ein Fehler mitten im Stream käme beim User nur als abgebrochener Download an).
+
+    Raises:
+        ValueError: Header ohne "weight"/"height"
+    """
+    lines = codecs.iterdecode(uploaded_file, encoding, errors="replace")
+    reader = csv.DictReader(lines)
+    fieldnames = reader.fieldnames or []
+    if "weight" not in fieldnames or "height" not in fieldnames:
+        raise ValueError("CSV braucht die Spalten 'weight' und 'height'")
+
+    writer = csv.DictWriter(
+        _Echo(),
+        fieldnames=fieldnames + [f for f in OUTPUT_FIELDS if f not in fieldnames],
+        extrasaction="ignore",
+    )
+    return _stream(reader, writer, chunk_rows)
+
+
+def _stream(reader, writer, chunk_rows):
+    yield writer.writeheader()
+    while True:
+        rows = []
+        try:
+            rows.extend(islice(reader, chunk_rows))
+        except csv.Error:
+            # Kaputte CSV-Struktur (z.B. Feld zu groß) – bis dahin gelesene
+            # Zeilen noch ausgeben, dann eine Fehlerzeile statt eines 500
+            if rows:
+                yield "".join(writer.writerow(row) for row in score_rows(rows))
+            yield writer.writerow(_error_row(writer.fieldnames, reader.line_num))
+            return
+        if not rows:
+            return
+        yield "".join(writer.writerow(row) for row in score_rows(rows))
+
+
+def _error_row(fieldnames, line_num):
+    """Letzte Zeile der Ausgabe, wenn die CSV nach line_num gelesenen Zeilen nicht lesbar ist"""
+    return {
+        fieldnames[0]: f"FEHLER: CSV nach Zeile {line_num} nicht lesbar",
+        "category": INVALID,
+    }
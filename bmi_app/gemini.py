@@ -0,0 +1,88 @@
+"""
+Gemini REST-Client für die BMI-Tipps
+"""
+
+import json
+
+import requests
+from decouple import config
+from django.conf import settings
+
+
+GEMINI_URL = "{base}/models/{model}:{method}"
+DEFAULT_MODEL = "gemini-2.0-flash-exp"
+MISSING_KEY_MESSAGE = "Gemini API-Key fehlt. Bitte in Render Environment Variables eintragen."
+
+
+class GeminiError(Exception):
+    """Gemini nicht erreichbar oder unerwartete Antwort"""
+
+
+def _timeout():
+    # (Connect, Read) – kurz halten, der Circuit Breaker übernimmt den Rest
+    return (3.05, getattr(settings, "GEMINI_TIMEOUT", 15))
+
+
+def _build_request(prompt, model, method):
+    api_key = config("GEMINI_API_KEY", default=None)
+
+    if not api_key:
+        raise GeminiError(MISSING_KEY_MESSAGE)
+
+    base = getattr(settings, "GEMINI_API_BASE", "https://generativelanguage.googleapis.com/v1beta")
+    url = GEMINI_URL.format(base=base.rstrip("/"), model=model, method=method)
+
+    headers = {"Content-Type": "application/json", "x-goog-api-key": api_key}
+
+    body = {"contents": [{"parts": [{"text": prompt}]}]}
+
+    return url, headers, body
+
+
+def generate(prompt: str, model: str = DEFAULT_MODEL) -> str:
+    """
+    Ruft Google Gemini API auf und gibt den Antwort-Text zurück
+
+    Raises:
+        GeminiError: API-Key fehlt, Timeout, HTTP-Fehler, kaputte Antwort
+    """
+    url, headers, body = _build_request(prompt, model, "generateContent")
+
+    try:
+        resp = requests.post(url, headers=headers, json=body, timeout=_timeout())
+        resp.raise_for_status()
+        data = resp.json()
+        return data["candidates"][0]["content"]["parts"][0]["text"]
+    except Exception as e:
+        raise GeminiError(str(e)) from e
+
+
+def stream_generate(prompt: str, model: str = DEFAULT_MODEL):
+    """
+    Streamt die Gemini-Antwort (streamGenerateContent, alt=sse)
+
+    Yields:
+        str: Text-Stücke in der Reihenfolge, in der Gemini sie liefert
+
+    Raises:
+        GeminiError: vor oder während des Streams
+    """
+    url, headers, body = _build_request(prompt, model, "streamGenerateContent")
+
+    try:
+        with requests.post(
+            url, headers=headers, json=body, params={"alt": "sse"}, stream=True, timeout=_timeout()
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = json.loads(line[len("data:"):])
+                for part in data["candidates"][0]["content"].get("parts", []):
+                    if part.get("text"):
+                        yield part["text"]
+    except GeminiError:
+        raise
+    except Exception as e:
+        raise GeminiError(str(e)) from e
+
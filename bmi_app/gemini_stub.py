@@ -0,0 +1,131 @@
+"""
+Lokaler Gemini-Stub (generateContent + streamGenerateContent)
+
+Usage:
+    python -m bmi_app.gemini_stub --port 8026 --delay 0.3
+    GEMINI_API_BASE=http://127.0.0.1:8026/v1beta python manage.py runserver
+
+Im Code:
+    with GeminiStubServer(chunks=["Tipp 1\\n", "Tipp 2"], delay=0.1) as stub:
+        ... settings.GEMINI_API_BASE = stub.base_url ...
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _response(text):
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+
+        with self.server.lock:
+            self.server.requests += 1
+
+        if self.server.status != 200:
+            time.sleep(self.server.delay)
+            return self._send_json(self.server.status, {"error": {"message": "Stub-Fehler"}})
+
+        if ":streamGenerateContent" in self.path:
+            return self._stream()
+
+        time.sleep(self.server.delay * len(self.server.chunks))
+        self._send_json(200, _response("".join(self.server.chunks)))
+
+    def _send_json(self, status, data):
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        for chunk in self.server.chunks:
+            time.sleep(self.server.delay)
+            self.wfile.write(f"data: {json.dumps(_response(chunk))}\r\n\r\n".encode())
+            self.wfile.flush()
+
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class GeminiStubServer:
+    """
+    Fake Gemini API
+
+    Args:
+        chunks: Text-Stücke der Antwort (Stream: ein Event pro Stück)
+        delay: Wartezeit in Sekunden pro Stück
+        status: HTTP-Status (z.B. 503 für Fehler-Tests)
+    """
+
+    def __init__(self, chunks=("Iss mehr Gemüse.\n", "Geh täglich spazieren."),
+                 delay=0.0, status=200, host="127.0.0.1", port=0):
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.chunks = list(chunks)
+        self.server.delay = delay
+        self.server.status = status
+        self.server.requests = 0
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1beta"
+
+    @property
+    def requests(self):
+        return self.server.requests
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lokaler Gemini-Stub")
+    parser.add_argument("--port", type=int, default=8026)
+    parser.add_argument("--delay", type=float, default=0.3)
+    args = parser.parse_args()
+
+    stub = GeminiStubServer(port=args.port, delay=args.delay)
+    print(f"Gemini-Stub läuft auf {stub.base_url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        stub.server.server_close()
@@ -0,0 +1,50 @@
+"""
+Benchmark: BMI pro Zeile (Python) vs. NumPy-Batch
+
+Usage:
+    python manage.py bench_bmi_batch --rows 100000
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from bmi_app.engine import classify_batch, compute_bmi
+from bmi_app.views import calculate_bmi, classify_bmi
+
+
+class Command(BaseCommand):
+    help = "Vergleicht BMI + Kategorie pro Zeile mit der vektorisierten Engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        weights = [round(rng.uniform(40, 150), 1) for _ in range(options["rows"])]
+        heights = [round(rng.uniform(140, 210), 1) for _ in range(options["rows"])]
+
+        def per_row():
+            for weight, height in zip(weights, heights):
+                classify_bmi(calculate_bmi(weight, height))
+
+        def batch():
+            classify_batch(compute_bmi(weights, heights))
+
+        per_row_ms = self._best(per_row, options["repeat"])
+        batch_ms = self._best(batch, options["repeat"])
+
+        self.stdout.write(f"Zeilen:     {options['rows']}")
+        self.stdout.write(f"pro Zeile:  {per_row_ms:.1f}ms")
+        self.stdout.write(f"NumPy:      {batch_ms:.1f}ms")
+        self.stdout.write(self.style.SUCCESS(f"Speedup:    {per_row_ms / batch_ms:.1f}x"))
+
+    def _best(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
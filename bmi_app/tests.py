@@ -1,3 +1,277 @@
-from django.test import TestCase
+import csv
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+import numpy as np
+
+from . import views
+from .breaker import OPEN, CircuitBreaker, gemini_breaker
+from .engine import classify_batch, compute_bmi
+from .gemini import GeminiError
+from .gemini_stub import GeminiStubServer
+from .tips import FALLBACK_TIPS, TipCache, age_band, bmi_band, tip_cache
+
+
+class TipBucketTests(TestCase):
+    def test_age_band(self):
+        self.assertEqual(age_band(35), '30-39')
+        self.assertEqual(age_band(16), '<18')
+        self.assertEqual(age_band(82), '70+')
+
+    def test_bmi_band(self):
+        self.assertEqual(bmi_band(24.3), '22.5-25.0')
+        self.assertEqual(bmi_band(25.0), '25.0-27.5')
+
+
+class TipCacheTests(TestCase):
+    def test_lru_eviction(self):
+        cache = TipCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+    def test_ttl_expiry(self):
+        cache = TipCache(ttl=-1)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+    def test_stats(self):
+        cache = TipCache()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('b')
+        self.assertEqual(cache.stats()['hit_rate'], 0.5)
+
+
+class GetInputCacheTests(TestCase):
+    def setUp(self):
+        tip_cache.clear()
+        gemini_breaker.reset()
+
+    def post(self, name, age, weight, height):
+        return self.client.post('/bmi/get_input/', {
+            'name': name, 'age': age, 'weight': weight, 'height': height,
+        })
+
+    @mock.patch('bmi_app.tips.generate', return_value='Mehr Gemüse!')
+    def test_similar_inputs_share_cached_tips(self, generate):
+        first = self.post('Anna', 34, 70, 175)
+        second = self.post('Ben', 36, 71, 176)
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertContains(first, 'Hallo Anna!')
+        self.assertContains(second, 'Hallo Ben!')
+        self.assertContains(second, 'Mehr Gemüse!')
+        self.assertEqual(tip_cache.stats()['hits'], 1)
+
+    @mock.patch('bmi_app.tips.generate', side_effect=GeminiError('Timeout'))
+    def test_errors_are_not_cached(self, generate):
+        self.post('Anna', 34, 70, 175)
+        self.post('Anna', 34, 70, 175)
+
+        self.assertEqual(generate.call_count, 2)
+
+
+class TipStreamTests(TestCase):
+    def setUp(self):
+        tip_cache.clear()
+        gemini_breaker.reset()
+
+    def test_bmi_is_rendered_without_waiting_for_gemini(self):
+        with GeminiStubServer(delay=1) as stub, override_settings(GEMINI_API_BASE=stub.base_url):
+            response = self.client.post('/bmi/get_input/stream/', {
+                'name': 'Anna', 'age': 34, 'weight': 70, 'height': 175,
+            })
+
+        self.assertContains(response, 'Dein BMI:</strong> 22.9')
+        self.assertContains(response, '/bmi/tips-stream/?age=34&bmi=22.9')
+        self.assertEqual(stub.requests, 0)
+
+    def test_stream_relays_chunks_as_events(self):
+        with GeminiStubServer(chunks=['Tipp 1\n', 'Tipp 2']) as stub, \
+                override_settings(GEMINI_API_BASE=stub.base_url):
+            response = self.client.get('/bmi/tips-stream/', {'age': 34, 'bmi': 22.9})
+            body = b''.join(response.streaming_content).decode()
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(
+            body,
+            'event: tip\ndata: Tipp 1<br>\n\n'
+            'event: tip\ndata: Tipp 2\n\n'
+            'event: done\ndata: \n\n',
+        )
+        self.assertEqual(tip_cache.stats()['size'], 1)
+
+    async def test_stream_under_asgi(self):
+        with GeminiStubServer(chunks=['A', 'B']) as stub, \
+                override_settings(GEMINI_API_BASE=stub.base_url):
+            response = await self.async_client.get('/bmi/tips-stream/', {'age': 34, 'bmi': 22.9})
+            body = ''.join([chunk.decode() async for chunk in response.streaming_content])
+
+        self.assertIn('data: A\n\n', body)
+        self.assertTrue(body.endswith('event: done\ndata: \n\n'))
+
+    def test_stream_rejects_non_finite_or_implausible_values(self):
+        for params in (
+            {'age': 'nan', 'bmi': 22},
+            {'age': 30, 'bmi': 'inf'},
+            {'age': 30, 'bmi': '-inf'},
+            {'age': -5, 'bmi': 22},
+            {'age': 30, 'bmi': 1000},
+        ):
+            with self.subTest(**params):
+                response = self.client.get('/bmi/tips-stream/', params)
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(response.streaming)
+
+
+# Login-Log direkt schreiben – kein Flush-Thread gegen die Test-DB
+@override_settings(LOGIN_LOG_BUFFER_ENABLED=False)
+class CircuitBreakerTests(TestCase):
+    def setUp(self):
+        tip_cache.clear()
+        gemini_breaker.reset()
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker('test', failure_threshold=2, slow_call_seconds=1)
+        breaker.reset()
+        breaker.record_success(2.0)
+        breaker.record_success(3.0)
+
+        self.assertEqual(breaker.state(), OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.stats()['latency_histogram']['<=5s'], 1)
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker('test', failure_threshold=1, recovery_timeout=0)
+        breaker.reset()
+        breaker.record_failure(0.1)
+
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        breaker.record_success(0.1)
+        self.assertTrue(breaker.allow_request())
+
+    def test_outage_opens_breaker_and_serves_fallback(self):
+        with GeminiStubServer(status=503) as stub, \
+                override_settings(GEMINI_API_BASE=stub.base_url):
+            for _ in range(gemini_breaker.failure_threshold + 2):
+                response = self.client.post('/bmi/get_input/', {
+                    'name': 'Anna', 'age': 34, 'weight': 70, 'height': 175,
+                })
+
+        self.assertEqual(stub.requests, gemini_breaker.failure_threshold)
+        self.assertContains(response, FALLBACK_TIPS['Normalgewicht'].splitlines()[0])
+        self.assertEqual(tip_cache.stats()['size'], 0)
+
+    def test_health_endpoint_is_staff_only(self):
+        self.assertEqual(self.client.get('/bmi/gemini-health/').status_code, 302)
+
+        User.objects.create_user('admin', password='pw', is_staff=True)
+        self.client.login(username='admin', password='pw')
+        data = self.client.get('/bmi/gemini-health/').json()
+
+        self.assertEqual(data['state'], 'closed')
+        self.assertIn('+Inf', data['latency_histogram'])
+
+
+class BatchEngineTests(TestCase):
+    def test_matches_per_row_classification(self):
+        bmi = np.array([12.0, 18.4, 18.5, 24.9, 25.0, 29.9, 30.0, 45.0])
+        categories, colors = classify_batch(bmi)
+
+        expected = [views.classify_bmi(value) for value in bmi]
+        self.assertEqual(list(zip(categories, colors)), expected)
+
+    def test_invalid_rows(self):
+        bmi = compute_bmi([70, np.nan, 70], [175, 175, 0])
+        categories, _ = classify_batch(bmi)
+
+        self.assertEqual(bmi[0], views.calculate_bmi(70, 175))
+        self.assertEqual(list(categories), ['Normalgewicht', 'ungültig', 'ungültig'])
+
+    @override_settings(BMI_BATCH_CHUNK_ROWS=2)
+    def test_csv_upload_is_streamed_in_chunks(self):
+        upload = SimpleUploadedFile('kohorte.csv', (
+            'id,weight,height\n'
+            '1,70,175\n'
+            '2,50,180\n'
+            '3,"95,5",170\n'
+            '4,abc,170\n'
+        ).encode(), content_type='text/csv')
+
+        response = self.client.post('/bmi/batch/', {'file': upload})
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(len(chunks), 3)  # Header + 2 Blöcke
+        self.assertEqual(''.join(chunks).splitlines(), [
+            'id,weight,height,bmi,category,color',
+            '1,70,175,22.9,Normalgewicht,#27ae60',
+            '2,50,180,15.4,Untergewicht,#f39c12',
+            '3,"95,5",170,33.0,Adipositas,#e74c3c',
+            '4,abc,170,,ungültig,',
+        ])
+
+    @override_settings(BMI_BATCH_CHUNK_ROWS=1)
+    def test_bad_byte_after_header_marks_row_invalid(self):
+        upload = SimpleUploadedFile('kohorte.csv', (
+            b'name,weight,height\n'
+            b'Anna,70,175\n'
+            b'J\xe4n,80,180\n'
+            b'Ben,60,170\n'
+        ))
+
+        response = self.client.post('/bmi/batch/', {'file': upload})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[2].endswith(',,ungültig,'))
+        self.assertEqual(lines[3], 'Ben,60,170,20.8,Normalgewicht,#27ae60')
+
+    def test_broken_csv_keeps_rows_before_error(self):
+        oversized = b'x' * (csv.field_size_limit() + 1)
+        upload = SimpleUploadedFile('kohorte.csv', (
+            b'name,weight,height\n'
+            b'Anna,70,175\n'
+            b'Ben,60,170\n'
+        ) + oversized + b',70,175\n')
+
+        response = self.client.post('/bmi/batch/', {'file': upload})
+        body = b''.join(response.streaming_content).decode()
+
+        self.assertEqual(body.splitlines(), [
+            'name,weight,height,bmi,category,color',
+            'Anna,70,175,22.9,Normalgewicht,#27ae60',
+            'Ben,60,170,20.8,Normalgewicht,#27ae60',
+            'FEHLER: CSV nach Zeile 3 nicht lesbar,,,,ungültig,',
+        ])
+
+    def test_non_finite_values_are_invalid(self):
+        upload = SimpleUploadedFile('kohorte.csv', (
+            b'name,weight,height\n'
+            b'Anna,inf,175\n'
+            b'Ben,70,nan\n'
+            b'Cem,1e400,175\n'
+        ))
+
+        response = self.client.post('/bmi/batch/', {'file': upload})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+
+        self.assertTrue(all(line.endswith(',,ungültig,') for line in lines[1:]))
+        self.assertEqual(len(lines), 4)
+
+    def test_csv_without_required_columns(self):
+        upload = SimpleUploadedFile('kohorte.csv', b'name,kg\nAnna,70\n')
+        response = self.client.post('/bmi/batch/', {'file': upload})
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,195 @@
+"""
+Gemini-Tipps mit Cache
+Eingaben werden in Buckets normalisiert (Altersband, BMI-Band, Kategorie),
+damit ähnliche Anfragen dieselben Tipps aus dem Cache bekommen.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .breaker import gemini_breaker
+from .gemini import GeminiError, generate, stream_generate
+
+
+# Regelbasierte Tipps, wenn Gemini langsam/offline ist (Breaker offen)
+FALLBACK_TIPS = {
+    "Untergewicht": (
+        "1. Iss regelmäßig 5-6 kleinere Mahlzeiten über den Tag verteilt.\n"
+        "2. Setze auf energiereiche, gesunde Lebensmittel: Nüsse, Avocado, Vollkornprodukte.\n"
+        "3. Baue Muskeln mit 2-3 Krafttrainings pro Woche auf.\n"
+        "4. Trinke kalorienhaltige Smoothies mit Milch, Haferflocken und Banane.\n"
+        "5. Lass die Ursache ärztlich abklären, wenn du ungewollt abnimmst."
+    ),
+    "Normalgewicht": (
+        "1. Halte deine ausgewogene Ernährung mit viel Gemüse und Eiweiß bei.\n"
+        "2. Bewege dich mindestens 150 Minuten pro Woche moderat.\n"
+        "3. Ergänze Ausdauer mit 2 Krafteinheiten pro Woche.\n"
+        "4. Trinke 1,5-2 Liter Wasser täglich.\n"
+        "5. Achte auf 7-8 Stunden Schlaf – er hält dein Gewicht stabil."
+    ),
+    "Übergewicht": (
+        "1. Reduziere zuckerhaltige Getränke und Snacks Schritt für Schritt.\n"
+        "2. Fülle die Hälfte deines Tellers mit Gemüse.\n"
+        "3. Starte mit täglichen 30 Minuten zügigem Gehen.\n"
+        "4. Ergänze 2 Krafteinheiten pro Woche für mehr Grundumsatz.\n"
+        "5. Setze dir kleine Ziele: 0,5 kg pro Woche sind nachhaltig."
+    ),
+    "Adipositas": (
+        "1. Hol dir ärztliche oder ernährungstherapeutische Begleitung.\n"
+        "2. Ersetze Fertiggerichte durch einfache, selbst gekochte Mahlzeiten.\n"
+        "3. Starte gelenkschonend: Schwimmen, Radfahren oder Walking.\n"
+        "4. Trinke Wasser statt Softdrinks und Säfte.\n"
+        "5. Feiere jeden Fortschritt – jedes Kilo weniger entlastet Herz und Gelenke."
+    ),
+}
+
+
+def age_band(age):
+    """35 → '30-39' (unter 18 und ab 70 jeweils ein Band)"""
+    age = int(age)
+    if age < 18:
+        return "<18"
+    if age >= 70:
+        return "70+"
+    start = age // 10 * 10
+    return f"{start}-{start + 9}"
+
+
+def bmi_band(bmi, width=2.5):
+    """24.3 → '22.5-25.0'"""
+    start = int(bmi // width) * width
+    return f"{start:.1f}-{start + width:.1f}"
+
+
+def bucket_key(age, bmi, category):
+    return (age_band(age), bmi_band(bmi), category)
+
+
+def build_prompt(key):
+    """Prompt nur aus Buckets – ohne Namen, damit er cachebar ist"""
+    ages, bmis, category = key
+    return (
+        f"Eine Person im Alter von {ages} Jahren hat einen BMI von {bmis} ({category}). "
+        "Gib 4-5 motivierende Gesundheitstipps mit Ernährung und Sport. "
+        "Sprich die Person mit 'du' an. Direkt mit Tipps beginnen, kein Hallo."
+    )
+
+
+class TipCache:
+    """
+    In-Process LRU-Cache mit TTL + Hit-Rate-Metriken
+    """
+
+    def __init__(self, max_entries=256, ttl=24 * 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+tip_cache = TipCache(
+    max_entries=getattr(settings, "BMI_TIPS_CACHE_SIZE", 256),
+    ttl=getattr(settings, "BMI_TIPS_CACHE_TTL", 24 * 3600),
+)
+
+
+def get_tips(age, bmi, category):
+    """
+    KI-Tipps für die Buckets dieser Eingaben (Cache → Gemini)
+
+    Ist Gemini gestört (Fehler oder Breaker offen), kommen sofort die
+    regelbasierten FALLBACK_TIPS. Fehler werden nicht gecacht.
+    """
+    key = bucket_key(age, bmi, category)
+    tips = tip_cache.get(key)
+    if tips is not None:
+        return tips
+
+    if not gemini_breaker.allow_request():
+        return FALLBACK_TIPS[category]
+
+    start = time.monotonic()
+    try:
+        tips = generate(build_prompt(key))
+    except GeminiError:
+        gemini_breaker.record_failure(time.monotonic() - start)
+        return FALLBACK_TIPS[category]
+
+    gemini_breaker.record_success(time.monotonic() - start)
+    tip_cache.set(key, tips)
+    return tips
+
+
+def stream_tips(age, bmi, category):
+    """
+    KI-Tipps als Text-Stücke (Cache-Hit: ein Stück, sonst Gemini-Stream)
+
+    Die komplette Antwort landet nach erfolgreichem Stream im Cache.
+    Für den Breaker zählt die Zeit bis zum ersten Stück.
+    """
+    key = bucket_key(age, bmi, category)
+    tips = tip_cache.get(key)
+    if tips is not None:
+        yield tips
+        return
+
+    if not gemini_breaker.allow_request():
+        yield FALLBACK_TIPS[category]
+        return
+
+    parts = []
+    start = time.monotonic()
+    latency = None
+    try:
+        for chunk in stream_generate(build_prompt(key)):
+            if latency is None:
+                latency = time.monotonic() - start  # Time-to-first-token
+            parts.append(chunk)
+            yield chunk
+    except GeminiError:
+        gemini_breaker.record_failure(time.monotonic() - start)
+        # Abgebrochener Stream: ehrlich sagen, sonst Fallback zeigen
+        yield "\n(Antwort unvollständig)" if parts else FALLBACK_TIPS[category]
+        return
+
+    gemini_breaker.record_success(latency if latency is not None else time.monotonic() - start)
+    tip_cache.set(key, "".join(parts))
@@ -6,4 +6,9 @@ app_name = 'bmi'  # ==> {% url 'bmi:calculator' %}
 urlpatterns = [
     path('', views.calculator, name='calculator'),  # /bmi/
     path('get_input/', views.get_input, name='get_input'),  # /bmi/get_input/
+    path('get_input/stream/', views.get_input_stream, name='get_input_stream'),  # /bmi/get_input/stream/
+    path('batch/', views.batch_upload, name='batch_upload'),  # CSV-Upload
+    path('tips-stream/', views.tips_stream, name='tips_stream'),  # SSE
+    path('tips-stats/', views.tips_stats, name='tips_stats'),  # /bmi/tips-stats/
+    path('gemini-health/', views.gemini_health, name='gemini_health'),  # /bmi/gemini-health/
 ]
\ No newline at end of file
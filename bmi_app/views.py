@@ -1,10 +1,21 @@
+from django.conf import settings
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.urls import reverse
+from django.utils.html import escape
+from django.utils.http import urlencode
+from asgiref.sync import sync_to_async
 from django.views.decorators.http import require_POST
+from django.contrib.admin.views.decorators import staff_member_required
 import json
-import requests
+import math
 from decouple import config
 
+from .breaker import gemini_breaker
+from .engine import stream_scored_csv
+from .tips import get_tips, stream_tips, tip_cache
+
 
 api_key = config("GEMINI_API_KEY")
 
@@ -14,6 +25,38 @@ def calculator(request):
     return render(request, "bmi/calculator.html")
 
 
+def calculate_bmi(weight, height):
+    """BMI aus kg + cm (1 Nachkommastelle)"""
+    return round(weight / ((height / 100) ** 2), 1)
+
+
+def classify_bmi(bmi):
+    """
+    Returns:
+        tuple: (Kategorie, Farbe)
+    """
+    if bmi < 18.5:
+        return "Untergewicht", "#f39c12"
+    elif bmi < 25:
+        return "Normalgewicht", "#27ae60"
+    elif bmi < 30:
+        return "Übergewicht", "#e67e22"
+    else:
+        return "Adipositas", "#e74c3c"
+
+
+@staff_member_required
+def tips_stats(request):
+    """Hit-Rate des Gemini-Tipp-Caches (nur Staff)"""
+    return JsonResponse(tip_cache.stats())
+
+
+@staff_member_required
+def gemini_health(request):
+    """Breaker-Zustand + Latenz-Histogramm der Gemini-Calls (nur Staff)"""
+    return JsonResponse(gemini_breaker.stats())
+
+
 @require_POST
 def get_input(request):
     try:
@@ -23,25 +66,13 @@ def get_input(request):
         weight = float(request.POST.get("weight", 70))
         height = float(request.POST.get("height", 170))
 
-        # BMI berechnen
-        bmi = round(weight / ((height / 100) ** 2), 1)
-
-        # Kategorie + Farbe
-        if bmi < 18.5:
-            category, color = "Untergewicht", "#f39c12"
-        elif bmi < 25:
-            category, color = "Normalgewicht", "#27ae60"
-        elif bmi < 30:
-            category, color = "Übergewicht", "#e67e22"
-        else:
-            category, color = "Adipositas", "#e74c3c"
-
-        # Gemini aufrufen
-        try:
-            prompt = f"{name} ist {int(age)} Jahre alt, wiegt {weight}kg, ist {height}cm groß und hat einen BMI von {bmi} ({category}). Gib 4-5 motivierende Gesundheitstipps mit Ernährung und Sport. Direkt mit Tipps beginnen, kein Hallo."
-            ai_tips = ask_gemini_rest(prompt)
-        except Exception as e:
-            ai_tips = f"Gemini nicht erreichbar: {str(e)}"
+        # BMI berechnen + Kategorie/Farbe
+        bmi = calculate_bmi(weight, height)
+        category, color = classify_bmi(bmi)
+
+        # KI-Tipps (gecacht pro Alters-/BMI-Band + Kategorie,
+        # persönlich ist nur die Begrüßung unten)
+        ai_tips = get_tips(age, bmi, category)
 
         # HTML zurückgeben
         ai_tips_html = ai_tips.replace("\n", "<br>")
@@ -66,6 +97,134 @@ def get_input(request):
         )
 
 
+@require_POST
+def get_input_stream(request):
+    """
+    HTMX: BMI sofort zurückgeben, KI-Tipps per Server-Sent Events nachladen
+    """
+    try:
+        name = request.POST.get("name", "Unbekannt")
+        age = float(request.POST.get("age", 30))
+        weight = float(request.POST.get("weight", 70))
+        height = float(request.POST.get("height", 170))
+
+        bmi = calculate_bmi(weight, height)
+        category, color = classify_bmi(bmi)
+    except Exception as e:
+        return HttpResponse(
+            f"<div style='color:red; padding:20px; background:#fee;'>Fehler: {str(e)}</div>"
+        )
+
+    stream_url = f"{reverse('bmi:tips_stream')}?{urlencode({'age': int(age), 'bmi': bmi})}"
+
+    html = f"""
+    <div style="padding:30px; background:{color}20; border-left:6px solid {color}; border-radius:15px; font-family:sans-serif;">
+        <h2 style="color:{color}">Hallo {escape(name)}!</h2>
+        <p><strong>Dein BMI:</strong> {bmi} → <strong>{category}</strong></p>
+        <p>Alter: {int(age)} | Gewicht: {weight}kg | Größe: {height}cm</p>
+        <hr>
+        <div>
+            <strong>KI-Tipps für dich:</strong><br><br>
+            <span id="ai-tips" class="animate-pulse">…</span>
+        </div>
+    </div>
+    <script>
+        (function() {{
+            const target = document.getElementById('ai-tips');
+            const source = new EventSource('{stream_url}');
+            let first = true;
+
+            source.addEventListener('tip', (e) => {{
+                if (first) {{ target.innerHTML = ''; target.classList.remove('animate-pulse'); first = false; }}
+                target.insertAdjacentHTML('beforeend', e.data);
+            }});
+            // Stream fertig → nicht automatisch neu verbinden
+            source.addEventListener('done', () => source.close());
+            source.onerror = () => source.close();
+        }})();
+    </script>
+    """
+    return HttpResponse(html)
+
+
+# Plausible Eingaben für den Tipp-Stream (inklusive)
+STREAM_AGE_RANGE = (1, 130)
+STREAM_BMI_RANGE = (5, 150)
+
+
+def tips_stream(request):
+    """
+    SSE-Endpoint: streamt Gemini-Tipps (event: tip ... event: done)
+
+    Unter ASGI wird der (blockierende) Gemini-Stream Stück für Stück in
+    einem Thread gelesen, unter WSGI direkt.
+    """
+    try:
+        age = float(request.GET["age"])
+        bmi = float(request.GET["bmi"])
+    except (KeyError, ValueError):
+        return HttpResponse("age und bmi fehlen", status=400)
+
+    # nan/inf erst im Generator zu prüfen wäre zu spät (Status 200 ist dann raus)
+    if not (math.isfinite(age) and math.isfinite(bmi)):
+        return HttpResponse("age und bmi müssen Zahlen sein", status=400)
+    if not (STREAM_AGE_RANGE[0] <= age <= STREAM_AGE_RANGE[1]
+            and STREAM_BMI_RANGE[0] <= bmi <= STREAM_BMI_RANGE[1]):
+        return HttpResponse("age oder bmi außerhalb des gültigen Bereichs", status=400)
+
+    category, _ = classify_bmi(bmi)
+    events = _sse_events(stream_tips(age, bmi, category))
+
+    if isinstance(request, ASGIRequest):
+        events = _iterate_in_thread(events)
+
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _sse_events(chunks):
+    for chunk in chunks:
+        data = escape(chunk).replace("\r", "").replace("\n", "<br>")
+        yield f"event: tip\ndata: {data}\n\n"
+    yield "event: done\ndata: \n\n"
+
+
+async def _iterate_in_thread(iterator):
+    """Sync-Iterator als Async-Iterator (ein Thread-Hop pro Element)"""
+    done = object()
+    next_item = sync_to_async(next, thread_sensitive=False)
+    while True:
+        item = await next_item(iterator, done)
+        if item is done:
+            break
+        yield item
+
+
+@require_POST
+def batch_upload(request):
+    """
+    Kohorten-CSV (weight, height, ...) hochladen → CSV mit bmi, category, color
+
+    Die Antwort wird gestreamt, Zeilen werden blockweise mit NumPy berechnet.
+    """
+    uploaded = request.FILES.get("file")
+    if uploaded is None:
+        return HttpResponse("Keine Datei hochgeladen", status=400)
+
+    try:
+        rows = stream_scored_csv(
+            uploaded, chunk_rows=getattr(settings, "BMI_BATCH_CHUNK_ROWS", 5000)
+        )
+    except ValueError as e:
+        return HttpResponse(f"Fehler: {str(e)}", status=400)
+
+    response = StreamingHttpResponse(rows, content_type="text/csv; charset=utf-8")
+    response["Content-Disposition"] = 'attachment; filename="bmi_ergebnisse.csv"'
+    return response
+
+
 # @require_POST
 # def get_input(request):
 #     """HTMX Endpoint für BMI Berechnung mit Gemini AI"""
@@ -183,27 +342,3 @@ def get_input(request):
 #         </div>
 #         """
 #         return HttpResponse(error_html)
-
-
-def ask_gemini_rest(prompt: str, model: str = "gemini-2.0-flash-exp") -> str:
-    """
-    Ruft Google Gemini API auf und gibt Antwort zurück – mit Fehlerbehandlung!
-    """
-    api_key = config("GEMINI_API_KEY", default=None)
-
-    if not api_key:
-        return "Gemini API-Key fehlt. Bitte in Render Environment Variables eintragen."
-
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
-
-    headers = {"Content-Type": "application/json", "x-goog-api-key": api_key}
-
-    body = {"contents": [{"parts": [{"text": prompt}]}]}
-
-    try:
-        resp = requests.post(url, headers=headers, json=body, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        return data["candidates"][0]["content"]["parts"][0]["text"]
-    except Exception as e:
-        return f"Gemini nicht erreichbar: {str(e)}"
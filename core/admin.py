@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Profile, PortfolioScreenshot, ColoredTag, ProjectUpdate
+from .models import Profile, PortfolioScreenshot, ColoredTag, ProjectUpdate, OutboxEmail
 
 
 
@@ -131,4 +131,25 @@ class ProjectUpdateAdmin(admin.ModelAdmin):
     
     def tag_list(self, obj):
         return ", ".join([t.name for t in obj.tags.all()])
-    tag_list.short_description = 'Tags'
\ No newline at end of file
+    tag_list.short_description = 'Tags'
+
+
+# ==========================================
+# EMAIL OUTBOX ADMIN
+# ==========================================
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    """Admin für ausstehende/fehlgeschlagene Emails"""
+    
+    list_display = ['subject', 'recipient', 'status', 'attempts', 'next_attempt_at', 'created_at']
+    list_filter = ['status']
+    readonly_fields = ['payload', 'followup', 'attempts', 'last_error', 'created_at', 'sent_at']
+    
+    def subject(self, obj):
+        return obj.payload.get('subject', '')
+    subject.short_description = 'Betreff'
+    
+    def recipient(self, obj):
+        return obj.payload.get('to', '')
+    recipient.short_description = 'An'
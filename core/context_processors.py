@@ -0,0 +1,8 @@
+from django.utils.functional import SimpleLazyObject
+
+from .site_profile import get_profile
+
+
+def profile(request):
+    # Lazy: Seiten ohne {{ profile }} lesen nicht mal den Versions-Stempel
+    return {"profile": SimpleLazyObject(get_profile)}
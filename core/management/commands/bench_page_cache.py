@@ -0,0 +1,53 @@
+"""
+Lasttest: öffentliche Seiten (anonym) ohne vs. mit Full-Page-Cache
+
+Usage:
+    python manage.py bench_page_cache --requests 500
+"""
+
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+
+PAGES = ["/", "/about/", "/skills/", "/in-progress/", "/projects/", "/legal/impressum/", "/legal/datenschutz/"]
+
+NO_PAGE_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bench"},
+}
+
+
+class Command(BaseCommand):
+    help = "Misst Requests/Sekunde der öffentlichen Seiten mit dem Test-Client"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+
+    def handle(self, *args, **options):
+        count = options["requests"]
+
+        with override_settings(CACHES=NO_PAGE_CACHE):
+            uncached = self._run(count)
+
+        caches["default"].clear()
+        cached = self._run(count)
+
+        self.stdout.write(f"{count} Requests über {len(PAGES)} Seiten (anonym)")
+        self.stdout.write(f"ohne Page-Cache: {uncached:7.0f} req/s")
+        self.stdout.write(f"mit Page-Cache:  {cached:7.0f} req/s")
+        self.stdout.write(self.style.SUCCESS(f"Faktor:          {cached / uncached:7.1f}x"))
+
+    def _run(self, count):
+        client = Client(HTTP_HOST="localhost")
+        for path in PAGES:
+            response = client.get(path)  # Warmup (+ Cache füllen)
+            if response.status_code != 200:
+                raise SystemExit(f"{path} → {response.status_code}")
+
+        start = time.perf_counter()
+        for i in range(count):
+            client.get(PAGES[i % len(PAGES)])
+        return count / (time.perf_counter() - start)
@@ -0,0 +1,54 @@
+"""
+Benchmark: TCP-Verbindungen pro 100 Emails gegen den lokalen Resend-Stub
+
+Usage:
+    python manage.py bench_resend --messages 100
+"""
+
+import time
+
+import requests
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from portfolio_site import resend
+from portfolio_site.email_backend import ResendAPIBackend
+from portfolio_site.resend_stub import ResendStubServer
+
+
+PAYLOAD = {"from": "bench@localhost", "to": "test@example.com", "subject": "Bench", "text": "Hallo"}
+
+
+class Command(BaseCommand):
+    help = "Vergleicht requests.post, gemeinsame Session und Batch-Backend"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=100)
+
+    def handle(self, *args, **options):
+        count = options["messages"]
+
+        def naive(url):
+            for _ in range(count):
+                requests.post(url, json=PAYLOAD, timeout=10)
+
+        def pooled(url):
+            for _ in range(count):
+                resend.post_email(PAYLOAD)
+
+        def batch(url):
+            messages = [EmailMessage("Bench", "Hallo", to=["test@example.com"]) for _ in range(count)]
+            ResendAPIBackend().send_messages(messages)
+
+        for label, run in (("requests.post", naive), ("Session", pooled), ("Batch", batch)):
+            with ResendStubServer() as stub, override_settings(RESEND_API_URL=stub.url):
+                resend.reset_session()
+                start = time.perf_counter()
+                run(stub.url)
+                elapsed = time.perf_counter() - start
+
+            self.stdout.write(
+                f"{label:14} {stub.connections:4} Verbindungen, "
+                f"{stub.requests:4} Requests, {elapsed * 1000:.0f}ms"
+            )
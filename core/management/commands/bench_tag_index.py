@@ -0,0 +1,94 @@
+"""
+Benchmark: Tag-Filter per JOIN + Count vs. In-Memory Tag-Index
+
+Legt synthetische Updates + Tags in einer Transaktion an und rollt
+danach zurück – die DB bleibt unverändert.
+
+Usage:
+    python manage.py bench_tag_index --updates 10000 --tags 200
+"""
+
+import random
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+
+from core.models import ColoredTag, ProjectUpdate, TaggedUpdate
+from core.tag_index import invalidate, tag_index
+from core.views import get_filtered_updates
+
+
+class Command(BaseCommand):
+    help = "Vergleicht den alten JOIN/Count-Filter mit dem invertierten Tag-Index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--updates", type=int, default=10_000)
+        parser.add_argument("--tags", type=int, default=200)
+        parser.add_argument("--tags-per-update", type=int, default=5)
+        parser.add_argument("--requests", type=int, default=50)
+        # Der alte JOIN ist auf SQLite bei 10k Updates sehr langsam
+        parser.add_argument("--legacy-requests", type=int, default=1)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            slugs = self._seed(options)
+            self._run(slugs, options["requests"], options["legacy_requests"])
+            transaction.set_rollback(True)
+
+        invalidate()
+
+    def _seed(self, options):
+        rng = random.Random(42)
+        tags = ColoredTag.objects.bulk_create(
+            ColoredTag(name=f"bench-{i}", slug=f"bench-{i}") for i in range(options["tags"])
+        )
+        updates = ProjectUpdate.objects.bulk_create(
+            ProjectUpdate(title=f"Bench {i}", description="...") for i in range(options["updates"])
+        )
+
+        content_type = ContentType.objects.get_for_model(ProjectUpdate)
+        TaggedUpdate.objects.bulk_create(
+            TaggedUpdate(tag=tag, content_type=content_type, object_id=update.id)
+            for update in updates
+            for tag in rng.sample(tags, options["tags_per_update"])
+        )
+        invalidate()
+        return [tag.slug for tag in tags]
+
+    def _run(self, slugs, count, legacy_count):
+        rng = random.Random(7)
+        queries = [rng.sample(slugs, 3) for _ in range(count)]
+
+        def legacy(selected):
+            return list(
+                ProjectUpdate.objects.filter(is_current=True, tags__slug__in=selected)
+                .annotate(tag_match_count=Count("tags", filter=Q(tags__slug__in=selected)))
+                .filter(tag_match_count__gt=0)
+                .order_by("-tag_match_count", "-created_at")
+                .distinct()
+                .values_list("id", flat=True)
+            )
+
+        def indexed(selected):
+            return list(get_filtered_updates(selected).values_list("id", flat=True))
+
+        start = time.perf_counter()
+        tag_index.ensure_fresh()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        self.stdout.write(f"Index-Aufbau:    {build_ms:.1f}ms (einmal pro Worker + Änderung)")
+        for label, func, runs in (("JOIN + Count", legacy, legacy_count), ("Tag-Index", indexed, count)):
+            start = time.perf_counter()
+            for selected in queries[:runs]:
+                func(selected)
+            per_request = (time.perf_counter() - start) * 1000 / runs
+            self.stdout.write(f"{label + ':':<16} {per_request:.2f}ms pro Filter-Request")
+
+        start = time.perf_counter()
+        for selected in queries:
+            tag_index.match_counts(selected)
+        ranking = (time.perf_counter() - start) * 1000 / count
+        self.stdout.write(f"nur Ranking:     {ranking:.3f}ms (In-Memory Zählung)")
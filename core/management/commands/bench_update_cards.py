@@ -0,0 +1,67 @@
+"""
+Benchmark: Update-Liste rendern – ohne vs. mit Fragment-Cache pro Karte
+
+Legt synthetische Updates (mit Tags) in einer Transaktion an und rollt
+danach zurück – die DB bleibt unverändert.
+
+Usage:
+    python manage.py bench_update_cards --cards 200
+"""
+
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+
+from core.models import ProjectUpdate
+from core.tag_index import invalidate
+
+
+NO_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bench"},
+}
+
+
+class Command(BaseCommand):
+    help = "Misst Template-Renderzeit der Update-Karten mit dem Test-Client"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cards", type=int, default=200)
+        parser.add_argument("--requests", type=int, default=10)
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST="localhost")
+
+        with transaction.atomic(), override_settings(UPDATES_PAGE_SIZE=options["cards"]):
+            for i in range(options["cards"]):
+                update = ProjectUpdate.objects.create(
+                    title=f"Bench {i}",
+                    description="Lorem ipsum dolor sit amet " * 20,
+                    update_type=("milestone", "feature", "bugfix", "daily")[i % 4],
+                )
+                update.tags.add("django", "htmx", f"tag-{i % 10}")
+            invalidate()
+
+            with override_settings(CACHES=NO_CACHE):
+                uncached = self._measure(client, options["requests"])
+
+            caches["default"].clear()
+            client.get("/current-project/")  # Karten in den Cache rendern
+            cached = self._measure(client, options["requests"])
+
+            transaction.set_rollback(True)
+
+        invalidate()
+        self.stdout.write(f"{options['cards']} Karten pro Seite")
+        self.stdout.write(f"ohne Fragment-Cache: {uncached:.1f}ms")
+        self.stdout.write(f"mit Fragment-Cache:  {cached:.1f}ms")
+        self.stdout.write(self.style.SUCCESS(f"Speedup:             {uncached / cached:.1f}x"))
+
+    def _measure(self, client, count):
+        start = time.perf_counter()
+        for _ in range(count):
+            client.get("/current-project/")
+        return (time.perf_counter() - start) * 1000 / count
@@ -0,0 +1,75 @@
+"""
+Benchmark: Prev/Next im Update-Modal – Liste durchsuchen vs. Positions-Map
+
+Legt synthetische Updates in einer Transaktion an (1k → 50k) und rollt
+danach zurück – die DB bleibt unverändert.
+
+Usage:
+    python manage.py bench_update_neighbours --sizes 1000 10000 50000
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import ProjectUpdate
+from core.tag_index import invalidate, tag_index
+from core.views import get_filtered_updates
+
+
+class Command(BaseCommand):
+    help = "Misst die Nachbar-Suche im Modal bei wachsender Update-Historie"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+        parser.add_argument("--opens", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            existing = 0
+            for size in sorted(options["sizes"]):
+                ProjectUpdate.objects.bulk_create(
+                    ProjectUpdate(title=f"Bench {i}", description="...")
+                    for i in range(existing, size)
+                )
+                existing = size
+                invalidate()
+                self._run(size, options["opens"])
+            transaction.set_rollback(True)
+
+        invalidate()
+
+    def _run(self, size, opens):
+        rng = random.Random(size)
+        ids = list(ProjectUpdate.objects.values_list("id", flat=True))
+        picks = [rng.choice(ids) for _ in range(opens)]
+
+        def legacy(update_id):
+            update_ids = list(get_filtered_updates([]).values_list("id", flat=True))
+            index = update_ids.index(update_id)
+            return (
+                update_ids[index - 1] if index > 0 else None,
+                update_ids[index + 1] if index + 1 < len(update_ids) else None,
+            )
+
+        start = time.perf_counter()
+        tag_index.ensure_fresh()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        results = {}
+        for label, func, runs in (("Liste + index()", legacy, 20), ("Positions-Map", None, opens)):
+            start = time.perf_counter()
+            for update_id in picks[:runs]:
+                if func:
+                    func(update_id)
+                else:
+                    tag_index.neighbours(update_id, [])
+            results[label] = (time.perf_counter() - start) * 1000 / runs
+
+        self.stdout.write(
+            f"{size:>6} Updates: "
+            + "  ".join(f"{label}={ms:.3f}ms" for label, ms in results.items())
+            + f"  (Index-Aufbau {build_ms:.0f}ms)"
+        )
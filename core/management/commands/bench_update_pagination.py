@@ -0,0 +1,60 @@
+"""
+Benchmark: First Paint von /current-project/ – alle Updates vs. erste Seite
+
+Legt synthetische Updates in einer Transaktion an und rollt danach
+zurück – die DB bleibt unverändert.
+
+Usage:
+    python manage.py bench_update_pagination --sizes 100 1000 5000
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+
+from core.models import ProjectUpdate
+from core.tag_index import invalidate
+
+
+class Command(BaseCommand):
+    help = "Vergleicht Antwortgröße + Renderzeit mit und ohne Keyset-Pagination"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 5_000])
+        parser.add_argument("--requests", type=int, default=5)
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST="localhost")
+
+        with transaction.atomic():
+            existing = 0
+            for size in sorted(options["sizes"]):
+                ProjectUpdate.objects.bulk_create(
+                    ProjectUpdate(title=f"Bench {i}", description="Lorem ipsum " * 20)
+                    for i in range(existing, size)
+                )
+                existing = size
+                invalidate()
+
+                results = []
+                for label, page_size in (("alles", 10**9), ("Seite 1", None)):
+                    overrides = {"UPDATES_PAGE_SIZE": page_size} if page_size else {}
+                    with override_settings(**overrides):
+                        results.append((label, *self._measure(client, options["requests"])))
+
+                self.stdout.write(
+                    f"{size:>5} Updates: "
+                    + "  ".join(f"{label}={kb:.0f}KB/{ms:.0f}ms" for label, kb, ms in results)
+                )
+            transaction.set_rollback(True)
+
+        invalidate()
+
+    def _measure(self, client, count):
+        start = time.perf_counter()
+        for _ in range(count):
+            response = client.get("/current-project/")
+        ms = (time.perf_counter() - start) * 1000 / count
+        return len(response.content) / 1024, ms
@@ -0,0 +1,77 @@
+"""
+Benchmark: Volltextsuche (FTS5/GIN) vs. icontains über ProjectUpdate
+
+Legt synthetische Updates in einer Transaktion an und rollt danach
+zurück – die DB bleibt unverändert.
+
+Usage:
+    python manage.py bench_update_search --rows 100000
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from core import search
+from core.models import ProjectUpdate
+
+
+WORDS = (
+    "django htmx tailwind gemini resend cloudinary postgres sqlite cache pool "
+    "challenge sprite token outbox stream breaker numpy batch index tag cursor "
+    "modal filter signal worker session login profile deploy railway docker"
+).split()
+
+
+class Command(BaseCommand):
+    help = "Vergleicht Suchlatenz von icontains und dem Volltext-Index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--queries", type=int, default=20)
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+
+        with transaction.atomic():
+            ProjectUpdate.objects.bulk_create(
+                (
+                    ProjectUpdate(
+                        title=" ".join(rng.choices(WORDS, k=4)),
+                        description=" ".join(rng.choices(WORDS, k=60)) + f" ticket{i}",
+                        code_snippet=" ".join(rng.choices(WORDS, k=10)),
+                    )
+                    for i in range(options["rows"])
+                ),
+                batch_size=5_000,
+            )
+            search.rebuild()  # bulk_create löst keine Signals aus
+
+            # Seltene Begriffe (1 Treffer) und häufige (viele Treffer)
+            queries = [f"ticket{rng.randrange(options['rows'])}" for _ in range(options["queries"])]
+            queries += [rng.choice(WORDS) for _ in range(options["queries"])]
+
+            def icontains(text):
+                return list(
+                    ProjectUpdate.objects.filter(is_current=True)
+                    .filter(
+                        Q(title__icontains=text)
+                        | Q(description__icontains=text)
+                        | Q(code_snippet__icontains=text)
+                    )
+                    .order_by("-created_at")[:20]
+                )
+
+            self.stdout.write(f"{options['rows']} Updates")
+            for label, func in (("icontains", icontains), ("Volltext", search.search_updates)):
+                for kind, batch in (("selten", queries[: options["queries"]]), ("häufig", queries[options["queries"]:])):
+                    start = time.perf_counter()
+                    for text in batch:
+                        func(text)
+                    ms = (time.perf_counter() - start) * 1000 / len(batch)
+                    self.stdout.write(f"  {label:<10} {kind:<7} {ms:8.2f}ms pro Suche")
+
+            transaction.set_rollback(True)
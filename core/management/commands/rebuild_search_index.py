@@ -0,0 +1,26 @@
+"""
+FTS-Suchindex (SQLite) komplett neu aufbauen
+
+Nötig nach bulk_create()/update(), die keine Signals auslösen.
+Auf Postgres ist nichts zu tun (GIN-Index auf dem Ausdruck).
+
+Usage:
+    python manage.py rebuild_search_index
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = "Baut den Volltext-Index für ProjectUpdate neu auf"
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            self.stdout.write("Nur für SQLite nötig – nichts zu tun.")
+            return
+
+        search.rebuild()
+        self.stdout.write(self.style.SUCCESS("✅ Suchindex neu aufgebaut"))
@@ -0,0 +1,49 @@
+"""
+Outbox-Worker: stellt ausstehende Emails via Resend zu
+
+Usage:
+    python manage.py send_outbox            # Dauerbetrieb (Procfile: worker)
+    python manage.py send_outbox --once     # Ein Durchlauf (z.B. Cronjob)
+"""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.outbox import deliver_pending
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Stellt Emails aus der Outbox zu (Retries mit Backoff)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Nur ein Durchlauf")
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument("--interval", type=float, default=2.0, help="Pause in Sekunden, wenn nichts zu tun ist")
+
+    def handle(self, *args, **options):
+        while True:
+            # Außerhalb des Request-Zyklus räumt Django tote/alte
+            # Verbindungen (CONN_MAX_AGE) nicht selbst auf
+            close_old_connections()
+            try:
+                sent, failed = deliver_pending(options["batch_size"])
+            except Exception:
+                if options["once"]:
+                    raise
+                # Worker am Leben halten (z.B. DB kurz weg) – nächster Durchlauf
+                logger.exception("Outbox-Durchlauf fehlgeschlagen")
+                sent = failed = 0
+
+            if sent or failed:
+                self.stdout.write(f"Outbox: {sent} gesendet, {failed} fehlgeschlagen")
+
+            if options["once"]:
+                break
+            if not (sent or failed):
+                time.sleep(options["interval"])
@@ -0,0 +1,53 @@
+from django.db import migrations
+
+
+FTS_TABLE = "core_projectupdate_fts"
+GIN_INDEX = "core_update_search_gin"
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "title, description, code_snippet, tokenize='unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description, code_snippet) "
+            "SELECT id, title, description, code_snippet FROM core_projectupdate"
+        )
+
+    elif vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex
+        from django.contrib.postgres.search import SearchVector
+
+        # Gleicher Ausdruck wie core.search.search_vector()
+        ProjectUpdate = apps.get_model("core", "ProjectUpdate")
+        schema_editor.add_index(
+            ProjectUpdate,
+            GinIndex(
+                SearchVector("title", "description", "code_snippet", config="german"),
+                name=GIN_INDEX,
+            ),
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_outboxemail'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
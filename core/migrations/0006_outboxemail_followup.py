@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_projectupdate_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxemail',
+            name='followup',
+            field=models.JSONField(blank=True, help_text='Payload, der erst nach erfolgreichem Versand in die Outbox kommt', null=True),
+        ),
+    ]
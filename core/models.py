@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from taggit.models import TagBase, GenericTaggedItemBase
 from taggit.managers import TaggableManager
 from cloudinary.models import CloudinaryField
@@ -195,4 +196,52 @@ class ProjectUpdate(models.Model):
             'bugfix': '🐛',
             'note': '📝',
         }
-        return emojis.get(self.update_type, '📌')
\ No newline at end of file
+        return emojis.get(self.update_type, '📌')
+
+# ==========================================
+# E-MAIL OUTBOX (Resend, asynchron)
+# ==========================================
+
+
+class OutboxEmail(models.Model):
+    """Ausgehende Email – wird vom send_outbox Worker zugestellt"""
+    
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '⏳ Ausstehend'),
+        (STATUS_SENT, '✅ Gesendet'),
+        (STATUS_FAILED, '❌ Fehlgeschlagen'),
+    ]
+    
+    payload = models.JSONField(help_text='Resend API Payload (from, to, subject, text, ...)')
+    followup = models.JSONField(
+        null=True,
+        blank=True,
+        help_text='Payload, der erst nach erfolgreichem Versand in die Outbox kommt',
+    )
+    
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        verbose_name = 'Outbox-Email'
+        verbose_name_plural = 'Outbox-Emails'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_status_display()} – {self.payload.get('subject', '')}"
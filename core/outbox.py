@@ -0,0 +1,122 @@
+"""
+Email-Outbox
+Views legen Emails nur in der DB ab, der send_outbox Worker stellt zu
+"""
+
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from portfolio_site import resend
+
+from .models import OutboxEmail
+
+
+def enqueue_email(payload, followup=None):
+    """
+    Lege Email in die Outbox (kein HTTP-Call im Request!)
+
+    followup kommt erst in die Outbox, wenn payload zugestellt ist –
+    z.B. die Bestätigung an den User erst nach der Mail an mich.
+
+    Usage:
+        enqueue_email({'from': ..., 'to': ..., 'subject': ..., 'text': ...})
+    """
+    return OutboxEmail.objects.create(payload=payload, followup=followup)
+
+
+def send_payload(payload):
+    """
+    Sende einen Resend-Payload
+
+    Raises:
+        requests.RequestException: Netzwerkfehler oder Status != 2xx
+    """
+    resend.post_email(payload).raise_for_status()
+
+
+def backoff_delay(attempts):
+    """Exponentielles Backoff: 30s, 60s, 120s, ... (max. 1h)"""
+    base = getattr(settings, 'OUTBOX_BACKOFF_SECONDS', 30)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), 3600))
+
+
+def claim_batch(batch_size):
+    """
+    Hole fällige Emails (mit Postgres: gesperrt, damit mehrere
+    Worker sich nicht in die Quere kommen)
+    """
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxEmail.STATUS_PENDING, next_attempt_at__lte=timezone.now())
+            .order_by('next_attempt_at')[:batch_size]
+        )
+        # Während des Versands nicht nochmal ausliefern
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=timezone.now() + timedelta(minutes=5)
+        )
+    return emails
+
+
+def deliver(email):
+    """
+    Stelle eine Email zu, bei Fehler: Retry mit Backoff
+
+    Returns:
+        bool: erfolgreich gesendet?
+    """
+    max_attempts = getattr(settings, 'OUTBOX_MAX_ATTEMPTS', 5)
+    email.attempts += 1
+
+    try:
+        send_payload(email.payload)
+    except requests.RequestException as e:
+        _record_failure(email, e, give_up=email.attempts >= max_attempts)
+        return False
+    except (KeyError, TypeError, ValueError) as e:
+        # Kaputter Payload – ein Retry ändert daran nichts
+        _record_failure(email, e, give_up=True)
+        return False
+    except Exception as e:
+        # Unerwarteter Fehler: wie ein Netzwerkfehler behandeln, statt den
+        # Batch bis zum Lease-Ende (5 min) hängen zu lassen
+        _record_failure(email, e, give_up=email.attempts >= max_attempts)
+        return False
+
+    email.status = OutboxEmail.STATUS_SENT
+    email.sent_at = timezone.now()
+    email.last_error = ''
+    with transaction.atomic():
+        email.save(update_fields=['attempts', 'last_error', 'status', 'sent_at'])
+        if email.followup:
+            enqueue_email(email.followup)
+    return True
+
+
+def _record_failure(email, error, give_up):
+    email.last_error = f"{type(error).__name__}: {error}"[:1000]
+    if give_up:
+        email.status = OutboxEmail.STATUS_FAILED
+    else:
+        email.next_attempt_at = timezone.now() + backoff_delay(email.attempts)
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+def deliver_pending(batch_size=20):
+    """
+    Stelle alle fälligen Emails eines Batches zu
+
+    Returns:
+        tuple: (sent, failed)
+    """
+    sent = failed = 0
+    for email in claim_batch(batch_size):
+        if deliver(email):
+            sent += 1
+        else:
+            failed += 1
+    return sent, failed
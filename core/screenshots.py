@@ -0,0 +1,44 @@
+"""
+Screenshots der 'About This Portfolio' Seite
+Eine Query für alle Sektionen, gruppiert + gecacht.
+Invalidierung über Signals (core/signals.py).
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import PortfolioScreenshot
+
+
+CACHE_KEY = "core:screenshots:grouped"
+
+
+def _cache():
+    return caches[getattr(settings, "SCREENSHOT_CACHE", "default")]
+
+
+def group_by_section(screenshots):
+    """
+    Returns:
+        dict: {'overview': [...], 'architecture': [...], ...} – jede Sektion
+        ist vorhanden (ggf. leer), Reihenfolge wie Meta.ordering
+    """
+    sections = PortfolioScreenshot._meta.get_field("section").choices
+    grouped = {key: [] for key, _ in sections}
+    for screenshot in screenshots:
+        grouped.setdefault(screenshot.section, []).append(screenshot)
+    return grouped
+
+
+def get_grouped_screenshots():
+    """Alle Screenshots nach Sektion (Cache → eine DB-Query)"""
+    cache = _cache()
+    grouped = cache.get(CACHE_KEY)
+    if grouped is None:
+        grouped = group_by_section(PortfolioScreenshot.objects.all())
+        cache.set(CACHE_KEY, grouped, getattr(settings, "SCREENSHOT_CACHE_TIMEOUT", 3600))
+    return grouped
+
+
+def invalidate():
+    _cache().delete(CACHE_KEY)
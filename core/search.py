@@ -0,0 +1,112 @@
+"""
+Volltextsuche über ProjectUpdate (title, description, code_snippet)
+
+SQLite:   FTS5-Tabelle core_projectupdate_fts (rowid = Update-ID),
+          per Signal bei jedem Speichern/Löschen aktualisiert.
+Postgres: GIN-Index auf dem SearchVector-Ausdruck (Migration 0005) –
+          Postgres hält den Index selbst aktuell.
+Sonst:    icontains (langsam, nur als Fallback).
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import ProjectUpdate
+
+
+FTS_TABLE = "core_projectupdate_fts"
+
+# Muss exakt zum Index-Ausdruck in Migration 0005 passen, sonst nutzt
+# Postgres den GIN-Index nicht
+SEARCH_FIELDS = ("title", "description", "code_snippet")
+POSTGRES_CONFIG = "german"
+
+
+def _fts_query(text):
+    """'htmx sse' → '"htmx"* "sse"*' (Präfix-Suche, alle Wörter müssen passen)"""
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_vector():
+    from django.contrib.postgres.search import SearchVector
+
+    return SearchVector(*SEARCH_FIELDS, config=POSTGRES_CONFIG)
+
+
+def search_updates(text, limit=20):
+    """
+    Aktuelle Updates passend zu text, bester Treffer zuerst
+
+    Returns:
+        list: ProjectUpdate-Objekte
+    """
+    if not re.search(r"\w", text):
+        return []
+
+    updates = ProjectUpdate.objects.filter(is_current=True)
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {FTS_TABLE}.rowid FROM {FTS_TABLE} "
+                f"JOIN core_projectupdate ON core_projectupdate.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s AND core_projectupdate.is_current "
+                f"ORDER BY bm25({FTS_TABLE}, 10.0, 5.0, 1.0) LIMIT %s",
+                [_fts_query(text), limit],
+            )
+            ranked = [row[0] for row in cursor.fetchall()]
+        by_id = updates.in_bulk(ranked)
+        return [by_id[update_id] for update_id in ranked if update_id in by_id]
+
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        query = SearchQuery(text, config=POSTGRES_CONFIG, search_type="websearch")
+        return list(
+            updates.annotate(search=search_vector())
+            .filter(search=query)
+            .annotate(rank=SearchRank(search_vector(), query))
+            .order_by("-rank", "-created_at")[:limit]
+        )
+
+    condition = Q()
+    for field in SEARCH_FIELDS:
+        condition |= Q(**{f"{field}__icontains": text})
+    return list(updates.filter(condition).order_by("-created_at")[:limit])
+
+
+# ==================== SQLITE FTS5 PFLEGE ====================
+
+
+def index_update(update):
+    """Ein Update (neu) in den FTS-Index schreiben"""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [update.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s)",
+            [update.pk, *(getattr(update, field) for field in SEARCH_FIELDS)],
+        )
+
+
+def remove_update(update_id):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [update_id])
+
+
+def rebuild():
+    """Kompletten FTS-Index neu aufbauen (nach bulk_create/update())"""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) "
+            f"SELECT id, {', '.join(SEARCH_FIELDS)} FROM core_projectupdate"
+        )
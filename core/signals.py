@@ -0,0 +1,52 @@
+# core/signals.py
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from portfolio_site import page_cache
+from projects.models import Project
+
+from . import screenshots, search, site_profile, tag_index
+from .models import ColoredTag, PortfolioScreenshot, Profile, ProjectUpdate, TaggedUpdate
+
+
+@receiver([post_save, post_delete], sender=PortfolioScreenshot)
+def invalidate_screenshot_cache(sender, **kwargs):
+    screenshots.invalidate()
+
+
+@receiver([post_save, post_delete], sender=ProjectUpdate)
+@receiver([post_save, post_delete], sender=ColoredTag)
+@receiver(post_delete, sender=TaggedUpdate)
+@receiver(m2m_changed, sender=TaggedUpdate)
+def invalidate_tag_index(sender, **kwargs):
+    # Sofort (gleiche Transaktion sieht die Änderung) und nach dem Commit,
+    # damit kein anderer Worker einen Index aus alten Daten behält
+    tag_index.invalidate()
+    transaction.on_commit(tag_index.invalidate)
+
+
+@receiver(post_save, sender=ProjectUpdate)
+def index_update_for_search(sender, instance, **kwargs):
+    search.index_update(instance)
+
+
+@receiver(post_delete, sender=ProjectUpdate)
+def remove_update_from_search(sender, instance, **kwargs):
+    search.remove_update(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Profile)
+def invalidate_site_profile(sender, **kwargs):
+    site_profile.invalidate()
+    transaction.on_commit(site_profile.invalidate)
+
+
+@receiver([post_save, post_delete], sender=Profile)
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=PortfolioScreenshot)
+def invalidate_page_cache(sender, **kwargs):
+    # Nach dem Commit nochmal – sonst kann ein anderer Worker den Stand
+    # vor dem Commit rendern und PAGE_CACHE_TIMEOUT lang ausliefern
+    page_cache.invalidate()
+    transaction.on_commit(page_cache.invalidate)
@@ -0,0 +1,66 @@
+"""
+Site-Profil (Name, Bild, Bio) – einmal pro Prozess geladen
+Home, About, Contact und alle Templates (Context-Processor) teilen
+sich dasselbe Objekt statt pro Request Profile.objects.first().
+
+Signals (core/signals.py) setzen eine neue Version im Shared-Cache –
+Prozesse, die diesen Cache teilen, laden sofort neu. Ist "shared" nur
+LocMem (Default, pro Prozess), sehen andere Worker die Änderung
+spätestens nach PROFILE_MEMO_SECONDS.
+"""
+
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import Profile
+
+
+VERSION_KEY = "core:profile:version"
+
+_lock = threading.Lock()
+_memo = (None, 0.0, None)  # (version, geladen um, profile) – als Tupel atomar ersetzt
+
+
+def _cache():
+    return caches[getattr(settings, "PROFILE_CACHE", "default")]
+
+
+def _memo_seconds():
+    return getattr(settings, "PROFILE_MEMO_SECONDS", 60)
+
+
+def _current_version():
+    cache = _cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def get_profile():
+    """
+    Returns:
+        Profile | None: erstes Profil (None, solange keins angelegt ist)
+    """
+    global _memo
+    version = _current_version()
+    if not _is_fresh(_memo, version):
+        with _lock:
+            if not _is_fresh(_memo, version):
+                _memo = (version, time.monotonic(), Profile.objects.first())
+    return _memo[2]
+
+
+def _is_fresh(memo, version):
+    memo_version, loaded_at, _ = memo
+    return memo_version == version and time.monotonic() - loaded_at < _memo_seconds()
+
+
+def invalidate():
+    """Profil beim nächsten Zugriff neu laden (Prozesse mit diesem Cache)"""
+    _cache().set(VERSION_KEY, uuid.uuid4().hex, None)
@@ -0,0 +1,185 @@
+"""
+Invertierter Tag-Index für Current-Project-Updates
+Tag-Slug → Menge der Update-IDs, im Prozess gehalten – dazu die
+Listen-Reihenfolge für Prev/Next im Modal.
+
+Signals (core/signals.py) setzen eine neue Version im Shared-Cache –
+Prozesse, die diesen Cache teilen, bauen sofort neu. Ist "shared" nur
+LocMem (Default, pro Prozess), kommen Änderungen anderer Worker über eine
+DB-Signatur an (Anzahl + letzte Änderung), geprüft höchstens alle
+TAG_INDEX_CHECK_SECONDS.
+"""
+
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.db.models import Count, Max
+
+from .models import ProjectUpdate, TaggedUpdate
+
+
+VERSION_KEY = "core:tag_index:version"
+
+
+def _cache():
+    return caches[getattr(settings, "TAG_INDEX_CACHE", "default")]
+
+
+def _check_seconds():
+    return getattr(settings, "TAG_INDEX_CHECK_SECONDS", 5)
+
+
+class TagIndex:
+    """
+    postings: {'django': frozenset({3, 7, ...}), ...} – nur is_current Updates
+    recency:  alle is_current IDs, neueste zuerst (wie die Update-Liste)
+
+    Für Prev/Next im Modal wird pro Filter-Kombination die sortierte
+    ID-Liste + Positions-Map gemerkt (LRU, max_orderings Einträge).
+    """
+
+    def __init__(self, max_orderings=128):
+        self.postings = {}
+        self.recency = ()
+        self.positions = {}
+        self.version = None
+        self.signature = None
+        self.max_orderings = max_orderings
+        self._orderings = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+
+    def build(self):
+        """
+        Returns:
+            tuple: (postings, recency)
+        """
+        current = ProjectUpdate.objects.filter(is_current=True)
+        recency = tuple(current.order_by("-created_at", "-id").values_list("id", flat=True))
+
+        content_type = ContentType.objects.get_for_model(ProjectUpdate)
+        rows = TaggedUpdate.objects.filter(
+            content_type=content_type,
+            object_id__in=current.values("id"),
+        ).values_list("tag__slug", "object_id")
+
+        postings = {}
+        for slug, update_id in rows:
+            postings.setdefault(slug, set()).add(update_id)
+        return {slug: frozenset(ids) for slug, ids in postings.items()}, recency
+
+    def _current_version(self):
+        cache = _cache()
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(VERSION_KEY)
+        return version
+
+    def db_signature(self):
+        """
+        Ändert sich bei jedem Anlegen, Speichern (auto_now) oder Löschen
+        eines Updates und bei jeder Tag-Zuordnung – auch aus anderen Prozessen
+
+        Returns:
+            tuple: (Anzahl Updates, letztes updated_at, Anzahl Tags, höchste Tag-ID)
+        """
+        updates = ProjectUpdate.objects.aggregate(count=Count("id"), changed=Max("updated_at"))
+        tagged = TaggedUpdate.objects.filter(
+            content_type=ContentType.objects.get_for_model(ProjectUpdate),
+        ).aggregate(count=Count("id"), last=Max("id"))
+        return updates["count"], updates["changed"], tagged["count"], tagged["last"]
+
+    def ensure_fresh(self):
+        version = self._current_version()
+        signature = self.signature
+        if version == self.version:
+            if time.monotonic() < self._next_check:
+                return
+            self._next_check = time.monotonic() + _check_seconds()
+            signature = self.db_signature()
+            if signature == self.signature:
+                return
+        with self._lock:
+            if version == self.version and signature == self.signature:
+                return  # anderer Thread hat schon neu gebaut
+            self.signature = self.db_signature()
+            self.postings, self.recency = self.build()
+            self.positions = {update_id: i for i, update_id in enumerate(self.recency)}
+            self._orderings = OrderedDict()
+            self.version = version
+            self._next_check = time.monotonic() + _check_seconds()
+
+    def match_counts(self, slugs):
+        """
+        Returns:
+            dict: {update_id: Anzahl passender Tags} – nur Updates mit >= 1 Treffer
+        """
+        self.ensure_fresh()
+        counts = Counter()
+        for slug in set(slugs):
+            counts.update(self.postings.get(slug, ()))
+        return dict(counts)
+
+    def ordering(self, slugs):
+        """
+        Reihenfolge wie get_filtered_updates (Treffer ↓, dann neueste zuerst)
+
+        Returns:
+            tuple: (ids, {update_id: Position})
+        """
+        self.ensure_fresh()
+        key = frozenset(slugs)
+        if not key:
+            return self.recency, self.positions
+
+        version = self.version
+        with self._lock:
+            cached = self._orderings.get(key)
+            if cached is not None:
+                self._orderings.move_to_end(key)
+                return cached
+
+        counts = self.match_counts(key)
+        positions = self.positions
+        ids = tuple(sorted(counts, key=lambda update_id: (-counts[update_id], positions[update_id])))
+        result = ids, {update_id: i for i, update_id in enumerate(ids)}
+
+        with self._lock:
+            # Während der Berechnung neu gebaut → nicht mehr gültig, nicht merken
+            if version == self.version:
+                self._orderings[key] = result
+                while len(self._orderings) > self.max_orderings:
+                    self._orderings.popitem(last=False)
+        return result
+
+    def count(self, slugs):
+        """Anzahl Updates in der Liste für diesen Filter"""
+        return len(self.ordering(slugs)[0])
+
+    def neighbours(self, update_id, slugs):
+        """
+        Returns:
+            tuple: (prev_id, next_id) – None am Rand oder wenn das Update
+            nicht zum Filter passt
+        """
+        ids, positions = self.ordering(slugs)
+        index = positions.get(update_id)
+        if index is None:
+            return None, None
+        prev_id = ids[index - 1] if index > 0 else None
+        next_id = ids[index + 1] if index + 1 < len(ids) else None
+        return prev_id, next_id
+
+
+tag_index = TagIndex()
+
+
+def invalidate():
+    """Neue Version → Prozesse mit diesem Cache bauen beim nächsten Zugriff neu"""
+    _cache().set(VERSION_KEY, uuid.uuid4().hex, None)
@@ -1,3 +1,523 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.mail import EmailMessage
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from portfolio_site import resend
+from portfolio_site.email_backend import ResendAPIBackend, ResendBatchError
+from portfolio_site.resend_stub import ResendStubServer
+
+from .models import ColoredTag, OutboxEmail, PortfolioScreenshot, Profile, ProjectUpdate
+from .outbox import deliver_pending, enqueue_email
+from .screenshots import get_grouped_screenshots
+from .search import search_updates
+from .tag_index import tag_index
+from .views import get_filtered_updates, get_update_page
+
+
+PAYLOAD = {
+    'from': 'noreply@martin-freimuth.dev',
+    'to': 'test@example.com',
+    'subject': 'Test',
+    'text': 'Hallo',
+}
+
+
+class OutboxTests(TestCase):
+    def test_worker_delivers_pending_email(self):
+        email = enqueue_email(PAYLOAD)
+
+        with ResendStubServer() as stub, override_settings(RESEND_API_URL=stub.url):
+            sent, failed = deliver_pending()
+
+        email.refresh_from_db()
+        self.assertEqual((sent, failed), (1, 0))
+        self.assertEqual(email.status, OutboxEmail.STATUS_SENT)
+        self.assertEqual(stub.received[0][1]['subject'], 'Test')
+
+    def test_followup_enqueued_only_after_delivery(self):
+        confirmation = {**PAYLOAD, 'to': 'user@example.com', 'subject': 'Bestätigung'}
+        email = enqueue_email(PAYLOAD, followup=confirmation)
+
+        with ResendStubServer(status=500) as stub, override_settings(RESEND_API_URL=stub.url):
+            deliver_pending()
+        self.assertEqual(OutboxEmail.objects.count(), 1)
+
+        OutboxEmail.objects.filter(pk=email.pk).update(next_attempt_at=email.created_at)
+        with ResendStubServer() as stub, override_settings(RESEND_API_URL=stub.url):
+            self.assertEqual(deliver_pending(), (1, 0))
+            self.assertEqual(deliver_pending(), (1, 0))
+
+        self.assertEqual([body['subject'] for _, body in stub.received], ['Test', 'Bestätigung'])
+        self.assertEqual(OutboxEmail.objects.filter(status=OutboxEmail.STATUS_SENT).count(), 2)
+
+    def test_failed_delivery_is_retried_later(self):
+        email = enqueue_email(PAYLOAD)
+
+        with ResendStubServer(status=500) as stub, override_settings(RESEND_API_URL=stub.url):
+            deliver_pending()
+            # Backoff: sofortiger zweiter Durchlauf sendet nichts
+            deliver_pending()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.STATUS_PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.next_attempt_at, email.created_at)
+        self.assertEqual(stub.requests, 1)
+
+    @override_settings(OUTBOX_MAX_ATTEMPTS=1)
+    def test_gives_up_after_max_attempts(self):
+        email = enqueue_email(PAYLOAD)
+
+        with ResendStubServer(status=500) as stub, override_settings(RESEND_API_URL=stub.url):
+            deliver_pending()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.STATUS_FAILED)
+
+    def test_malformed_payload_fails_without_retry(self):
+        email = enqueue_email(PAYLOAD)
+
+        with mock.patch('core.outbox.send_payload', side_effect=KeyError('to')):
+            self.assertEqual(deliver_pending(), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.STATUS_FAILED)
+        self.assertIn('KeyError', email.last_error)
+
+    def test_unexpected_error_is_retried_later(self):
+        email = enqueue_email(PAYLOAD)
+
+        with mock.patch('core.outbox.send_payload', side_effect=RuntimeError('boom')):
+            deliver_pending()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.STATUS_PENDING)
+        self.assertGreater(email.next_attempt_at, email.created_at)
+
+    def test_worker_survives_failed_iteration(self):
+        calls = mock.Mock(side_effect=[DatabaseError('gone'), (1, 0), KeyboardInterrupt])
+        with mock.patch('core.management.commands.send_outbox.deliver_pending', calls), \
+                mock.patch('core.management.commands.send_outbox.close_old_connections') as close, \
+                mock.patch('core.management.commands.send_outbox.time.sleep'), \
+                self.assertLogs('core.management.commands.send_outbox', 'ERROR'):
+            with self.assertRaises(KeyboardInterrupt):
+                call_command('send_outbox', stdout=io.StringIO())
+
+        self.assertEqual(calls.call_count, 3)
+        self.assertEqual(close.call_count, 3)
+
+    def test_contact_success_does_not_block_on_resend(self):
+        caches['shared'].clear()
+        session = self.client.session
+        session['contact_data'] = {
+            'name': 'Max', 'email': 'max@example.com', 'company': '',
+            'subject': 'Hallo', 'message': 'Test',
+        }
+        session.save()
+
+        with ResendStubServer(delay=2) as stub, override_settings(RESEND_API_URL=stub.url):
+            self.client.get('/icon-challenge/start/contact/')
+            count = self.client.session['icon_challenge:contact:count']
+            response = self.client.post('/icon-challenge/verify/contact/', {'count': count})
+
+        self.assertContains(response, 'Nachricht erfolgreich versendet')
+        self.assertEqual(stub.requests, 0)
+        email = OutboxEmail.objects.get(status=OutboxEmail.STATUS_PENDING)
+        self.assertEqual(email.payload['reply_to'], 'max@example.com')
+        self.assertEqual(email.followup['to'], 'max@example.com')  # Bestätigung erst nach Zustellung
+
+
+class ResendClientTests(TestCase):
+    def setUp(self):
+        resend.reset_session()
+
+    def test_connection_is_reused(self):
+        with ResendStubServer() as stub, override_settings(RESEND_API_URL=stub.url):
+            for _ in range(100):
+                resend.post_email(PAYLOAD)
+
+        self.assertEqual(stub.requests, 100)
+        self.assertEqual(stub.connections, 1)
+
+    def test_retry_does_not_wait_for_retry_after(self):
+        retry = resend.build_session().get_adapter('https://api.resend.com').max_retries
+
+        self.assertFalse(retry.respect_retry_after_header)
+        self.assertLessEqual(retry.backoff_max, 2)
+
+    def test_backend_sends_messages_as_one_batch(self):
+        messages = [EmailMessage('Test', 'Hallo', to=['a@example.com']) for _ in range(3)]
+
+        with ResendStubServer() as stub, override_settings(RESEND_API_URL=stub.url):
+            sent = ResendAPIBackend().send_messages(messages)
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(stub.requests, 1)
+        self.assertEqual(stub.received[0][0], '/emails/batch')
+        self.assertEqual(len(stub.received[0][1]), 3)
+
+    def test_backend_chunks_large_lists(self):
+        messages = [EmailMessage('Test', 'Hallo', to=[f'{i}@example.com']) for i in range(500)]
+
+        with ResendStubServer() as stub, override_settings(RESEND_API_URL=stub.url):
+            sent = ResendAPIBackend().send_messages(messages)
+
+        self.assertEqual(sent, 500)
+        self.assertEqual(stub.requests, 5)
+
+    def test_backend_reports_partial_failures(self):
+        messages = [EmailMessage('Test', 'Hallo', to=[f'{i}@example.com']) for i in range(150)]
+        bad = messages[120]
+
+        with ResendStubServer(reject=['120@example.com']) as stub, \
+                override_settings(RESEND_API_URL=stub.url):
+            backend = ResendAPIBackend(fail_silently=True)
+            sent = backend.send_messages(messages)
+
+            with self.assertRaises(ResendBatchError) as ctx:
+                ResendAPIBackend().send_messages(messages)
+
+        self.assertEqual(sent, 149)
+        self.assertEqual([message for message, error in backend.failures], [bad])
+        self.assertEqual(ctx.exception.sent_count, 149)
+
+
+# Login-Log direkt schreiben – kein Flush-Thread gegen die Test-DB
+@override_settings(LOGIN_LOG_BUFFER_ENABLED=False)
+class AboutPortfolioScreenshotTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        self.user = User.objects.create_user('anna', password='pw')
+        self.client.login(username='anna', password='pw')
+        PortfolioScreenshot.objects.create(title='B', image='b.png', section='auth', order=2)
+        PortfolioScreenshot.objects.create(title='A', image='a.png', section='auth', order=1)
+        PortfolioScreenshot.objects.create(title='C', image='c.png', section='apis')
+
+    def screenshot_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/about-this-portfolio/')
+        self.assertEqual(response.status_code, 200)
+        return [q for q in ctx.captured_queries if 'core_portfolioscreenshot' in q['sql']], response
+
+    def test_single_grouped_query(self):
+        queries, response = self.screenshot_queries()
+
+        self.assertLessEqual(len(queries), 1)
+        grouped = response.context['screenshots']
+        self.assertEqual(len(grouped), 6)
+        self.assertEqual([s.title for s in grouped['auth']], ['A', 'B'])
+        self.assertEqual(grouped['overview'], [])
+
+    def test_cached_until_screenshot_changes(self):
+        self.screenshot_queries()
+        queries, _ = self.screenshot_queries()
+        self.assertEqual(len(queries), 0)
+
+        PortfolioScreenshot.objects.create(title='D', image='d.png', section='overview')
+        self.assertEqual([s.title for s in get_grouped_screenshots()['overview']], ['D'])
+
+        PortfolioScreenshot.objects.filter(title='D').get().delete()
+        self.assertEqual(get_grouped_screenshots()['overview'], [])
+
+
+class UpdateListQueryTests(TestCase):
+    def setUp(self):
+        ColoredTag.objects.create(name='Django', slug='django', color='green')
+        ColoredTag.objects.create(name='HTMX', slug='htmx', color='blue')
+
+    def create_updates(self, count):
+        for i in range(count):
+            update = ProjectUpdate.objects.create(title=f'Update {i}', description='...')
+            update.tags.add('Django', 'HTMX')
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_query_count_independent_of_update_count(self):
+        for url in ('/current-project/', '/current-project/updates/?tags=django'):
+            with self.subTest(url=url):
+                ProjectUpdate.objects.all().delete()
+                self.create_updates(2)
+                few, _ = self.count_queries(url)
+
+                self.create_updates(8)
+                many, response = self.count_queries(url)
+
+                self.assertEqual(few, many)
+                self.assertEqual(response.context['update_count'], 10)
+
+
+class TagIndexTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        self.one = ProjectUpdate.objects.create(title='Eins', description='...')
+        self.two = ProjectUpdate.objects.create(title='Zwei', description='...')
+        self.one.tags.add('django')
+        self.two.tags.add('django', 'htmx')
+
+    def test_ranks_by_match_count(self):
+        updates = list(get_filtered_updates(['django', 'htmx']))
+
+        self.assertEqual(updates, [self.two, self.one])
+        self.assertEqual([u.tag_match_count for u in updates], [2, 1])
+
+    def test_invalidated_by_tag_and_update_changes(self):
+        self.assertEqual(tag_index.match_counts(['htmx']), {self.two.id: 1})
+
+        self.one.tags.add('htmx')
+        self.assertEqual(tag_index.match_counts(['htmx']), {self.one.id: 1, self.two.id: 1})
+
+        self.two.is_current = False
+        self.two.save()
+        self.assertEqual(tag_index.match_counts(['htmx']), {self.one.id: 1})
+
+        self.one.tags.remove('htmx')
+        self.assertEqual(tag_index.match_counts(['htmx']), {})
+
+    @override_settings(TAG_INDEX_CHECK_SECONDS=0)
+    def test_changes_without_shared_version_found_via_db(self):
+        self.assertEqual(tag_index.match_counts(['htmx']), {self.two.id: 1})
+
+        # Wie ein anderer Worker mit eigenem LocMem-Cache: keine neue Version hier
+        with mock.patch('core.tag_index.invalidate'):
+            self.one.tags.add('htmx')
+            self.assertEqual(tag_index.match_counts(['htmx']), {self.one.id: 1, self.two.id: 1})
+
+            self.two.delete()
+            self.assertEqual(tag_index.match_counts(['htmx']), {self.one.id: 1})
+
+    def test_neighbours_follow_list_order(self):
+        three = ProjectUpdate.objects.create(title='Drei', description='...')
+        three.tags.add('htmx')
+
+        for tags in ([], ['django', 'htmx'], ['htmx']):
+            with self.subTest(tags=tags):
+                ids = list(get_filtered_updates(tags).values_list('id', flat=True))
+                for i, update_id in enumerate(ids):
+                    prev_id = ids[i - 1] if i > 0 else None
+                    next_id = ids[i + 1] if i + 1 < len(ids) else None
+                    self.assertEqual(tag_index.neighbours(update_id, tags), (prev_id, next_id))
+
+        self.assertEqual(tag_index.neighbours(self.one.id, ['htmx']), (None, None))
+
+    def test_modal_links_neighbours(self):
+        response = self.client.get(f'/current-project/update/{self.one.id}/?tags=django')
+
+        self.assertEqual(response.context['prev_id'], self.two.id)
+        self.assertIsNone(response.context['next_id'])
+
+
+@override_settings(UPDATES_PAGE_SIZE=4)
+class UpdatePaginationTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        for i in range(11):
+            update = ProjectUpdate.objects.create(title=f'Update {i}', description='...')
+            update.tags.add(*(['django', 'htmx'] if i % 3 == 0 else ['django']))
+        # Gleicher Zeitstempel für mehrere Updates → id entscheidet
+        ProjectUpdate.objects.filter(title__in=['Update 3', 'Update 4', 'Update 5']).update(
+            created_at=ProjectUpdate.objects.get(title='Update 4').created_at
+        )
+
+    def walk(self, tags):
+        ids, cursor = [], None
+        while True:
+            page, cursor = get_update_page(tags, cursor)
+            ids += [update.id for update in page]
+            if cursor is None:
+                return ids
+
+    def test_cursor_walk_matches_full_order(self):
+        for tags in ([], ['django', 'htmx']):
+            with self.subTest(tags=tags):
+                expected = list(get_filtered_updates(tags).values_list('id', flat=True))
+                self.assertEqual(self.walk(tags), expected)
+
+    def test_first_page_and_loader(self):
+        response = self.client.get('/current-project/?tags=django')
+
+        self.assertEqual(len(response.context['updates']), 4)
+        self.assertEqual(response.context['update_count'], 11)
+        self.assertContains(response, 'hx-trigger="revealed"')
+
+    def test_next_page_renders_only_cards(self):
+        _, cursor = get_update_page([])
+        response = self.client.get('/current-project/updates/', {'cursor': cursor})
+
+        self.assertTemplateUsed(response, 'core/partials/update_list.html')
+        self.assertTemplateNotUsed(response, 'core/partials/filter_pills.html')
+        self.assertEqual(len(response.context['updates']), 4)
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        page, _ = get_update_page([], 'kaputt')
+        self.assertEqual(page, list(get_filtered_updates([])[:4]))
+
+
+class UpdateSearchTests(TestCase):
+    def setUp(self):
+        self.sse = ProjectUpdate.objects.create(
+            title='Server-Sent Events', description='Gemini-Tipps kommen als Stream.'
+        )
+        self.pool = ProjectUpdate.objects.create(
+            title='Challenge-Pool', description='Vorgenerierte Challenges.',
+            code_snippet='pool.pop(streaming=False)',
+        )
+
+    def test_ranked_and_maintained_on_save(self):
+        self.assertEqual(search_updates('stream'), [self.sse, self.pool])
+
+        self.pool.title = 'Pool ohne Treffer'
+        self.pool.code_snippet = ''
+        self.pool.save()
+        self.assertEqual(search_updates('stream'), [self.sse])
+
+        self.sse.delete()
+        self.assertEqual(search_updates('stream'), [])
+
+    def test_only_current_updates(self):
+        self.sse.is_current = False
+        self.sse.save()
+        self.assertEqual(search_updates('Gemini'), [])
+
+    def test_query_syntax_is_escaped(self):
+        self.assertEqual(search_updates('"Server* (-'), [self.sse])
+        self.assertEqual(search_updates('  '), [])
+
+    def test_htmx_partial(self):
+        response = self.client.get('/current-project/search/', {'q': 'pool'})
+
+        self.assertTemplateUsed(response, 'core/partials/search_results.html')
+        self.assertEqual(list(response.context['updates']), [self.pool])
+
+
+class UpdateCardCacheTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        caches['shared'].clear()
+        self.update = ProjectUpdate.objects.create(title='Karte', description='...')
+        self.update.tags.add('Django')
+
+    def test_cards_served_from_cache(self):
+        self.client.get('/current-project/')
+        # update() umgeht save(): updated_at + Tag-Version bleiben gleich
+        ProjectUpdate.objects.filter(pk=self.update.pk).update(title='Heimlich geändert')
+
+        self.assertNotContains(self.client.get('/current-project/'), 'Heimlich geändert')
+
+    def test_save_and_tag_changes_invalidate(self):
+        self.client.get('/current-project/')
+
+        self.update.title = 'Neuer Titel'
+        self.update.save()
+        self.assertContains(self.client.get('/current-project/'), 'Neuer Titel')
+
+        tag = ColoredTag.objects.get(name='Django')
+        tag.color = 'cyan'
+        tag.save()
+        self.assertContains(self.client.get('/current-project/'), 'bg-cyan-100')
+
+    def test_filter_specific_parts_not_shared(self):
+        self.client.get('/current-project/')
+        response = self.client.get('/current-project/updates/?tags=django')
+
+        self.assertContains(response, '1/1 Match')
+
+
+# Login-Log direkt schreiben – kein Flush-Thread gegen die Test-DB
+@override_settings(LOGIN_LOG_BUFFER_ENABLED=False)
+class PublicPageCacheTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        caches['shared'].clear()
+        Profile.objects.create(name='Martin', profile_image='profile/martin.png')
+
+    def test_anonymous_served_from_cache_with_etag(self):
+        first = self.client.get('/about/')
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get('/about/')
+
+        self.assertEqual(first['X-Page-Cache'], 'MISS')
+        self.assertEqual(second['X-Page-Cache'], 'HIT')
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(first.content, second.content)
+
+        not_modified = self.client.get('/about/', HTTP_IF_NONE_MATCH=second['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertIn('Last-Modified', second)
+
+    def test_cached_page_has_no_csrf_token_but_sets_cookie(self):
+        self.client.get('/skills/')
+        client = self.client_class()
+        response = client.get('/skills/')
+
+        self.assertEqual(response['X-Page-Cache'], 'HIT')
+        self.assertContains(response, '?.split("=")[1] || "";')
+        self.assertIn('csrftoken', response.cookies)
+
+    def test_profile_save_invalidates(self):
+        self.client.get('/about/')
+        profile = Profile.objects.get()
+        profile.name = 'Martin F.'
+        profile.save()
+
+        self.assertEqual(self.client.get('/about/')['X-Page-Cache'], 'MISS')
+
+    def test_profile_save_invalidates_again_after_commit(self):
+        profile = Profile.objects.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+            # Ein anderer Worker rendert den alten Stand, bevor der Commit durch ist
+            self.client.get('/about/')
+            self.assertEqual(self.client.get('/about/')['X-Page-Cache'], 'HIT')
+
+        self.assertEqual(self.client.get('/about/')['X-Page-Cache'], 'MISS')
+
+    def test_logged_in_users_bypass_cache(self):
+        User.objects.create_user('anna', password='pw')
+        self.client.get('/about/')
+        self.client.login(username='anna', password='pw')
+        response = self.client.get('/about/')
+
+        self.assertNotIn('X-Page-Cache', response)
+        self.assertIn('private', response['Cache-Control'])
+
+
+class SiteProfileTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        Profile.objects.create(name='Martin', profile_image='profile/martin.png')
+
+    def test_no_profile_queries_in_steady_state(self):
+        self.client.get('/contact/')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/contact/')
+
+        self.assertContains(response, 'alt="Martin"')
+        self.assertFalse(any('core_profile' in q['sql'] for q in ctx.captured_queries))
+
+    def test_profile_save_reloads(self):
+        self.client.get('/contact/')
+        profile = Profile.objects.get()
+        profile.name = 'Martin F.'
+        profile.save()
+
+        self.assertContains(self.client.get('/contact/'), 'alt="Martin F."')
+
+    def test_change_from_other_worker_seen_after_memo_expires(self):
+        self.client.get('/contact/')
+        # Wie ein anderer Worker mit eigenem LocMem-Cache: keine neue Version hier
+        Profile.objects.update(name='Martin F.')
+        self.assertContains(self.client.get('/contact/'), 'alt="Martin"')
+
+        with override_settings(PROFILE_MEMO_SECONDS=0):
+            self.assertContains(self.client.get('/contact/'), 'alt="Martin F."')
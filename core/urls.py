@@ -14,6 +14,7 @@ urlpatterns = [
      # ========== CURRENT PROJECT (NEU!) ==========
     path('current-project/', views.current_project, name='current_project'),
     path('current-project/updates/', views.update_list_htmx, name='update_list_htmx'),
+    path('current-project/search/', views.update_search_htmx, name='update_search_htmx'),
     path('current-project/update/<int:pk>/', views.update_detail_htmx, name='update_detail_htmx'),
     
 ]
\ No newline at end of file
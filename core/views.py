@@ -1,40 +1,48 @@
-import requests
+from datetime import datetime
+
 from django.shortcuts import render, get_object_or_404
 from django.contrib import messages
 from django.core.mail import EmailMessage
 from django.conf import settings
+from portfolio_site import resend
+from portfolio_site.page_cache import cache_public_page
 from projects.models import Project
-from .models import Profile, PortfolioScreenshot
+from .screenshots import get_grouped_screenshots
+from .search import search_updates
+from .tag_index import tag_index
 from django.http import HttpResponse
 from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Q
-from .models import ProjectUpdate, ColoredTag
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Case, IntegerField, Q, Value, When
+from .models import ProjectUpdate, ColoredTag, TaggedUpdate
 
 
+@cache_public_page
 def home(request):
-    profile = Profile.objects.first()
+    # profile kommt aus dem Context-Processor (core.context_processors)
     featured_projects = Project.objects.filter(is_public_demo=True)[:2]
     return render(
         request,
         "core/home.html",
-        {"profile": profile, "featured_projects": featured_projects},
+        {"featured_projects": featured_projects},
     )
 
 
+@cache_public_page
 def about(request):
-    profile = Profile.objects.first()
-    return render(request, "core/about.html", {"profile": profile})
+    return render(request, "core/about.html")
 
 
 def contact(request):
-    profile = Profile.objects.first()
-    return render(request, "core/contact.html", {"profile": profile})
+    return render(request, "core/contact.html")
 
 
+@cache_public_page
 def skills(request):
     return render(request, "core/skills.html")
 
+@cache_public_page
 def in_progress(request):
     """
     Generic 'In Progress' page für Features die entwickelt werden
@@ -48,16 +56,10 @@ def about_portfolio(request):
     Technische Dokumentation mit Screenshots.
     Nur für eingeloggte User (Guest oder Registered).
     """
-    # Screenshots nach Sektion gruppieren
-    screenshots = {
-        'overview': PortfolioScreenshot.objects.filter(section='overview'),
-        'architecture': PortfolioScreenshot.objects.filter(section='architecture'),
-        'auth': PortfolioScreenshot.objects.filter(section='auth'),
-        'deployment': PortfolioScreenshot.objects.filter(section='deployment'),
-        'challenges': PortfolioScreenshot.objects.filter(section='challenges'),
-        'apis': PortfolioScreenshot.objects.filter(section='apis'),
-    }
-    
+    # Screenshots nach Sektion gruppieren (eine Query, gecacht)
+    screenshots = get_grouped_screenshots()
+
+
     return render(request, 'core/about_portfolio.html', {
         'screenshots': screenshots
     })
@@ -116,13 +118,7 @@ Martin Freimuth
 Fullstack Developer
         """
 
-        # --- AB HIER DIE NEUE LOGIK (API statt SMTP) ---
-        resend_url = "https://api.resend.com/emails"
-        headers = {
-            "Authorization": f"Bearer {settings.RESEND_API_KEY}",
-            "Content-Type": "application/json",
-        }
-
+        # --- AB HIER DIE NEUE LOGIK (API statt SMTP, gemeinsamer Client) ---
         try:
             # 1. Email an DICH
             payload_to_me = {
@@ -132,9 +128,7 @@ Fullstack Developer
                 "reply_to": email,
                 "text": email_body_to_you,
             }
-            resp_me = requests.post(
-                resend_url, headers=headers, json=payload_to_me, timeout=10
-            )
+            resp_me = resend.post_email(payload_to_me)
 
             # --- ÄNDERUNG HIER: Wir prüfen auf .ok (Status 200-299) ---
             if resp_me.ok:
@@ -146,9 +140,7 @@ Fullstack Developer
                     "reply_to": "mat.frei@gmx.de",
                     "text": confirmation_body,
                 }
-                requests.post(
-                    resend_url, headers=headers, json=payload_to_user, timeout=10
-                )
+                resend.post_email(payload_to_user)
 
                 messages.success(request, "✅ Nachricht erfolgreich versendet! Ich melde mich in Kürze.")
             else:
@@ -173,11 +165,14 @@ Fullstack Developer
 def current_project(request):
     """Current Project - Full Page"""
     selected_tags = request.GET.getlist('tags')
-    updates = get_filtered_updates(selected_tags)
+    updates, next_cursor = get_update_page(selected_tags)
     all_tags = ColoredTag.objects.all().order_by('name')
     
     context = {
         'updates': updates,
+        'next_cursor': next_cursor,
+        'update_count': tag_index.count(selected_tags),  # Aus dem Index, ohne COUNT-Query
+        'tag_version': tag_index.version,  # Cache-Key der Update-Karten
         'all_tags': all_tags,
         'selected_tags': selected_tags,
     }
@@ -186,19 +181,49 @@ def current_project(request):
 
 
 def update_list_htmx(request):
-    """HTMX Partial: Filter Pills + Updates"""
+    """
+    HTMX Partial: Filter Pills + Updates
+    Mit ?cursor=... nur die nächste Seite (Infinite Scroll)
+    """
     selected_tags = request.GET.getlist('tags')
-    updates = get_filtered_updates(selected_tags)
-    all_tags = ColoredTag.objects.all().order_by('name')
+    cursor = request.GET.get('cursor')
+    updates, next_cursor = get_update_page(selected_tags, cursor)
     
     # Tag query für Modal
     tag_query = '&'.join([f'tags={tag}' for tag in selected_tags])
     
-    return render(request, 'core/partials/filter_and_updates.html', {
+    tag_index.ensure_fresh()
+    context = {
         'updates': updates,
-        'all_tags': all_tags,     # ← WICHTIG für Pills!
+        'next_cursor': next_cursor,
         'selected_tags': selected_tags,
         'tag_query': tag_query,
+        'tag_version': tag_index.version,  # Cache-Key der Update-Karten
+    }
+    
+    if cursor:
+        context['is_next_page'] = True
+        return render(request, 'core/partials/update_list.html', context)
+    
+    context['update_count'] = tag_index.count(selected_tags)
+    context['all_tags'] = ColoredTag.objects.all().order_by('name')  # ← WICHTIG für Pills!
+    return render(request, 'core/partials/filter_and_updates.html', context)
+
+
+def update_search_htmx(request):
+    """HTMX Partial: Volltextsuche (bester Treffer zuerst)"""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return update_list_htmx(request)
+    
+    updates = attach_tags(search_updates(query, limit=getattr(settings, 'UPDATE_SEARCH_LIMIT', 20)))
+    tag_index.ensure_fresh()
+    
+    return render(request, 'core/partials/search_results.html', {
+        'updates': updates,
+        'search_query': query,
+        'selected_tags': [],
+        'tag_version': tag_index.version,  # Cache-Key der Update-Karten
     })
 
 
@@ -207,16 +232,8 @@ def update_detail_htmx(request, pk):
     update = get_object_or_404(ProjectUpdate, pk=pk)
     selected_tags = request.GET.getlist('tags')
     
-    # Next/Previous (berücksichtigt Filter!)
-    filtered_updates = get_filtered_updates(selected_tags)
-    update_ids = list(filtered_updates.values_list('id', flat=True))
-    
-    try:
-        current_index = update_ids.index(update.id)
-        next_id = update_ids[current_index + 1] if current_index + 1 < len(update_ids) else None
-        prev_id = update_ids[current_index - 1] if current_index > 0 else None
-    except (ValueError, IndexError):
-        next_id = prev_id = None
+    # Next/Previous (berücksichtigt Filter!) – Positions-Map statt Liste durchsuchen
+    prev_id, next_id = tag_index.neighbours(update.id, selected_tags)
     
     # Query-String für Filter
     tag_query = '&'.join([f'tags={tag}' for tag in selected_tags])
@@ -236,16 +253,105 @@ def get_filtered_updates(selected_tags):
     
     if selected_tags:
         # Smart Sorting: Meiste Tag-Matches zuerst!
+        # Treffer zählt der In-Memory Tag-Index, die DB filtert nur noch nach ID
+        match_counts = tag_index.match_counts(selected_tags)
+        ids_by_count = {}
+        for update_id, count in match_counts.items():
+            ids_by_count.setdefault(count, []).append(update_id)
+        
         updates = updates.filter(
-            tags__slug__in=selected_tags
+            id__in=list(match_counts)
         ).annotate(
-            tag_match_count=Count('tags', filter=Q(tags__slug__in=selected_tags))
-        ).filter(
-            tag_match_count__gt=0
-        ).order_by('-tag_match_count', '-created_at').distinct()
+            tag_match_count=Case(
+                *[When(id__in=ids, then=Value(count)) for count, ids in ids_by_count.items()],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        ).order_by('-tag_match_count', '-created_at', '-id')
     else:
-        updates = updates.order_by('-created_at')
+        updates = updates.order_by('-created_at', '-id')
+    
+    return updates
+
+
+# ==================== KEYSET PAGINATION ====================
+# Cursor = Sortierschlüssel des letzten Updates der Seite:
+#   ohne Filter: created_at~id
+#   mit Filter:  tag_match_count~created_at~id
+
+
+def encode_cursor(update, filtered):
+    parts = [update.created_at.isoformat(), str(update.id)]
+    if filtered:
+        parts.insert(0, str(update.tag_match_count))
+    return '~'.join(parts)
+
+
+def parse_cursor(value, filtered):
+    """
+    Returns:
+        tuple | None: Ungültige Cursor → None (= erste Seite)
+    """
+    try:
+        parts = value.split('~')
+        if filtered:
+            match_count, created_at, update_id = parts
+            return int(match_count), datetime.fromisoformat(created_at), int(update_id)
+        created_at, update_id = parts
+        return datetime.fromisoformat(created_at), int(update_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+def get_update_page(selected_tags, cursor=None):
+    """
+    Eine Seite Updates nach dem Cursor (WHERE statt OFFSET → konstant schnell)
+    
+    Returns:
+        tuple: (updates, next_cursor) – next_cursor None auf der letzten Seite
+    """
+    page_size = getattr(settings, 'UPDATES_PAGE_SIZE', 10)
+    filtered = bool(selected_tags)
+    updates = get_filtered_updates(selected_tags)
+    
+    position = parse_cursor(cursor, filtered) if cursor else None
+    if position and filtered:
+        match_count, created_at, update_id = position
+        updates = updates.filter(
+            Q(tag_match_count__lt=match_count)
+            | Q(tag_match_count=match_count, created_at__lt=created_at)
+            | Q(tag_match_count=match_count, created_at=created_at, id__lt=update_id)
+        )
+    elif position:
+        created_at, update_id = position
+        updates = updates.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=update_id)
+        )
+    
+    page = list(updates[:page_size + 1])
+    if len(page) <= page_size:
+        return attach_tags(page), None
+    return attach_tags(page[:page_size]), encode_cursor(page[page_size - 1], filtered)
+
+
+def attach_tags(updates):
+    """
+    Tags aller Updates mit einer Query laden → update.tag_list
+    
+    Günstiger als prefetch_related('tags'): taggit baut dabei pro Update
+    einen eigenen Manager-Queryset.
+    """
+    content_type = ContentType.objects.get_for_model(ProjectUpdate)
+    items = TaggedUpdate.objects.filter(
+        content_type=content_type,
+        object_id__in=[update.id for update in updates],
+    ).select_related('tag').order_by('tag__name')
     
+    tags_by_update = {}
+    for item in items:
+        tags_by_update.setdefault(item.object_id, []).append(item.tag)
+    for update in updates:
+        update.tag_list = tags_by_update.get(update.id, [])
     return updates
 
 
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class IconChallengeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'icon_challenge'
+
+    def ready(self):
+        import icon_challenge.checks
@@ -0,0 +1,22 @@
+"""
+Icon-Challenge System Checks
+"""
+
+from django.core.checks import Warning, register
+
+from .sprite import SPRITE_NAME, sprite_path
+
+
+@register()
+def check_icon_sprite(app_configs, **kwargs):
+    """Warne, wenn das Sprite nicht zum aktuellen ICON_POOL passt"""
+    if sprite_path().exists():
+        return []
+
+    return [
+        Warning(
+            f"Icon-Sprite '{SPRITE_NAME}' fehlt oder ist veraltet.",
+            hint="python manage.py build_icon_sprite ausführen.",
+            id='icon_challenge.W001',
+        )
+    ]
@@ -5,7 +5,91 @@ Core Logic für Challenge-Generierung und Verifizierung
 
 import random
 import time
+import uuid
+from django.conf import settings
+from django.core import signing
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 from .config import ICON_POOL, CHALLENGE_CONTEXTS
+from .pool import ChallengePool
+from .ratelimit import get_client_ip, get_rate_limiter
+from .sprite import icon_ref
+from .tokens import check_token, consume_nonce, make_token
+
+
+# ============================================
+# CHALLENGE-GENERIERUNG (ohne Request/Session)
+# ============================================
+
+def build_challenge(context_type):
+    """
+    Baue eine komplette Challenge inkl. vorgerendertem Grid-HTML
+    
+    Kennt weder Request noch Session – kann daher im Voraus
+    (Challenge-Pool) generiert werden.
+    """
+    config = CHALLENGE_CONTEXTS[context_type]
+    grid_size = config['grid_size']  # 9
+    min_count = config['min_count']  # 2
+    max_count = config['max_count']  # 4
+    
+    # 1. Wähle 3 verschiedene Icon-Typen aus Pool
+    icon_names = list(ICON_POOL.keys())
+    selected_types = random.sample(icon_names, 3)
+    
+    # 2. Wähle eines als Target (das gezählt wird)
+    target_icon = random.choice(selected_types)
+    
+    # 3. Bestimme, wie oft Target vorkommt (2-4)
+    correct_count = random.randint(min_count, max_count)
+    
+    # 4. Erstelle Icon-Liste
+    icons = [target_icon] * correct_count
+    
+    # Fülle Rest mit anderen Icons auf
+    other_icons = [icon for icon in selected_types if icon != target_icon]
+    while len(icons) < grid_size:
+        icons.append(random.choice(other_icons))
+    
+    # 5. Shuffle (damit Target nicht immer oben links ist)
+    random.shuffle(icons)
+    
+    # 6. Konvertiere zu (name, <use>-Referenz) Tupeln + Grid vorrendern
+    icons_with_svg = [(name, icon_ref(name)) for name in icons]
+    grid_html = render_to_string(
+        'icon_challenge/partials/grid.html', {'icons': icons_with_svg}
+    )
+    
+    return {
+        'icons': icons_with_svg,
+        'icon_names': icons,
+        'target_icon': target_icon,
+        'correct_count': correct_count,
+        'target_svg': icon_ref(target_icon),
+        'grid_html': mark_safe(grid_html),
+    }
+
+
+_pools = {}
+
+
+def get_pool(context_type):
+    """
+    Challenge-Pool für einen Context (lazy, einer pro Prozess)
+    
+    Größe, Low-Water-Mark + Refill-Pause über settings:
+        ICON_CHALLENGE_POOL_SIZE, ICON_CHALLENGE_POOL_LOW_WATER,
+        ICON_CHALLENGE_POOL_REFILL_PAUSE
+    """
+    pool = _pools.get(context_type)
+    if pool is None:
+        pool = _pools.setdefault(context_type, ChallengePool(
+            factory=lambda: build_challenge(context_type),
+            size=getattr(settings, 'ICON_CHALLENGE_POOL_SIZE', 20),
+            low_water=getattr(settings, 'ICON_CHALLENGE_POOL_LOW_WATER', 5),
+            refill_pause=getattr(settings, 'ICON_CHALLENGE_POOL_REFILL_PAUSE', 0.002),
+        ))
+    return pool
 
 
 class IconChallengeEngine:
@@ -27,6 +111,13 @@ class IconChallengeEngine:
         
         # Session-Keys (eindeutig pro Context)
         self.session_prefix = f'icon_challenge:{context_type}'
+        
+        # Rate-Limit-Key: Client-IP + Context (unabhängig vom Session-Cookie)
+        self.rate_limiter = get_rate_limiter()
+        self.rate_limit_key = f'icon_challenge:rl:{context_type}:{get_client_ip(request)}'
+        
+        # Stateless: Antwort steckt signiert im Token statt in der Session
+        self.stateless = getattr(settings, 'ICON_CHALLENGE_STATELESS', False)
     
     
     def generate_challenge(self):
@@ -35,55 +126,32 @@ class IconChallengeEngine:
         
         Returns:
             dict: {
-                'icons': [(name, svg), ...],  # 9 Icons für Grid
+                'icons': [(name, svg), ...],  # 9 Icons (Sprite-Referenzen)
                 'target_icon': 'heart',       # Welches Icon zählen?
                 'correct_count': 3,           # Wie oft kommt es vor?
-                'target_svg': '<svg>...',     # SVG des Target-Icons
+                'target_svg': '<svg><use>',   # Sprite-Referenz des Target-Icons
+                'grid_html': '<div>...',      # Vorgerendertes 3×3 Grid
+                'token': '...',               # Nur im Stateless-Modus
             }
         """
-        grid_size = self.config['grid_size']  # 9
-        min_count = self.config['min_count']  # 2
-        max_count = self.config['max_count']  # 4
-        
-        # 1. Wähle 3 verschiedene Icon-Typen aus Pool
-        icon_names = list(ICON_POOL.keys())
-        selected_types = random.sample(icon_names, 3)
-        
-        # 2. Wähle eines als Target (das gezählt wird)
-        target_icon = random.choice(selected_types)
-        
-        # 3. Bestimme, wie oft Target vorkommt (2-4)
-        correct_count = random.randint(min_count, max_count)
-        
-        # 4. Erstelle Icon-Liste
-        icons = []
-        
-        # Füge Target-Icons hinzu
-        for _ in range(correct_count):
-            icons.append(target_icon)
-        
-        # Fülle Rest mit anderen Icons auf
-        other_icons = [icon for icon in selected_types if icon != target_icon]
-        while len(icons) < grid_size:
-            icons.append(random.choice(other_icons))
-        
-        # 5. Shuffle (damit Target nicht immer oben links ist)
-        random.shuffle(icons)
+        if getattr(settings, 'ICON_CHALLENGE_POOL_ENABLED', True):
+            challenge = get_pool(self.context_type).pop()
+        else:
+            challenge = build_challenge(self.context_type)
         
-        # 6. Konvertiere zu (name, svg) Tupeln
-        icons_with_svg = [(name, ICON_POOL[name]) for name in icons]
+        if self.stateless:
+            # Kein Session-Write: Token wird im Modal mitgeschickt
+            token = make_token(self.context_type, challenge['correct_count'])
+            return {**challenge, 'token': token}
         
-        # 7. Speichere in Session
-        self.request.session[f'{self.session_prefix}:target'] = target_icon
-        self.request.session[f'{self.session_prefix}:count'] = correct_count
-        self.request.session[f'{self.session_prefix}:icons'] = icons
+        # Speichere in Session (Nonce: jede Challenge nur ein Versuch,
+        # verbraucht wird sie im Cache – der Verify-Request schreibt nichts)
+        self.request.session[f'{self.session_prefix}:nonce'] = uuid.uuid4().hex
+        self.request.session[f'{self.session_prefix}:target'] = challenge['target_icon']
+        self.request.session[f'{self.session_prefix}:count'] = challenge['correct_count']
+        self.request.session[f'{self.session_prefix}:icons'] = challenge['icon_names']
         
-        return {
-            'icons': icons_with_svg,
-            'target_icon': target_icon,
-            'correct_count': correct_count,
-            'target_svg': ICON_POOL[target_icon],
-        }
+        return challenge
     
     
     def verify_attempt(self, user_count):
@@ -106,18 +174,18 @@ class IconChallengeEngine:
         if rate_limit['blocked']:
             return rate_limit
         
-        # 2. Korrekte Antwort aus Session holen
-        correct_count = self.request.session.get(f'{self.session_prefix}:count')
+        # 2. Antwort prüfen (Token oder Session)
+        is_correct = self._check_answer(user_count)
         
-        if correct_count is None:
+        if is_correct is None:
             return {
                 'success': False,
                 'message': 'Session abgelaufen. Bitte neu starten.',
                 'blocked': False,
             }
         
-        # 3. Vergleichen
-        if int(user_count) == correct_count:
+        # 3. Ergebnis
+        if is_correct:
             # ✅ KORREKT!
             self._reset_attempts()
             return {
@@ -127,11 +195,9 @@ class IconChallengeEngine:
             }
         else:
             # ❌ FALSCH!
-            self._increment_attempts()
-            attempts = self.request.session.get(f'{self.session_prefix}:attempts', 0)
-            
-            # Neue Challenge generieren für nächsten Versuch
-            self.generate_challenge()
+            # Alte Antwort ist schon ungültig (Nonce bzw. Token verbraucht),
+            # die neue Challenge lädt das Modal über /start/ nach
+            attempts = self._increment_attempts()
             
             return {
                 'success': False,
@@ -140,6 +206,30 @@ class IconChallengeEngine:
             }
     
     
+    def _check_answer(self, user_count):
+        """
+        Vergleiche Antwort mit Token (Stateless) oder Session
+        
+        Returns:
+            True/False, oder None wenn Challenge abgelaufen/unbekannt
+        """
+        if self.stateless:
+            try:
+                return check_token(
+                    self.request.POST.get('token', ''), self.context_type, user_count
+                )
+            except signing.BadSignature:
+                return None
+        
+        correct_count = self.request.session.get(f'{self.session_prefix}:count')
+        nonce = self.request.session.get(f'{self.session_prefix}:nonce')
+        if correct_count is None or nonce is None:
+            return None
+        if not consume_nonce(nonce, settings.SESSION_COOKIE_AGE):
+            return None  # Diese Challenge wurde schon beantwortet
+        return int(user_count) == correct_count
+    
+    
     def _check_rate_limit(self):
         """
         Prüfe Rate Limiting (3→30s, 5→60s)
@@ -147,8 +237,7 @@ class IconChallengeEngine:
         Returns:
             dict: {'blocked': True/False, 'wait_time': seconds, ...}
         """
-        attempts = self.request.session.get(f'{self.session_prefix}:attempts', 0)
-        last_attempt = self.request.session.get(f'{self.session_prefix}:last_attempt', 0)
+        attempts, last_attempt = self.rate_limiter.get_state(self.rate_limit_key)
         current_time = time.time()
         time_passed = current_time - last_attempt
         
@@ -180,22 +269,21 @@ class IconChallengeEngine:
         
         # Silent Reset nach Cooldown
         if time_passed >= cooldown_3 and attempts >= 3:
-            self.request.session[f'{self.session_prefix}:attempts'] = 1
+            self.rate_limiter.set_attempts(self.rate_limit_key, 1, cooldown_5)
         
         return {'blocked': False}
     
     
     def _increment_attempts(self):
-        """Erhöhe Fehlversuch-Counter"""
-        attempts = self.request.session.get(f'{self.session_prefix}:attempts', 0)
-        self.request.session[f'{self.session_prefix}:attempts'] = attempts + 1
-        self.request.session[f'{self.session_prefix}:last_attempt'] = time.time()
+        """Erhöhe Fehlversuch-Counter (atomar im Cache)"""
+        return self.rate_limiter.increment(
+            self.rate_limit_key, window=self.config['cooldown_5']
+        )
     
     
     def _reset_attempts(self):
         """Reset Counter (nach erfolgreichem Versuch)"""
-        self.request.session[f'{self.session_prefix}:attempts'] = 0
-        self.request.session[f'{self.session_prefix}:last_attempt'] = 0
+        self.rate_limiter.reset(self.rate_limit_key)
     
     
     def cleanup(self):
@@ -203,11 +291,10 @@ class IconChallengeEngine:
         Räume Session auf (nach erfolgreichem Login)
         """
         keys_to_delete = [
+            f'{self.session_prefix}:nonce',
             f'{self.session_prefix}:target',
             f'{self.session_prefix}:count',
             f'{self.session_prefix}:icons',
-            f'{self.session_prefix}:attempts',
-            f'{self.session_prefix}:last_attempt',
         ]
         
         for key in keys_to_delete:
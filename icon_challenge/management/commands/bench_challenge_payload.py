@@ -0,0 +1,35 @@
+"""
+Benchmark: Payload-Größe der Challenge mit Sprite-Referenzen vs. Inline-SVG
+
+Usage:
+    python manage.py bench_challenge_payload --challenges 200
+"""
+
+from django.core.management.base import BaseCommand
+
+from icon_challenge.config import ICON_POOL
+from icon_challenge.engine import build_challenge
+from icon_challenge.sprite import icon_ref
+
+
+class Command(BaseCommand):
+    help = "Vergleicht Icon-Bytes pro Challenge (Sprite-Referenzen vs. Inline-SVG)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--challenges", type=int, default=200)
+        parser.add_argument("--context", default="guest")
+
+    def handle(self, *args, **options):
+        inline_bytes = sprite_bytes = 0
+
+        for _ in range(options["challenges"]):
+            challenge = build_challenge(options["context"])
+            # 9 Grid-Icons + Target-Icon im Header
+            names = challenge["icon_names"] + [challenge["target_icon"]]
+            inline_bytes += sum(len(ICON_POOL[name].encode()) for name in names)
+            sprite_bytes += sum(len(icon_ref(name).encode()) for name in names)
+
+        count = options["challenges"]
+        self.stdout.write(f"Inline-SVG : {inline_bytes / count:.0f} Bytes/Challenge")
+        self.stdout.write(f"Sprite-Refs: {sprite_bytes / count:.0f} Bytes/Challenge")
+        self.stdout.write(f"Faktor     : {inline_bytes / sprite_bytes:.1f}x")
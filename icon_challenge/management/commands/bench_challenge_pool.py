@@ -0,0 +1,54 @@
+"""
+Benchmark: start_challenge mit und ohne Challenge-Pool
+
+Usage:
+    python manage.py bench_challenge_pool --requests 2000
+"""
+
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+
+from icon_challenge import engine
+from icon_challenge.views import start_challenge
+
+
+class Command(BaseCommand):
+    help = "Vergleicht p50/p99-Latenz von start_challenge mit/ohne Pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--context", default="guest")
+
+    def handle(self, *args, **options):
+        for enabled in (False, True):
+            with override_settings(ICON_CHALLENGE_POOL_ENABLED=enabled):
+                if enabled:
+                    engine.get_pool(options["context"]).fill()
+                timings = self._run(options["requests"], options["context"])
+
+            label = "mit Pool " if enabled else "ohne Pool"
+            quantiles = statistics.quantiles(timings, n=100)
+            self.stdout.write(
+                f"{label}: p50={quantiles[49]:.3f}ms  p99={quantiles[98]:.3f}ms"
+            )
+
+    def _run(self, count, context_type):
+        factory = RequestFactory()
+        middleware = SessionMiddleware(lambda request: None)
+        timings = []
+
+        for _ in range(count):
+            request = factory.get(f"/icon-challenge/start/{context_type}/")
+            middleware.process_request(request)
+            request.user = AnonymousUser()
+
+            start = time.perf_counter()
+            start_challenge(request, context_type)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return timings
@@ -0,0 +1,19 @@
+"""
+Build-Step: ICON_POOL → gehashte SVG-Sprite-Datei
+
+Usage:
+    python manage.py build_icon_sprite
+    python manage.py collectstatic --noinput
+"""
+
+from django.core.management.base import BaseCommand
+
+from icon_challenge.sprite import write_sprite
+
+
+class Command(BaseCommand):
+    help = "Kompiliert ICON_POOL in icon_challenge/static/icon_challenge/sprite.<hash>.svg"
+
+    def handle(self, *args, **options):
+        path = write_sprite()
+        self.stdout.write(self.style.SUCCESS(f"Sprite geschrieben: {path}"))
@@ -0,0 +1,82 @@
+"""
+Icon-Challenge Pool
+Vorgenerierte Challenges pro Context, asynchron nachgefüllt
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class ChallengePool:
+    """
+    Thread-sicherer Vorrat an fertigen Challenges für einen Context.
+
+    Ein Request holt nur noch einen Eintrag ab (pop). Fällt der Vorrat
+    unter die Low-Water-Mark, füllt ein Hintergrund-Thread wieder auf –
+    einen Eintrag pro Schritt mit Pause dazwischen, damit er den Requests
+    nicht am Stück die GIL wegnimmt (p99-Latenz).
+    """
+
+    def __init__(self, factory, size=20, low_water=5, refill_pause=0.002):
+        """
+        Args:
+            factory: Callable ohne Argumente, liefert eine neue Challenge
+            size: Ziel-Größe des Pools
+            low_water: Ab dieser Größe wird nachgefüllt
+            refill_pause: Sekunden Pause zwischen zwei Einträgen im Refill-Thread
+        """
+        self.factory = factory
+        self.size = size
+        self.low_water = min(low_water, size)
+        self.refill_pause = refill_pause
+
+        self._entries = deque()
+        self._lock = threading.Lock()
+        self._refilling = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def pop(self):
+        """
+        Hole eine Challenge aus dem Pool
+
+        Ist der Pool leer (z.B. direkt nach dem Start), wird synchron
+        generiert – der Request wartet also nie auf den Refill-Thread.
+        """
+        try:
+            entry = self._entries.popleft()
+        except IndexError:
+            entry = self.factory()
+
+        if len(self._entries) <= self.low_water:
+            self._schedule_refill()
+
+        return entry
+
+    def fill(self):
+        """Fülle den Pool synchron bis zur Ziel-Größe auf"""
+        while len(self._entries) < self.size:
+            self._entries.append(self.factory())
+
+    def clear(self):
+        self._entries.clear()
+
+    def _schedule_refill(self):
+        with self._lock:
+            if self._refilling:
+                return
+            self._refilling = True
+
+        thread = threading.Thread(target=self._refill, daemon=True)
+        thread.start()
+
+    def _refill(self):
+        try:
+            while len(self._entries) < self.size:
+                self._entries.append(self.factory())
+                time.sleep(self.refill_pause)  # GIL an wartende Requests abgeben
+        finally:
+            with self._lock:
+                self._refilling = False
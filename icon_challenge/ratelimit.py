@@ -0,0 +1,84 @@
+"""
+Icon-Challenge Rate Limiting
+Fehlversuch-Counter im Cache (pro IP + Context) statt in der Session
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+
+class CacheRateLimiter:
+    """
+    Rate-Limit-Backend auf Basis von Django's Cache-Framework
+
+    Welcher Cache genutzt wird, steuert ICON_CHALLENGE_RATELIMIT_CACHE
+    (LocMemCache für einen Prozess, FileBasedCache für mehrere Worker
+    auf einem Node). Die Datenbank wird nie angefasst.
+    """
+
+    def __init__(self, cache_alias=None):
+        alias = cache_alias or getattr(settings, 'ICON_CHALLENGE_RATELIMIT_CACHE', 'default')
+        self.cache = caches[alias]
+
+    def get_state(self, key):
+        """
+        Returns:
+            tuple: (attempts, last_attempt)
+        """
+        values = self.cache.get_many([f'{key}:attempts', f'{key}:last_attempt'])
+        return values.get(f'{key}:attempts', 0), values.get(f'{key}:last_attempt', 0)
+
+    def increment(self, key, window):
+        """
+        Erhöhe Counter atomar + verlängere das Zeitfenster (sliding)
+
+        Returns:
+            int: neue Anzahl Fehlversuche
+        """
+        attempts_key = f'{key}:attempts'
+        self.cache.add(attempts_key, 0, window)
+        try:
+            attempts = self.cache.incr(attempts_key)
+        except ValueError:
+            # Key ist zwischen add() und incr() abgelaufen
+            self.cache.set(attempts_key, 1, window)
+            attempts = 1
+
+        self.cache.touch(attempts_key, window)
+        self.cache.set(f'{key}:last_attempt', time.time(), window)
+        return attempts
+
+    def set_attempts(self, key, attempts, window):
+        self.cache.set(f'{key}:attempts', attempts, window)
+
+    def reset(self, key):
+        self.cache.delete_many([f'{key}:attempts', f'{key}:last_attempt'])
+
+
+def get_rate_limiter():
+    """
+    Konfiguriertes Rate-Limit-Backend (ICON_CHALLENGE_RATELIMIT_BACKEND)
+    """
+    backend = getattr(
+        settings,
+        'ICON_CHALLENGE_RATELIMIT_BACKEND',
+        'icon_challenge.ratelimit.CacheRateLimiter',
+    )
+    return import_string(backend)()
+
+
+def get_client_ip(request):
+    """
+    Client-IP für den Rate-Limit-Key
+
+    Hinter dem Railway-Proxy steht die echte IP als letzter Eintrag
+    in X-Forwarded-For (vom Proxy selbst angehängt). Ohne Proxy kann jeder
+    Client den Header setzen – daher nur mit ICON_CHALLENGE_TRUST_X_FORWARDED_FOR.
+    """
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if forwarded and getattr(settings, 'ICON_CHALLENGE_TRUST_X_FORWARDED_FOR', False):
+        return forwarded.split(',')[-1].strip()
+    return request.META.get('REMOTE_ADDR', '')
@@ -0,0 +1,88 @@
+"""
+Icon-Challenge Sprite
+ICON_POOL als eine gehashte SVG-Sprite-Datei (<symbol>) statt Inline-SVGs
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.templatetags.static import static
+from django.utils.safestring import mark_safe
+
+from .config import ICON_POOL
+
+
+SPRITE_DIR = Path(__file__).resolve().parent / 'static' / 'icon_challenge'
+
+# <svg viewBox="..." width="24" height="24" ...>INNER</svg>
+SVG_PATTERN = re.compile(r'^<svg([^>]*)>(.*)</svg>$', re.DOTALL)
+SIZE_ATTR_PATTERN = re.compile(r'\s(width|height)="[^"]*"')
+
+
+def build_sprite_markup():
+    """
+    Kompiliere ICON_POOL zu einem SVG-Sprite
+
+    Jedes Icon wird ein <symbol id="icon-<name>">, width/height
+    fallen weg (Größe kommt vom referenzierenden <svg>).
+    """
+    symbols = []
+    for name, svg in ICON_POOL.items():
+        match = SVG_PATTERN.match(svg.strip())
+        if match is None:
+            raise ValueError(f"Icon '{name}' ist kein gültiges <svg>-Element")
+
+        attrs = SIZE_ATTR_PATTERN.sub('', match.group(1))
+        symbols.append(f'<symbol id="icon-{name}"{attrs}>{match.group(2)}</symbol>')
+
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+        + ''.join(symbols)
+        + '</svg>\n'
+    )
+
+
+SPRITE_MARKUP = build_sprite_markup()
+SPRITE_HASH = hashlib.sha256(SPRITE_MARKUP.encode()).hexdigest()[:12]
+
+# Hash im Dateinamen → WhiteNoise liefert "immutable" aus
+SPRITE_NAME = f'icon_challenge/sprite.{SPRITE_HASH}.svg'
+
+
+def sprite_path():
+    return SPRITE_DIR / f'sprite.{SPRITE_HASH}.svg'
+
+
+def write_sprite():
+    """
+    Schreibe die Sprite-Datei (alte Versionen werden entfernt)
+
+    Returns:
+        Path: Pfad der geschriebenen Datei
+    """
+    SPRITE_DIR.mkdir(parents=True, exist_ok=True)
+    for old in SPRITE_DIR.glob('sprite.*.svg'):
+        old.unlink()
+
+    path = sprite_path()
+    path.write_text(SPRITE_MARKUP, encoding='utf-8')
+    return path
+
+
+@lru_cache(maxsize=None)
+def icon_ref(name):
+    """
+    Kleines <svg><use> Snippet für ein Icon aus dem Sprite
+
+    Usage:
+        icon_ref('heart')  # '<svg ...><use href="/static/...svg#icon-heart"/></svg>'
+    """
+    if name not in ICON_POOL:
+        raise KeyError(name)
+
+    return mark_safe(
+        f'<svg viewBox="0 0 24 24" width="24" height="24">'
+        f'<use href="{static(SPRITE_NAME)}#icon-{name}"/></svg>'
+    )
@@ -1,3 +1,179 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .config import CHALLENGE_CONTEXTS, ICON_POOL
+from .engine import build_challenge
+from .pool import ChallengePool
+from .sprite import SPRITE_MARKUP, icon_ref, sprite_path
+from .tokens import TokenReplayed, check_token, make_token
+
+
+class ChallengePoolTests(TestCase):
+    def test_build_challenge_counts_target(self):
+        challenge = build_challenge('guest')
+        config = CHALLENGE_CONTEXTS['guest']
+
+        self.assertEqual(len(challenge['icon_names']), config['grid_size'])
+        self.assertEqual(
+            challenge['icon_names'].count(challenge['target_icon']),
+            challenge['correct_count'],
+        )
+        self.assertIn('grid-cols-3', challenge['grid_html'])
+
+    def test_pop_falls_back_to_factory_when_empty(self):
+        pool = ChallengePool(factory=lambda: 'fresh', size=3, low_water=1)
+        self.assertEqual(pool.pop(), 'fresh')
+
+    def test_fill_reaches_target_size(self):
+        pool = ChallengePool(factory=object, size=4, low_water=1)
+        pool.fill()
+        self.assertEqual(len(pool), 4)
+
+    def test_refill_pauses_after_each_entry(self):
+        pool = ChallengePool(factory=object, size=4, low_water=1, refill_pause=0.01)
+        with mock.patch('icon_challenge.pool.time.sleep') as sleep:
+            pool._refill()
+
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(sleep.call_args_list, [mock.call(0.01)] * 4)
+
+    def test_start_challenge_stores_session_keys(self):
+        response = self.client.get('/icon-challenge/start/guest/')
+        session = self.client.session
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('icon_challenge:guest:target', session)
+        self.assertIn('icon_challenge:guest:count', session)
+        self.assertIn('icon_challenge:guest:icons', session)
+
+
+class IconSpriteTests(TestCase):
+    def test_sprite_contains_every_icon(self):
+        for name in ICON_POOL:
+            self.assertIn(f'<symbol id="icon-{name}"', SPRITE_MARKUP)
+
+    def test_sprite_file_is_built(self):
+        self.assertTrue(sprite_path().exists())
+
+    def test_icon_ref_is_smaller_than_inline_svg(self):
+        inline = sum(len(svg) for svg in ICON_POOL.values())
+        refs = sum(len(icon_ref(name)) for name in ICON_POOL)
+        self.assertLess(refs, inline)
+
+
+class RateLimitTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+
+    def _fail_once(self, client):
+        client.get('/icon-challenge/start/guest/')
+        count = client.session['icon_challenge:guest:count']
+        wrong = 1 if count != 1 else 5
+        return client.post('/icon-challenge/verify/guest/', {'count': wrong})
+
+    def test_blocks_after_three_failures(self):
+        for _ in range(3):
+            self._fail_once(self.client)
+
+        response = self._fail_once(self.client)
+        self.assertContains(response, 'Zu viele Versuche')
+
+    def test_new_session_does_not_reset_limit(self):
+        for _ in range(3):
+            self._fail_once(self.client)
+
+        response = self._fail_once(Client())
+        self.assertContains(response, 'Zu viele Versuche')
+
+    def test_limit_is_per_ip(self):
+        for _ in range(3):
+            self._fail_once(self.client)
+
+        response = self._fail_once(Client(REMOTE_ADDR='10.0.0.2'))
+        self.assertNotContains(response, 'Zu viele Versuche')
+
+    def _wrong_answer(self):
+        count = self.client.session['icon_challenge:guest:count']
+        return {'count': 1 if count != 1 else 5}
+
+    def test_wrong_answer_writes_no_database_row(self):
+        self.client.get('/icon-challenge/start/guest/')
+        data = self._wrong_answer()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post('/icon-challenge/verify/guest/', data)
+
+        self.assertContains(response, 'Falsch')
+        writes = [q['sql'] for q in ctx.captured_queries
+                  if q['sql'].split()[0] in ('INSERT', 'UPDATE', 'DELETE')]
+        self.assertEqual(writes, [])
+
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.cached_db')
+    def test_wrong_answer_with_cached_db_sessions_runs_no_query(self):
+        self.client.get('/icon-challenge/start/guest/')
+        data = self._wrong_answer()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post('/icon-challenge/verify/guest/', data)
+
+        self.assertEqual(ctx.captured_queries, [])
+
+    def test_challenge_is_single_attempt(self):
+        self.client.get('/icon-challenge/start/guest/')
+        count = self.client.session['icon_challenge:guest:count']
+        self.client.post('/icon-challenge/verify/guest/', self._wrong_answer())
+
+        response = self.client.post('/icon-challenge/verify/guest/', {'count': count})
+        self.assertContains(response, 'Session abgelaufen')
+
+    def test_forwarded_for_ignored_unless_trusted(self):
+        for _ in range(3):
+            self._fail_once(self.client)
+
+        spoofed = Client(HTTP_X_FORWARDED_FOR='203.0.113.9')
+        self.assertContains(self._fail_once(spoofed), 'Zu viele Versuche')
+
+        with override_settings(ICON_CHALLENGE_TRUST_X_FORWARDED_FOR=True):
+            self.assertNotContains(self._fail_once(spoofed), 'Zu viele Versuche')
+
+
+@override_settings(ICON_CHALLENGE_STATELESS=True)
+class StatelessTokenTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+
+    def test_correct_answer(self):
+        token = make_token('guest', 3)
+        self.assertTrue(check_token(token, 'guest', 3))
+
+    def test_wrong_answer(self):
+        token = make_token('guest', 3)
+        self.assertFalse(check_token(token, 'guest', 2))
+
+    def test_token_is_single_use(self):
+        token = make_token('guest', 3)
+        check_token(token, 'guest', 2)
+        with self.assertRaises(TokenReplayed):
+            check_token(token, 'guest', 3)
+
+    def test_token_bound_to_context(self):
+        token = make_token('guest', 3)
+        with self.assertRaises(signing.BadSignature):
+            check_token(token, 'signup', 3)
+
+    def test_anonymous_challenge_does_no_database_io(self):
+        with self.assertNumQueries(0):
+            response = self.client.get('/icon-challenge/start/guest/')
+            token = response.context['challenge_token']
+            response = self.client.post(
+                '/icon-challenge/verify/guest/', {'count': 9, 'token': token}
+            )
+
+        self.assertContains(response, 'Falsch')
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
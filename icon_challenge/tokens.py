@@ -0,0 +1,76 @@
+"""
+Icon-Challenge Tokens
+Signierte, kurzlebige Challenge-Tokens (Stateless-Modus ohne Session)
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+
+TOKEN_SALT = 'icon_challenge.token'
+ANSWER_SALT = 'icon_challenge.answer'
+
+
+class TokenReplayed(signing.BadSignature):
+    """Token wurde bereits benutzt"""
+
+
+def _answer_hash(nonce, count):
+    # Antwort nur als HMAC im Token → nicht aus dem Token ablesbar
+    return salted_hmac(ANSWER_SALT, f'{nonce}:{count}').hexdigest()
+
+
+def _nonce_cache():
+    return caches[getattr(settings, 'ICON_CHALLENGE_NONCE_CACHE', 'default')]
+
+
+def consume_nonce(nonce, timeout):
+    """
+    Nonce als verbraucht markieren (atomar, nur im Cache)
+
+    Returns:
+        bool: False, wenn die Nonce schon verbraucht war
+    """
+    return _nonce_cache().add(f"icon_challenge:nonce:{nonce}", 1, timeout)
+
+
+def make_token(context_type, correct_count):
+    """
+    Erzeuge Token für eine Challenge
+
+    Usage:
+        token = make_token('guest', 3)
+    """
+    nonce = uuid.uuid4().hex
+    return signing.dumps(
+        {'ctx': context_type, 'nonce': nonce, 'answer': _answer_hash(nonce, correct_count)},
+        salt=TOKEN_SALT,
+        compress=True,
+    )
+
+
+def check_token(token, context_type, user_count):
+    """
+    Prüfe Antwort gegen Token (jedes Token nur einmal gültig)
+
+    Returns:
+        bool: Antwort korrekt?
+
+    Raises:
+        signing.BadSignature: Token ungültig, abgelaufen oder schon benutzt
+    """
+    max_age = getattr(settings, 'ICON_CHALLENGE_TOKEN_MAX_AGE', 300)
+    data = signing.loads(token, salt=TOKEN_SALT, max_age=max_age)
+
+    if data.get('ctx') != context_type:
+        raise signing.BadSignature('Token gehört zu anderem Context')
+
+    # One-Time-Use: add() schlägt fehl, wenn die Nonce schon existiert
+    if not consume_nonce(data['nonce'], max_age):
+        raise TokenReplayed('Token wurde bereits benutzt')
+
+    return constant_time_compare(data['answer'], _answer_hash(data['nonce'], int(user_count)))
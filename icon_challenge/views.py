@@ -17,8 +17,7 @@ from .config import CHALLENGE_CONTEXTS
 from django.contrib.auth import get_user_model
 from allauth.account.models import EmailAddress
 
-import requests
-from django.conf import settings
+from core.outbox import enqueue_email
 
 
 # ============================================
@@ -55,6 +54,8 @@ def start_challenge(request, context_type):
     # 5. Template-Context zusammenbauen
     context = {
         "icons": challenge_data["icons"],  # [(name, svg), ...]
+        "grid_html": challenge_data["grid_html"],  # Vorgerendertes Grid
+        "challenge_token": challenge_data.get("token"),  # Nur Stateless-Modus
         "target_icon": challenge_data["target_icon"],  # 'heart'
         "target_svg": challenge_data["target_svg"],  # '<svg>...</svg>'
         "context_type": context_type,  # 'guest'
@@ -326,7 +327,7 @@ def handle_success(request, context_type):
             )
 
     elif context_type == "contact":
-        # CONTACT: Sende Email direkt
+        # CONTACT: Email in die Outbox (Versand asynchron)
 
         # 1. Hole Daten aus Session
         contact_data = request.session.get("contact_data", {})
@@ -379,45 +380,32 @@ Martin Freimuth
 Fullstack Developer
         """
 
-        # 3. Sende Emails via Resend API
-        resend_url = "https://api.resend.com/emails"
-        headers = {
-            "Authorization": f"Bearer {settings.RESEND_API_KEY}",
-            "Content-Type": "application/json",
+        # 3. Emails in die Outbox legen (Versand via send_outbox Worker)
+        payload_to_me = {
+            "from": "Portfolio Contact <noreply@martin-freimuth.dev>",
+            "to": "mat.frei@gmx.de",
+            "subject": f"📬 Kontaktanfrage: {contact_data['subject']}",
+            "reply_to": contact_data["email"],  # User kann dir antworten!
+            "text": email_body_to_you,
+        }
+        # Bestätigung an USER
+        payload_to_user = {
+            "from": "Martin Freimuth <hi@martin-freimuth.dev>",  # ← PERSÖNLICH!
+            "to": contact_data["email"],
+            "subject": "✅ Deine Nachricht wurde empfangen",
+            "reply_to": "hi@martin-freimuth.dev",  # ← User kann dir antworten!
+            "text": confirmation_body,
         }
 
-        try:
-            # Email an DICH
-            payload_to_me = {
-                "from": "Portfolio Contact <noreply@martin-freimuth.dev>",
-                "to": "mat.frei@gmx.de",
-                "subject": f"📬 Kontaktanfrage: {contact_data['subject']}",
-                "reply_to": contact_data["email"],  # User kann dir antworten!
-                "text": email_body_to_you,
-            }
-            resp_me = requests.post(
-                resend_url, headers=headers, json=payload_to_me, timeout=10
-            )
+        # Bestätigung erst, wenn die Mail an mich zugestellt ist
+        enqueue_email(payload_to_me, followup=payload_to_user)
+
+        # Cleanup
+        cleanup_challenge(request, "contact")
+        request.session.pop("contact_data", None)
 
-            if resp_me.ok:
-                # Bestätigung an USER
-                payload_to_user = {
-                    "from": "Martin Freimuth <hi@martin-freimuth.dev>",  # ← PERSÖNLICH!
-                    "to": contact_data["email"],
-                    "subject": "✅ Deine Nachricht wurde empfangen",
-                    "reply_to": "hi@martin-freimuth.dev",  # ← User kann dir antworten!
-                    "text": confirmation_body,
-                }
-                requests.post(
-                    resend_url, headers=headers, json=payload_to_user, timeout=10
-                )
-
-                # Cleanup
-                cleanup_challenge(request, "contact")
-                request.session.pop("contact_data", None)
-
-                return HttpResponse(
-                    f"""
+        return HttpResponse(
+            f"""
     <script>
         // Modal schließen
         document.getElementById('modal-container').innerHTML = '';
@@ -463,24 +451,7 @@ Fullstack Developer
         </div>
     </div>
 """
-                )
-            else:
-                return HttpResponse(
-                    """
-                    <div class='text-red-500 font-bold text-center'>
-                        ❌ Email-Versand fehlgeschlagen. Bitte versuche es später nochmal.
-                    </div>
-                """
-                )
-
-        except Exception as e:
-            return HttpResponse(
-                f"""
-                <div class='text-red-500 font-bold text-center'>
-                    ❌ Verbindungsfehler: {str(e)}
-                </div>
-            """
-            )
+        )
 
     elif context_type == "signup":
         # SIGNUP: Erstelle Account
@@ -1,8 +1,13 @@
 # legal/views.py
 from django.shortcuts import render
 
+from portfolio_site.page_cache import cache_public_page
+
+
+@cache_public_page
 def impressum(request):
     return render(request, 'legal/impressum.html')
 
+@cache_public_page
 def datenschutz(request):
     return render(request, 'legal/datenschutz.html')
\ No newline at end of file
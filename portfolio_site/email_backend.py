@@ -2,49 +2,114 @@
 Custom Email Backend für Resend API
 Nutzt API statt SMTP (schneller & zuverlässiger!)
 """
-import requests
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
 from django.core.mail.backends.base import BaseEmailBackend
 
+from . import resend
+
+
+class ResendBatchError(Exception):
+    """
+    Mindestens eine Email wurde nicht verschickt
+
+    Attributes:
+        sent_count: Anzahl erfolgreich verschickter Emails
+        failures: [(message, Fehlertext), ...]
+    """
+
+    def __init__(self, sent_count, failures):
+        self.sent_count = sent_count
+        self.failures = failures
+        super().__init__(
+            f"Resend: {len(failures)} von {sent_count + len(failures)} Emails fehlgeschlagen"
+        )
+
 
 class ResendAPIBackend(BaseEmailBackend):
     """
     Sendet Emails via Resend API statt SMTP
+
+    Messages werden in Batches (RESEND_BATCH_SIZE, max. 100) aufgeteilt
+    und parallel über einen begrenzten Thread-Pool verschickt
+    (RESEND_BATCH_WORKERS). Fehlgeschlagene Emails stehen nach dem
+    Senden in self.failures.
     """
-    
+
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently, **kwargs)
+        self.batch_size = min(getattr(settings, "RESEND_BATCH_SIZE", 100), 100)
+        self.max_workers = getattr(settings, "RESEND_BATCH_WORKERS", 4)
+        self.failures = []
+
     def send_messages(self, email_messages):
+        self.failures = []
         if not email_messages:
             return 0
-        
+
+        chunks = [
+            list(email_messages[i:i + self.batch_size])
+            for i in range(0, len(email_messages), self.batch_size)
+        ]
+
+        if len(chunks) == 1:
+            results = [self._send_chunk(chunks[0])]
+        else:
+            workers = min(self.max_workers, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._send_chunk, chunks))
+
         sent_count = 0
-        url = "https://api.resend.com/emails"
-        headers = {
-            "Authorization": f"Bearer {settings.RESEND_API_KEY}",
-            "Content-Type": "application/json",
+        for sent, failures in results:
+            sent_count += sent
+            self.failures.extend(failures)
+
+        if self.failures and not self.fail_silently:
+            raise ResendBatchError(sent_count, self.failures)
+
+        return sent_count
+
+
+    def _send_chunk(self, messages):
+        """
+        Sende einen Batch
+
+        Returns:
+            tuple: (sent, [(message, Fehlertext), ...])
+        """
+        payloads = [self._build_payload(message) for message in messages]
+
+        try:
+            if len(payloads) == 1:
+                response = resend.post_email(payloads[0])
+            else:
+                response = resend.post_batch(payloads)
+        except Exception as e:
+            return 0, [(message, str(e)) for message in messages]
+
+        if not response.ok:
+            error = f"Resend API Error: {response.status_code}"
+            return 0, [(message, error) for message in messages]
+
+        if len(payloads) == 1:
+            return 1, []
+
+        # Permissive Mode: nur die Emails mit Index in "errors" sind gescheitert
+        errors = response.json().get("errors") or []
+        failures = [(messages[error["index"]], error.get("message", "")) for error in errors]
+        return len(messages) - len(failures), failures
+
+
+    def _build_payload(self, message):
+        payload = {
+            "from": settings.DEFAULT_FROM_EMAIL,
+            "to": message.to,
+            "subject": message.subject,
+            "text": message.body,
         }
-        
-        for message in email_messages:
-            payload = {
-                "from": settings.DEFAULT_FROM_EMAIL,
-                "to": message.to,
-                "subject": message.subject,
-                "text": message.body,
-            }
-            
-            if message.reply_to:
-                payload["reply_to"] = message.reply_to[0]
-            
-            try:
-                response = requests.post(url, headers=headers, json=payload, timeout=10)
-                
-                if response.ok:
-                    sent_count += 1
-                else:
-                    if not self.fail_silently:
-                        raise Exception(f"Resend API Error: {response.status_code}")
-                    
-            except Exception as e:
-                if not self.fail_silently:
-                    raise
-        
-        return sent_count
\ No newline at end of file
+
+        if message.reply_to:
+            payload["reply_to"] = message.reply_to[0]
+
+        return payload
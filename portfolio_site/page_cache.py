@@ -0,0 +1,119 @@
+"""
+Full-Page-Cache für öffentliche Seiten
+Anonyme Besucher bekommen die fertige Seite aus dem Cache – ohne Template,
+Context-Processors und DB-Queries – inkl. ETag/Last-Modified und 304.
+
+Eingeloggte User und Gäste (Name in der Navi, Gast-Timer) werden nie
+aus dem Cache bedient. Signals (core/signals.py) setzen eine neue
+Version, sobald sich Profile, Project oder PortfolioScreenshot ändern.
+
+Die Version wirkt nur in Prozessen, die PAGE_CACHE_VERSION_CACHE teilen.
+Mit dem LocMem-Default ist das pro Prozess – andere Worker liefern die
+alte Seite bis PAGE_CACHE_TIMEOUT aus, deshalb ist der Timeout kurz.
+"""
+
+import hashlib
+import time
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+VERSION_KEY = "page_cache:version"
+
+
+def _version_cache():
+    return caches[getattr(settings, "PAGE_CACHE_VERSION_CACHE", "default")]
+
+
+def _page_cache():
+    return caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+
+
+def audience(request):
+    """'anon', 'guest' oder 'user' – nur 'anon' wird gecacht"""
+    if not request.user.is_authenticated:
+        return "anon"
+    return "guest" if request.session.get("is_guest") else "user"
+
+
+def current_version():
+    cache = _version_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate():
+    """Alle gecachten Seiten (aller Worker) verwerfen"""
+    _version_cache().set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def _respond(request, entry):
+    response = get_conditional_response(
+        request, etag=entry["etag"], last_modified=entry["last_modified"]
+    )
+    if response is None:
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+
+    response["ETag"] = entry["etag"]
+    response["Last-Modified"] = http_date(entry["last_modified"])
+    response["X-Page-Cache"] = entry["status"]
+    # Browser fragt jedes Mal nach (Login kann sich ändern) → meist 304
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ["Cookie"])
+    return response
+
+
+def cache_public_page(view):
+    """
+    Decorator für öffentliche Views
+
+    Usage:
+        @cache_public_page
+        def impressum(request): ...
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD") or audience(request) != "anon":
+            response = view(request, *args, **kwargs)
+            patch_cache_control(response, private=True)
+            return response
+
+        # CSRF-Cookie pro Besucher setzen – die gecachte Seite selbst
+        # enthält kein Token (siehe request.is_page_cached in base.html)
+        get_token(request)
+
+        cache = _page_cache()
+        key = f"page:{current_version()}:anon:{request.path}"
+        entry = cache.get(key)
+
+        if entry is None:
+            request.is_page_cached = True
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+
+            entry = {
+                "content": response.content,
+                "content_type": response["Content-Type"],
+                "etag": quote_etag(hashlib.md5(response.content).hexdigest()),
+                "last_modified": int(time.time()),
+            }
+            cache.set(key, entry, getattr(settings, "PAGE_CACHE_TIMEOUT", 60))
+            entry = {**entry, "status": "MISS"}
+        else:
+            entry = {**entry, "status": "HIT"}
+
+        return _respond(request, entry)
+
+    return wrapper
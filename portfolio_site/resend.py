@@ -0,0 +1,103 @@
+"""
+Gemeinsamer Resend-Client
+Ein requests.Session pro Prozess (Keep-Alive, Connection-Pool, Retries)
+"""
+
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+_session = None
+_lock = threading.Lock()
+
+
+def build_session():
+    """
+    Neue Session mit Connection-Pool + Retries
+
+    Retries nur bei Verbindungsfehlern und 429 – dann ist die
+    Email garantiert noch nicht verschickt (keine Duplikate).
+    Retry-After wird ignoriert und das Backoff gedeckelt – ein 429 mit
+    langem Retry-After darf den Aufrufer nicht minutenlang blockieren.
+    """
+    retries = getattr(settings, "RESEND_RETRIES", 2)
+    pool_size = getattr(settings, "RESEND_POOL_SIZE", 10)
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=retries,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"POST"}),
+        backoff_factor=0.5,
+        backoff_max=2,
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+def get_session():
+    """Prozessweite Session (lazy, erst nach dem Gunicorn-Fork)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def reset_session():
+    """Session verwerfen (z.B. nach Settings-Änderung in Tests)"""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def _post(url, json, headers=None):
+    return get_session().post(
+        url,
+        json=json,
+        headers={"Authorization": f"Bearer {settings.RESEND_API_KEY}", **(headers or {})},
+        timeout=getattr(settings, "RESEND_TIMEOUT", 10),
+    )
+
+
+def post_email(payload):
+    """
+    Sende eine Email (POST /emails)
+
+    Returns:
+        requests.Response
+    """
+    return _post(settings.RESEND_API_URL, payload)
+
+
+def post_batch(payloads):
+    """
+    Sende mehrere Emails in einem Call (POST /emails/batch, max. 100)
+
+    Permissive Mode: ungültige Emails landen mit Index in "errors",
+    der Rest des Batches wird trotzdem verschickt.
+
+    Returns:
+        requests.Response
+    """
+    return _post(
+        f"{settings.RESEND_API_URL.rstrip('/')}/batch",
+        payloads,
+        headers={"x-batch-validation": "permissive"},
+    )
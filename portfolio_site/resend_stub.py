@@ -0,0 +1,147 @@
+"""
+Lokaler Resend-Stub (HTTP) für Offline-Tests und Benchmarks
+
+Usage:
+    python -m portfolio_site.resend_stub --port 8025 --delay 0.5
+    RESEND_API_URL=http://127.0.0.1:8025/emails python manage.py send_outbox --once
+
+Im Code:
+    with ResendStubServer(delay=0.2) as stub:
+        ... settings.RESEND_API_URL = stub.url ...
+        stub.requests, stub.connections
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _recipients(payload):
+    to = payload.get("to", [])
+    return [to] if isinstance(to, str) else to
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive möglich
+
+    def setup(self):
+        super().setup()
+        # Header + Body gehen als getrennte Writes raus → ohne NODELAY
+        # bremst Nagle/Delayed-ACK jeden Keep-Alive-Request um ~40ms
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"null")
+
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.received.append((self.path, body))
+            status = self.server.status
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        reject = self.server.reject
+        if self.path.endswith("/batch"):
+            # Permissive Mode: abgelehnte Emails als "errors" mit Index
+            errors = [
+                {"index": index, "message": "Empfänger abgelehnt"}
+                for index, item in enumerate(body)
+                if set(_recipients(item)) & reject
+            ]
+            rejected = {error["index"] for error in errors}
+            data = {
+                "data": [{"id": uuid.uuid4().hex} for index in range(len(body)) if index not in rejected],
+                "errors": errors,
+            }
+        elif set(_recipients(body)) & reject:
+            status, data = 422, {"message": "Empfänger abgelehnt"}
+        else:
+            data = {"id": uuid.uuid4().hex}
+
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ResendStubServer:
+    """
+    Fake Resend API: /emails und /emails/batch
+
+    Args:
+        delay: künstliche Antwortzeit in Sekunden
+        status: HTTP-Status der Antworten (z.B. 500 für Fehler-Tests)
+        reject: Empfänger-Adressen, die abgelehnt werden
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0, status=200, reject=()):
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.delay = delay
+        self.server.status = status
+        self.server.reject = set(reject)
+        self.server.requests = 0
+        self.server.connections = 0
+        self.server.received = []
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/emails"
+
+    @property
+    def requests(self):
+        return self.server.requests
+
+    @property
+    def connections(self):
+        return self.server.connections
+
+    @property
+    def received(self):
+        return self.server.received
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lokaler Resend-Stub")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--status", type=int, default=200)
+    args = parser.parse_args()
+
+    stub = ResendStubServer(port=args.port, delay=args.delay, status=args.status)
+    print(f"Resend-Stub läuft auf {stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        stub.server.server_close()
@@ -4,7 +4,7 @@ Django settings for portfolio_site project – FINAL PRODUCTION READY VERSION
 
 from pathlib import Path
 import os
-from decouple import config
+from decouple import Choices, config
 import dj_database_url
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -113,11 +113,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "accounts.middleware.GuestTimerMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
 WHITENOISE_USE_FINDERS = True
 WHITENOISE_MANIFEST_STRICT = False
+# Gehashte Build-Artefakte (z.B. Icon-Sprite) für immer cachen
+WHITENOISE_IMMUTABLE_FILE_TEST = r"\.[0-9a-f]{12}\.svg$"
 
 ROOT_URLCONF = "portfolio_site.urls"
 
@@ -132,7 +135,8 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
-                'accounts.views.guest_timer',
+                "accounts.context_processors.guest_timer",
+                "core.context_processors.profile",
             ],
         },
     },
@@ -149,6 +153,26 @@ DATABASES = {
     )
 }
 
+# ==================== CACHE ====================
+# "shared": Zustand, den alle Worker sehen sollen (Rate-Limits, Token-Nonces,
+# Circuit-Breaker, per Signal invalidierte Seiten-Daten). LocMemCache (ein
+# Prozess) oder FileBasedCache, damit sich mehrere Gunicorn-Worker auf einem
+# Node den Zustand teilen:
+#   SHARED_CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+#   SHARED_CACHE_LOCATION=/tmp/portfolio-shared-cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": config(
+            "SHARED_CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("SHARED_CACHE_LOCATION", default="portfolio-shared"),
+    },
+}
+
 # ==================== PASSWORD VALIDATION ====================
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -220,6 +244,83 @@ ACCOUNT_EMAIL_VERIFICATION = "mandatory"
 SESSION_COOKIE_AGE = 86400
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 
+# Session-Engine: "db" oder "cached_db" (liest aus dem Shared-Cache, schreibt
+# weiter in die DB). cached_db bei mehreren Workern nur mit geteiltem
+# SHARED_CACHE_BACKEND – sonst sieht ein Worker z.B. ein Logout nicht.
+# Kein signed_cookies: signup_data (Passwort) und die Challenge-Antwort
+# liegen in der Session und wären im Cookie lesbar.
+SESSION_STRATEGY = config("SESSION_STRATEGY", default="db", cast=Choices(["db", "cached_db"]))
+SESSION_ENGINE = f"django.contrib.sessions.backends.{SESSION_STRATEGY}"
+SESSION_CACHE_ALIAS = "shared"
+# cleanup_sessions: anonyme Sessions (Spiel, Challenge) nach X Stunden ohne Schreibzugriff löschen
+SESSION_ANONYMOUS_IDLE_HOURS = 2
+
+# ==================== CORE ====================
+# Full-Page-Cache öffentlicher Seiten (nur anonyme Besucher, ETag/304)
+PAGE_CACHE_ALIAS = "default"
+# Signals invalidieren sofort nur Worker, die "shared" teilen (nicht LocMem) –
+# alle anderen liefern höchstens PAGE_CACHE_TIMEOUT lang die alte Seite
+PAGE_CACHE_VERSION_CACHE = "shared"
+PAGE_CACHE_TIMEOUT = 60  # Sekunden
+
+# Versions-Stempel des im Prozess gemerkten Site-Profils
+PROFILE_CACHE = "shared"
+PROFILE_MEMO_SECONDS = 60  # Spätestens dann neu laden (Änderungen anderer Worker)
+
+# Gruppierte Screenshots der About-Portfolio-Seite (Signals leeren den Cache)
+SCREENSHOT_CACHE = "shared"
+SCREENSHOT_CACHE_TIMEOUT = 3600  # Sekunden
+# Versions-Stempel des In-Memory Tag-Index (Updates-Filter)
+TAG_INDEX_CACHE = "shared"
+TAG_INDEX_CHECK_SECONDS = 5  # DB-Signatur prüfen (Änderungen anderer Worker)
+UPDATES_PAGE_SIZE = 10  # Updates pro Seite (Infinite Scroll)
+UPDATE_SEARCH_LIMIT = 20  # Treffer der Volltextsuche
+
+# ==================== ACCOUNTS ====================
+GUEST_SESSION_SECONDS = 120  # Gast-Zugang läuft nach 2 Minuten ab
+
+# Login-Log gepuffert schreiben (bulk_create im Hintergrund statt INSERT pro Login)
+LOGIN_LOG_BUFFER_ENABLED = config("LOGIN_LOG_BUFFER_ENABLED", default=True, cast=bool)
+LOGIN_LOG_BUFFER_SIZE = 100  # Einträge → sofortiger Flush
+LOGIN_LOG_FLUSH_SECONDS = 5.0  # spätestens nach so vielen Sekunden
+# Rohzeilen älter als X Tage löscht rollup_login_logs (nach dem Verdichten)
+LOGIN_LOG_RETENTION_DAYS = config("LOGIN_LOG_RETENTION_DAYS", default=90, cast=int)
+
+# ==================== ICON CHALLENGE ====================
+# Vorgenerierte Challenges pro Context (Refill im Hintergrund)
+ICON_CHALLENGE_POOL_ENABLED = config("ICON_CHALLENGE_POOL_ENABLED", default=True, cast=bool)
+ICON_CHALLENGE_POOL_SIZE = config("ICON_CHALLENGE_POOL_SIZE", default=20, cast=int)
+ICON_CHALLENGE_POOL_LOW_WATER = config("ICON_CHALLENGE_POOL_LOW_WATER", default=5, cast=int)
+ICON_CHALLENGE_POOL_REFILL_PAUSE = 0.002  # Sekunden zwischen zwei Refill-Einträgen
+
+# Fehlversuche pro IP + Context im Cache (keine Session-/DB-Writes)
+ICON_CHALLENGE_RATELIMIT_BACKEND = "icon_challenge.ratelimit.CacheRateLimiter"
+ICON_CHALLENGE_RATELIMIT_CACHE = "shared"
+# Nur hinter einem Proxy, der X-Forwarded-For selbst anhängt (Railway) – sonst REMOTE_ADDR
+ICON_CHALLENGE_TRUST_X_FORWARDED_FOR = config("ICON_CHALLENGE_TRUST_X_FORWARDED_FOR", default=False, cast=bool)
+
+# Stateless-Modus: Antwort als signiertes Token im Modal statt in der Session
+ICON_CHALLENGE_STATELESS = config("ICON_CHALLENGE_STATELESS", default=False, cast=bool)
+ICON_CHALLENGE_TOKEN_MAX_AGE = 300  # Sekunden
+ICON_CHALLENGE_NONCE_CACHE = "shared"  # One-Time-Use der Tokens
+
+# ==================== RPS APP ====================
+# Spielstand: "session" oder "cookie" (signiert – Spielzüge schreiben keine Session)
+RPS_SCORE_STORAGE = config("RPS_SCORE_STORAGE", default="session", cast=Choices(["session", "cookie"]))
+
+# ==================== BMI APP ====================
+# Gemini-Tipps pro Alters-/BMI-Band cachen (LRU + TTL, pro Prozess)
+BMI_TIPS_CACHE_SIZE = 256
+BMI_TIPS_CACHE_TTL = 24 * 3600  # Sekunden
+GEMINI_API_BASE = config("GEMINI_API_BASE", default="https://generativelanguage.googleapis.com/v1beta")
+GEMINI_TIMEOUT = 8  # Read-Timeout in Sekunden
+# Circuit Breaker: nach N Fehlern/langsamen Calls → Fallback-Tipps
+GEMINI_BREAKER_FAILURES = 5
+GEMINI_BREAKER_RECOVERY = 30  # Sekunden bis zum Probe-Call
+GEMINI_SLOW_CALL_SECONDS = 5
+GEMINI_BREAKER_CACHE = "shared"
+BMI_BATCH_CHUNK_ROWS = 5000  # Zeilen pro NumPy-Block beim CSV-Upload
+
 # ==================== E-MAIL (RESEND API) ====================
 if DEBUG:
     EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
@@ -229,4 +330,16 @@ else:
 
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="noreply@martin-freimuth.dev")
 SERVER_EMAIL = DEFAULT_FROM_EMAIL
-RESEND_API_KEY = config("RESEND_API_KEY")
\ No newline at end of file
+RESEND_API_KEY = config("RESEND_API_KEY")
+RESEND_API_URL = config("RESEND_API_URL", default="https://api.resend.com/emails")
+
+# Gemeinsamer Resend-Client (portfolio_site/resend.py)
+RESEND_POOL_SIZE = config("RESEND_POOL_SIZE", default=10, cast=int)
+RESEND_TIMEOUT = config("RESEND_TIMEOUT", default=10, cast=float)
+RESEND_RETRIES = config("RESEND_RETRIES", default=2, cast=int)
+RESEND_BATCH_SIZE = 100  # Max. Emails pro Batch-Call (Resend-Limit: 100)
+RESEND_BATCH_WORKERS = 4  # Parallele Batch-Calls im Email-Backend
+
+# Outbox-Worker (python manage.py send_outbox)
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_BACKOFF_SECONDS = 30
\ No newline at end of file
@@ -1,10 +1,12 @@
 # projects/views.py ← DIE PERFEKTE ENDVERSION
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from portfolio_site.page_cache import cache_public_page
 from .models import Project
 
 
 # 1. Öffentliche Projektliste – eingeloggte User sehen ALLES
+@cache_public_page
 def public_list(request):
     if request.user.is_authenticated:
         projects = Project.objects.all()
@@ -0,0 +1,80 @@
+"""
+Lasttest: RPS-Spielschleife (POST /rps/game/) je Session-Strategie
+
+db / cached_db als Session-Engine, jeweils mit Spielstand in der
+Session oder im signierten Cookie (RPS_SCORE_STORAGE). Geschriebene
+Sessions werden danach zurückgerollt.
+
+Usage:
+    python manage.py bench_rps_sessions --requests 2000
+"""
+
+import json
+import random
+import time
+
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+
+
+VARIANTS = [
+    ("db", "session"),
+    ("cached_db", "session"),
+    ("db", "cookie"),
+    ("cached_db", "cookie"),
+]
+
+
+class Command(BaseCommand):
+    help = "Misst Requests/Sekunde der RPS-Spielzüge je Session-Engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--players", type=int, default=20)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{options['requests']} Spielzüge, {options['players']} Spieler")
+
+        results = {}
+        with transaction.atomic():
+            for engine, storage in VARIANTS:
+                caches["shared"].clear()
+                with override_settings(
+                    SESSION_ENGINE=f"django.contrib.sessions.backends.{engine}",
+                    RPS_SCORE_STORAGE=storage,
+                ):
+                    sessions_before = Session.objects.count()
+                    rps = self._run(options["requests"], options["players"])
+                    written = Session.objects.count() - sessions_before
+
+                results[engine, storage] = rps
+                self.stdout.write(
+                    f"  {engine:<10} Spielstand: {storage:<8} {rps:8.0f} req/s"
+                    f"  ({written} Sessions in der DB)"
+                )
+
+            transaction.set_rollback(True)
+
+        baseline = results["db", "session"]
+        best = max(results, key=results.get)
+        self.stdout.write(self.style.SUCCESS(
+            f"Faktor {best[0]} + {best[1]} gegenüber db + session: {results[best] / baseline:.1f}x"
+        ))
+
+    def _run(self, count, players):
+        rng = random.Random(42)
+        clients = [Client(HTTP_HOST="localhost") for _ in range(players)]
+        moves = [json.dumps({"userChoice": choice}) for choice in ("rock", "paper", "scissors")]
+
+        for client in clients:  # Warmup: Session/Cookie anlegen
+            response = client.post("/rps/game/", moves[0], content_type="application/json")
+            if response.status_code != 200:
+                raise SystemExit(f"/rps/game/ → {response.status_code}")
+
+        start = time.perf_counter()
+        for i in range(count):
+            clients[i % players].post("/rps/game/", rng.choice(moves), content_type="application/json")
+        return count / (time.perf_counter() - start)
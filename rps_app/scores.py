@@ -0,0 +1,52 @@
+"""
+Spielstand Stein-Papier-Schere
+In der Session (Default) oder – RPS_SCORE_STORAGE = "cookie" – als
+signiertes Cookie. Dann schreibt ein Spielzug gar keine Session mehr.
+"""
+
+from django.conf import settings
+from django.core import signing
+
+
+COOKIE_NAME = "rps_score"
+COOKIE_SALT = "rps_app.score"
+FIELDS = ("user_score", "computer_score", "draw_score")
+
+
+def _use_cookie():
+    return getattr(settings, "RPS_SCORE_STORAGE", "session") == "cookie"
+
+
+def empty_scores():
+    return dict.fromkeys(FIELDS, 0)
+
+
+def load_scores(request):
+    """
+    Returns:
+        dict: {'user_score': 3, 'computer_score': 1, 'draw_score': 0}
+    """
+    if not _use_cookie():
+        return {field: request.session.get(field, 0) for field in FIELDS}
+
+    try:
+        value = request.get_signed_cookie(COOKIE_NAME, salt=COOKIE_SALT)
+        return dict(zip(FIELDS, map(int, value.split(":"))))
+    except (KeyError, signing.BadSignature, ValueError):
+        return empty_scores()
+
+
+def save_scores(request, response, scores):
+    if not _use_cookie():
+        request.session.update(scores)
+        return
+
+    response.set_signed_cookie(
+        COOKIE_NAME,
+        ":".join(str(scores[field]) for field in FIELDS),
+        salt=COOKIE_SALT,
+        max_age=settings.SESSION_COOKIE_AGE,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite="Lax",
+    )
@@ -1,3 +1,46 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
+from django.contrib.sessions.models import Session
+from django.test import TestCase, override_settings
+
+
+class RpsScoreStorageTests(TestCase):
+    def play(self, choice='rock'):
+        return self.client.post('/rps/game/', json.dumps({'userChoice': choice}), content_type='application/json')
+
+    def total(self, data):
+        return data['user'] + data['draw'] + data['computer']
+
+    def test_session_storage_counts_moves(self):
+        self.play()
+        data = self.play().json()
+
+        self.assertEqual(self.total(data), 2)
+        self.assertEqual(self.total({
+            'user': self.client.session['user_score'],
+            'draw': self.client.session['draw_score'],
+            'computer': self.client.session['computer_score'],
+        }), 2)
+
+    @override_settings(RPS_SCORE_STORAGE='cookie')
+    def test_cookie_storage_writes_no_session(self):
+        self.play()
+        data = self.play().json()
+
+        self.assertEqual(self.total(data), 2)
+        self.assertEqual(Session.objects.count(), 0)
+        self.assertIn('rps_score', self.client.cookies)
+
+    @override_settings(RPS_SCORE_STORAGE='cookie')
+    def test_tampered_cookie_resets_score(self):
+        self.play()
+        self.client.cookies['rps_score'] = '99:0:0'
+
+        self.assertEqual(self.total(self.play().json()), 1)
+
+    @override_settings(RPS_SCORE_STORAGE='cookie')
+    def test_reset(self):
+        self.play()
+        self.client.post('/rps/reset/')
+
+        self.assertEqual(self.total(self.play().json()), 1)
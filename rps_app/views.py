@@ -4,6 +4,8 @@ import random
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 
+from .scores import empty_scores, load_scores, save_scores
+
 # Kein globaler Context mehr!
 
 def main(request):
@@ -17,11 +19,8 @@ def main(request):
 
 # @require_http_methods(["POST"])
 def game(request):
-    # Session initialisieren
-    if 'user_score' not in request.session:
-        request.session['user_score'] = 0
-        request.session['computer_score'] = 0
-        request.session['draw_score'] = 0          # ← NEU
+    # Spielstand aus Session oder signiertem Cookie (siehe scores.py)
+    scores = load_scores(request)
 
     try:
         data = json.loads(request.body)
@@ -35,37 +34,35 @@ def game(request):
         
         if user == computer_choice:
             result = 'Unentschieden!'
-            request.session['draw_score'] += 1                    # ← NEU: +1 bei Draw
+            scores['draw_score'] += 1                    # ← NEU: +1 bei Draw
         elif (user == 'rock' and computer_choice == 'scissors') or \
              (user == 'paper' and computer_choice == 'rock') or \
              (user == 'scissors' and computer_choice == 'paper'):
             result = 'Du gewinnst!'
-            request.session['user_score'] += 1
+            scores['user_score'] += 1
         else:
             result = 'Computer gewinnt!'
-            request.session['computer_score'] += 1
-        
-        request.session.modified = True
+            scores['computer_score'] += 1
         
-        return JsonResponse({
+        response = JsonResponse({
             'result': result,
-            'user': request.session['user_score'],
-            'draw': request.session['draw_score'],        # ← NEU: zurückgeben
-            'computer': request.session['computer_score'],
+            'user': scores['user_score'],
+            'draw': scores['draw_score'],        # ← NEU: zurückgeben
+            'computer': scores['computer_score'],
             'computerChoice': computer_choice.capitalize()
         })
+        save_scores(request, response, scores)
+        return response
     
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
 def resetGame(request):
-    request.session['user_score'] = 0
-    request.session['computer_score'] = 0
-    request.session['draw_score'] = 0           # ← NEU: auch Draw zurücksetzen
-    request.session.modified = True
-    return JsonResponse({
+    response = JsonResponse({
         'user': 0,
         'draw': 0,                              # ← NEU
         'computer': 0,
-    })
\ No newline at end of file
+    })
+    save_scores(request, response, empty_scores())
+    return response